@@ -0,0 +1,112 @@
+"""
+Contact Extraction Benchmark
+Compares contacts.extract_contacts with the original extract_contact_info
+on a corpus of long job descriptions
+
+Run: python -m benchmarks.bench_contacts [--docs 2000] [--words 800]
+"""
+
+import argparse
+import random
+import re
+import time
+
+from contacts import extract_contacts
+
+COMPANIES = ['PhonePe', 'Swiggy', 'Razorpay', 'Dr. Reddy & Co', 'Tata Consultancy Services', 'Zoho Corp']
+FILLER = ('design build maintain automation framework selenium java python api testing ci/cd '
+          'pipelines collaborate with developers product managers scrum ceremonies quality '
+          'releases regression performance load testing kubernetes docker cloud').split()
+CONTACTS = ['hr@example.com', 'careers@swiggy.in', '+91-9876543210', '080-12345678',
+            '987.654.3210', '98765 43210', 'talent.acquisition@razorpay.com']
+
+
+def legacy_extract_contact_info(job_description, apply_link, company_name):
+    """The implementation contacts.py replaced (kept here only as the baseline)"""
+    contact_info = ""
+
+    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+    emails = re.findall(email_pattern, job_description)
+
+    phone_patterns = [
+        r'\b\d{10}\b',
+        r'\+91[-.\s]?\d{10}',
+        r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}',
+    ]
+
+    phone_numbers = []
+    for pattern in phone_patterns:
+        phone_numbers.extend(re.findall(pattern, job_description))
+
+    if emails:
+        contact_info = f"Email: {emails[0]}"
+    if phone_numbers:
+        if contact_info:
+            contact_info += f" | Phone: {phone_numbers[0]}"
+        else:
+            contact_info = f"Phone: {phone_numbers[0]}"
+
+    company_slug = company_name.lower().replace(' ', '-').replace('&', 'and').replace('.', '-')
+    linkedin_url = f"https://www.linkedin.com/company/{company_slug}"
+
+    if contact_info:
+        contact_info = f"{linkedin_url} | {contact_info}"
+    else:
+        company_domain = company_name.lower().replace(' ', '').replace('.', '')
+        likely_email = f"hr@{company_domain}.com"
+        contact_info = f"{linkedin_url} | Likely Email: {likely_email}"
+
+    return contact_info if contact_info else "LinkedIn: " + linkedin_url
+
+
+def build_corpus(docs, words, seed=42):
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(docs):
+        text = rng.choices(FILLER, k=words)
+        # Roughly half the descriptions carry a contact somewhere near the end
+        if rng.random() < 0.5:
+            text.insert(rng.randrange(words // 2, words), rng.choice(CONTACTS))
+        corpus.append((' '.join(text), rng.choice(COMPANIES)))
+    return corpus
+
+
+def time_it(func, corpus, repeat=3):
+    """Best of `repeat` runs, seconds per description"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text, company in corpus:
+            func(text, company)
+        best = min(best, time.perf_counter() - start)
+    return best / len(corpus)
+
+
+def run(docs=2000, words=800):
+    corpus = build_corpus(docs, words)
+    legacy = time_it(lambda text, company: legacy_extract_contact_info(text, '', company), corpus)
+    current = time_it(extract_contacts, corpus)
+    return {
+        'docs': docs,
+        'words_per_doc': words,
+        'legacy_us_per_doc': round(legacy * 1e6, 2),
+        'contacts_us_per_doc': round(current * 1e6, 2),
+        'speedup': round(legacy / current, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark contact extraction")
+    parser.add_argument('--docs', type=int, default=2000)
+    parser.add_argument('--words', type=int, default=800)
+    args = parser.parse_args()
+
+    result = run(args.docs, args.words)
+    print(f"Corpus: {result['docs']} descriptions x {result['words_per_doc']} words")
+    print(f"  legacy extract_contact_info : {result['legacy_us_per_doc']:>8} µs/doc")
+    print(f"  contacts.extract_contacts   : {result['contacts_us_per_doc']:>8} µs/doc")
+    print(f"  speedup                     : {result['speedup']}x")
+
+
+if __name__ == "__main__":
+    main()
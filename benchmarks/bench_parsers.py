@@ -0,0 +1,81 @@
+"""
+HTML Parser Benchmark
+Parse time per Indeed search page for every installed backend,
+against the original full-tree BeautifulSoup(html, 'html.parser') approach
+
+Run: python -m benchmarks.bench_parsers [--html captured_page.html] [--pages 20]
+"""
+
+import argparse
+import time
+
+from parsers import PARSERS, available_backends
+
+CARD = '''
+<div class="cardOutline tapItem"><div class="job_seen_beacon">
+  <table><tr><td class="resultContent">
+    <h2 class="jobTitle css-1psdjh5"><a href="/rc/clk?jk={n:016x}" data-jk="{n:016x}"><span title="SDET {n}">SDET {n}</span></a></h2>
+    <div class="company_location"><span class="companyName">Company {n}</span>
+    <div class="companyLocation">Bangalore, Karnataka</div></div>
+  </td></tr></table>
+  <div class="job-snippet"><ul><li>Build automation frameworks with Selenium, Java and REST APIs.</li>
+  <li>Contact hr{n}@company{n}.com for details.</li></ul></div>
+</div></div>
+'''
+
+# Search pages are mostly navigation, scripts and filters around ~15 cards
+FILLER = '<div class="nav"><ul>' + ''.join(
+    f'<li class="item"><a href="/q-{i}">Filter option {i}</a><span data-x="{i}">{i}</span></li>' for i in range(400)
+) + '</ul></div><script>' + 'var x = 1;' * 2000 + '</script>'
+
+
+def synthetic_page(cards=15):
+    body = ''.join(CARD.format(n=n) for n in range(cards))
+    return f'<html><head><title>Jobs</title></head><body>{FILLER}{body}{FILLER}</body></html>'
+
+
+def parse_full_tree(html, limit=10):
+    """The original approach: whole-page html.parser tree, then find_all"""
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html, 'html.parser')
+    return soup.find_all('div', {'class': 'job_seen_beacon'})[:limit]
+
+
+def time_backend(func, html, pages):
+    best = float('inf')
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(pages):
+            func(html)
+        best = min(best, time.perf_counter() - start)
+    return best / pages
+
+
+def run(html=None, pages=20):
+    html = html or synthetic_page()
+    results = {'page_bytes': len(html.encode('utf-8')), 'ms_per_page': {}}
+    results['ms_per_page']['bs4-full-tree (original)'] = round(time_backend(parse_full_tree, html, pages) * 1000, 3)
+    for name in available_backends():
+        results['ms_per_page'][name] = round(time_backend(PARSERS[name], html, pages) * 1000, 3)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Indeed page parsing backends")
+    parser.add_argument('--html', help="Captured search page to parse (default: synthetic page)")
+    parser.add_argument('--pages', type=int, default=20)
+    args = parser.parse_args()
+
+    html = None
+    if args.html:
+        with open(args.html, encoding='utf-8') as f:
+            html = f.read()
+
+    results = run(html, args.pages)
+    print(f"Page size: {results['page_bytes'] / 1024:.0f} KB")
+    for name, ms in results['ms_per_page'].items():
+        print(f"  {name:<28} {ms:>9.3f} ms/page")
+
+
+if __name__ == "__main__":
+    main()
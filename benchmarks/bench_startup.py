@@ -0,0 +1,81 @@
+"""
+Startup Benchmark
+Cold-start cost of the CLI entry points
+- import: cumulative `python -X importtime` time of each module, plus its
+  slowest direct imports
+- wall: best-of-N wall time of a real invocation, next to a bare
+  `python -c pass` (interpreter + site-packages start-up, the floor)
+
+Run: python -m benchmarks.bench_startup [--runs 5] [--top 5]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULES = ['view_jobs', 'scrape_jobs']
+COMMANDS = {
+    'python -c pass': ['-c', 'pass'],
+    'view_jobs.py --limit 5': ['view_jobs.py', '--limit', '5'],
+    'scrape_jobs.py --help': ['scrape_jobs.py', '--help'],
+}
+
+
+def import_times(module, top=5):
+    """{'total_ms', 'slowest': [(module, cumulative ms)]} from -X importtime"""
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                          cwd=ROOT, capture_output=True, text=True, check=True)
+    entries = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        entries.append((name.strip(), depth, int(cumulative) / 1000))
+    # Children are printed before their parent: the module's direct imports are
+    # the depth-1 lines between the previous top-level line and its own
+    deps, total = [], None
+    for name, depth, ms in entries:
+        if depth == 0:
+            if name == module:
+                total = ms
+                break
+            deps = []
+        elif depth == 1:
+            deps.append((name, ms))
+    deps.sort(key=lambda e: -e[1])
+    return {'total_ms': round(total, 1), 'slowest': [(name, round(ms, 1)) for name, ms in deps[:top]]}
+
+
+def wall_time(args, runs=5):
+    best = float('inf')
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable] + args, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        best = min(best, time.perf_counter() - start)
+    return round(best * 1000, 1)
+
+
+def run(runs=5, top=5):
+    return {
+        'python': sys.version.split()[0],
+        'import': {module: import_times(module, top) for module in MODULES},
+        'wall_ms': {name: wall_time(args, runs) for name, args in COMMANDS.items()},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure CLI start-up (import time and wall time)")
+    parser.add_argument('--runs', type=int, default=5, help="Wall-time runs per command (best is kept)")
+    parser.add_argument('--top', type=int, default=5, help="Slowest imports to list per module")
+    args = parser.parse_args()
+    print(json.dumps(run(args.runs, args.top), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+"""
+Benchmark Suite
+Per-stage and end-to-end timings on recorded Indeed search pages
+(benchmarks/fixtures/) with an in-memory fake Google Sheet
+- parse: ms per search page (auto backend)
+- skills / contacts: µs per description
+- dedup: µs per job into an empty store, then again when every job is a duplicate
+- end_to_end: EnhancedJobScraper.run() streaming N jobs into store + sheet,
+  with the run's per-stage totals from metrics.py
+Results are printed (or written) as JSON so runs can be diffed
+
+Run: python -m benchmarks.bench_suite [--sizes 10,100,1000,10000,100000] [--out results.json]
+"""
+
+import argparse
+import contextlib
+import glob
+import io
+import json
+import os
+import platform
+import random
+import re
+import sys
+import tempfile
+import time
+
+from contacts import extract_contacts
+from indeed import parse_indeed_page
+from job_posting import JobPosting
+from metrics import METRICS
+from parsers import available_backends
+from skills import extract_skills
+from sources import JobSource
+
+from tests import fake_sheets
+from tests.helpers import make_scraper
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+DEFAULT_SIZES = [10, 100, 1000, 10000]
+WORD_RE = re.compile(r"[A-Za-z][A-Za-z+#./-]+")
+
+
+def load_fixtures():
+    pages = []
+    for path in sorted(glob.glob(os.path.join(FIXTURE_DIR, '*.html'))):
+        with open(path, encoding='utf-8') as f:
+            pages.append(f.read())
+    return pages
+
+
+def make_jobs(pages, n, seed=42):
+    """n distinct postings built from the fixture cards (reshuffled descriptions)"""
+    cards = [job for html in pages for job in parse_indeed_page(html)]
+    vocab = sorted({w for job in cards for w in WORD_RE.findall(job.description)})
+    rng = random.Random(seed)
+    jobs = []
+    for i in range(n):
+        card = cards[i % len(cards)]
+        description = ' '.join(rng.choices(vocab, k=60))
+        if i % 7 == 0:
+            description += f' Apply at talent{i}@{card.company.split()[0].lower()}.com or +91 98{i:08d}'
+        jobs.append(JobPosting(
+            company=f'{card.company} {i % 250}',
+            role=f'{card.role} {i}',
+            description=description,
+            skills=extract_skills(description),
+            location=card.location,
+            apply_link=f'https://in.indeed.com/rc/clk?jk={i:016x}',
+            platform='Indeed India',
+            hr_contact=extract_contacts(description, card.company),
+        ))
+    return jobs
+
+
+def best_of(func, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_parse(pages, rounds=10):
+    seconds = best_of(lambda: [parse_indeed_page(html) for _ in range(rounds) for html in pages])
+    return {'backend': available_backends()[0], 'pages': len(pages) * rounds,
+            'ms_per_page': round(seconds / (len(pages) * rounds) * 1000, 3)}
+
+
+def bench_text(jobs):
+    docs = [(job.description, job.company) for job in jobs]
+    skills = best_of(lambda: [extract_skills(desc) for desc, _ in docs])
+    contacts = best_of(lambda: [extract_contacts(desc, company) for desc, company in docs])
+    return {'skills_us_per_doc': round(skills / len(docs) * 1e6, 2),
+            'contacts_us_per_doc': round(contacts / len(docs) * 1e6, 2)}
+
+
+def bench_dedup(jobs, workdir):
+    scraper = make_scraper(workdir)
+    scraper.sync_stats = {'duplicates': 0, 'near_duplicates': 0}
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        for _ in scraper.dedup_jobs(jobs):
+            pass
+        scraper.store.commit()
+        scraper.near_dup.commit()
+        insert = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in scraper.dedup_jobs(jobs):
+            pass
+        lookup = time.perf_counter() - start
+    return {'insert_us_per_job': round(insert / len(jobs) * 1e6, 2),
+            'duplicate_us_per_job': round(lookup / len(jobs) * 1e6, 2),
+            'stored': scraper.store.count()}
+
+
+class FixtureSource(JobSource):
+    """Emits a prepared list of postings"""
+    name = 'fixture'
+    timeout = 3600
+
+    def __init__(self, scraper, jobs):
+        super().__init__(scraper, max_jobs=len(jobs))
+        self.jobs = jobs
+
+    def fetch(self, emit):
+        for job in self.jobs:
+            if emit(job) is False:
+                return
+
+
+def bench_end_to_end(jobs, workdir, latency=0.0, real_quota=False):
+    client = fake_sheets.FakeClient(fake_sheets.FakeSpreadsheet(latency=latency))
+    scraper = make_scraper(workdir)
+    fake_sheets.install(scraper, client)
+    if not real_quota:
+        # The fake has no quota - measure the scraper, not the Sheets token bucket
+        scraper.limiter.limits['sheets'] = (1e9, 1e9)
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        scraper.run(sources=[FixtureSource(scraper, jobs)], max_new=None)
+        seconds = time.perf_counter() - start
+    sheet = client.spreadsheet
+    return {'seconds': round(seconds, 3),
+            'jobs_per_second': round(len(jobs) / seconds, 1),
+            'stored': scraper.store.count(),
+            'sheet_calls': dict(sheet.calls),
+            'cells_written': sheet.stats['cells_written'],
+            'cells_read': sheet.stats['cells_read'],
+            'stages': {name: stage['total_s'] for name, stage in METRICS.report()['stages'].items()}}
+
+
+def run(sizes=DEFAULT_SIZES, latency=0.0, real_quota=False):
+    pages = load_fixtures()
+    results = {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'fixtures': len(pages),
+            'sheet_latency_ms': latency * 1000,
+            'sheets_rate_limited': real_quota,
+        },
+        'parse': bench_parse(pages),
+        'sizes': {},
+    }
+    for n in sizes:
+        jobs = make_jobs(pages, n)
+        entry = bench_text(jobs)
+        with tempfile.TemporaryDirectory() as workdir:
+            entry['dedup'] = bench_dedup(jobs, workdir)
+        # Fresh copies for the end-to-end run (it normalizes postings in place)
+        jobs = make_jobs(pages, n)
+        with tempfile.TemporaryDirectory() as workdir:
+            entry['end_to_end'] = bench_end_to_end(jobs, workdir, latency, real_quota)
+        results['sizes'][str(n)] = entry
+        print(f"  {n:>7} jobs: end-to-end {entry['end_to_end']['seconds']}s", file=sys.stderr)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark scraper stages and end-to-end runs")
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+                        help="Comma-separated job counts (e.g. 10,100,1000,10000,100000)")
+    parser.add_argument('--sheet-latency', type=float, default=0.0,
+                        help="Simulated ms per Sheets API call")
+    parser.add_argument('--real-quota', action='store_true',
+                        help="Keep the production Sheets rate limit (1 call/s) in end-to-end runs")
+    parser.add_argument('--out', help="Write JSON results here instead of stdout")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(',') if s.strip()]
+    results = run(sizes, args.sheet_latency / 1000, args.real_quota)
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.out}", file=sys.stderr)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
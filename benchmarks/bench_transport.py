@@ -0,0 +1,121 @@
+"""
+Transport Benchmark
+Connections opened and wall time for N concurrent page fetches against a
+local keep-alive HTTP server, per client setup:
+- no_reuse: a new connection per request (plain requests.get)
+- default_session: requests.Session() with its stock adapter (10 connections
+  per host, extras opened and thrown away when the pool is full)
+- transport: transport.create_session() (pool sized to the concurrency, blocking)
+The server sleeps --handshake-ms on every new connection to stand in for a
+TLS handshake (no certificates needed), so handshake overhead shows up as
+connections x handshake time.
+
+Run: python -m benchmarks.bench_transport [--requests 300] [--concurrency 16] [--handshake-ms 40]
+"""
+
+import argparse
+import gzip
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from fetch_engine import AsyncFetchEngine
+from transport import create_session, connection_stats
+
+FIXTURE = os.path.join(os.path.dirname(__file__), 'fixtures', 'indeed_search_page1.html')
+
+
+class PageServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, body, handshake):
+        super().__init__(('127.0.0.1', 0), PageHandler)
+        self.body = body
+        self.gzipped = gzip.compress(body)
+        self.handshake = handshake
+        self.connections = 0
+        self.lock = threading.Lock()
+
+
+class PageHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'   # keep-alive
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+        time.sleep(self.server.handshake)
+
+    def do_GET(self):
+        gzipped = 'gzip' in self.headers.get('Accept-Encoding', '')
+        body = self.server.gzipped if gzipped else self.server.body
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        if gzipped:
+            self.send_header('Content-Encoding', 'gzip')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class NoReuse:
+    """Session stand-in that opens a fresh connection for every request"""
+
+    def get(self, url, **kwargs):
+        return requests.get(url, **kwargs)
+
+
+def bench(name, session, server, urls, concurrency):
+    server.connections = 0
+    fetcher = AsyncFetchEngine(session, concurrency=concurrency, per_host=concurrency)
+    start = time.perf_counter()
+    results = fetcher.fetch(urls)
+    seconds = time.perf_counter() - start
+    ok = sum(1 for _, resp in results if resp is not None and resp.status_code == 200)
+    return {'client': name, 'ok': ok, 'seconds': round(seconds, 3),
+            'ms_per_request': round(seconds / len(urls) * 1000, 2),
+            'connections': server.connections,
+            'handshake_s': round(server.connections * server.handshake, 3)}
+
+
+def run(n_requests=300, concurrency=16, handshake=0.04):
+    with open(FIXTURE, 'rb') as f:
+        body = f.read()
+    server = PageServer(body, handshake)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    urls = [f'http://localhost:{server.server_port}/jobs?start={i}' for i in range(n_requests)]
+
+    transport = create_session(cache_path=None, pool_size=concurrency)
+    results = [
+        bench('no_reuse', NoReuse(), server, urls, concurrency),
+        bench('default_session', requests.Session(), server, urls, concurrency),
+        bench('transport', transport, server, urls, concurrency),
+    ]
+    results[-1]['pool'] = connection_stats(transport)
+    server.shutdown()
+    return {'requests': n_requests, 'concurrency': concurrency,
+            'handshake_ms': handshake * 1000, 'page_bytes': len(body),
+            'gzip_bytes': len(server.gzipped), 'results': results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark connection reuse in the HTTP transport")
+    parser.add_argument('--requests', type=int, default=300)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--handshake-ms', type=float, default=40.0,
+                        help="Simulated handshake time per new connection")
+    args = parser.parse_args()
+
+    results = run(args.requests, args.concurrency, args.handshake_ms / 1000)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Contact Extraction
+Emails and phone numbers pulled from a job description in one regex pass
+- All patterns compiled once into a single alternation
+- Phones normalized to E.164 (Indian numbers assumed when no country code)
+- Company -> LinkedIn slug / guessed domain derivations are memoized
+"""
+
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+DEFAULT_COUNTRY_CODE = '91'
+
+# One alternation, only tried where a token starts (the shared lookbehind lets
+# the scan skip mid-word positions); the local part can't contain '@', so a
+# failed email only backs off over its own token
+CONTACT_RE = re.compile(r'''
+    (?<![\w.%+-])
+    (?:
+        (?P<phone>
+            \+91[-.\s]?\d{5}[-.\s]?\d{5}\b          # +91 98765 43210 / +91-9876543210
+          | 0\d{2,4}[-.\s]?\d{6,8}\b                # 080-12345678 (landline with STD code)
+          | \d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b         # 987-654-3210 / 9876543210
+        )
+      | (?P<email>[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b)
+    )
+''', re.VERBOSE)
+
+_NON_DIGIT_RE = re.compile(r'\D')
+_SLUG_TABLE = str.maketrans({' ': '-', '&': 'and', '.': '-'})
+_DOMAIN_TABLE = str.maketrans({' ': None, '.': None})
+
+
+@lru_cache(maxsize=4096)
+def company_slug(company_name):
+    return company_name.lower().translate(_SLUG_TABLE)
+
+
+@lru_cache(maxsize=4096)
+def company_domain(company_name):
+    return company_name.lower().translate(_DOMAIN_TABLE) + '.com'
+
+
+def to_e164(raw, country_code=DEFAULT_COUNTRY_CODE):
+    """'+91-98765 43210' / '080-12345678' / '9876543210' -> '+919876543210'; None if implausible"""
+    digits = _NON_DIGIT_RE.sub('', raw)
+    if raw.startswith('+'):
+        return f'+{digits}' if 8 <= len(digits) <= 15 else None
+    if digits.startswith('0'):
+        digits = digits[1:]
+    if len(digits) == 10:
+        return f'+{country_code}{digits}'
+    return None
+
+
+@dataclass
+class ContactInfo:
+    linkedin: str
+    emails: list = field(default_factory=list)
+    phones: list = field(default_factory=list)   # E.164
+    likely_email: str = ''
+
+    def to_dict(self):
+        return {
+            'linkedin': self.linkedin,
+            'emails': list(self.emails),
+            'phones': list(self.phones),
+            'likely_email': self.likely_email,
+        }
+
+    def __str__(self):
+        """Sheet format: 'linkedin | Email: x | Phone: y' or 'linkedin | Likely Email: hr@x.com'"""
+        parts = [self.linkedin]
+        if self.emails:
+            parts.append(f"Email: {self.emails[0]}")
+        if self.phones:
+            parts.append(f"Phone: {self.phones[0]}")
+        if len(parts) == 1 and self.likely_email:
+            parts.append(f"Likely Email: {self.likely_email}")
+        return ' | '.join(parts)
+
+
+def extract_contacts(job_description, company_name):
+    """Single pass over the description, returns a ContactInfo"""
+    emails = []
+    phones = []
+    for m in CONTACT_RE.finditer(job_description or ''):
+        if m.lastgroup == 'email':
+            if m.group('email') not in emails:
+                emails.append(m.group('email'))
+        else:
+            phone = to_e164(m.group('phone'))
+            if phone and phone not in phones:
+                phones.append(phone)
+
+    info = ContactInfo(linkedin=f"https://www.linkedin.com/company/{company_slug(company_name)}",
+                       emails=emails, phones=phones)
+    if not emails and not phones:
+        info.likely_email = f"hr@{company_domain(company_name)}"
+    return info
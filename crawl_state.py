@@ -0,0 +1,77 @@
+"""
+Crawl State
+Per-query high-water marks for incremental crawling
+- Remembers the newest job keys seen for each search query (never emitted twice)
+- Paging stops as soon as a page reaches the query's mark: the newest keys
+  of the last crawl that got all the way down to the mark before it (or to
+  max pages), so steady-state runs only fetch the delta
+- A crawl cut short (job budget, timeout, failed page) moves the seen keys
+  but not the mark, so the next run pages on past them into what it missed
+- New keys and marks are staged during a run and only committed once the
+  jobs have been written out (a failed sync never skips postings)
+"""
+
+import json
+import os
+import time
+
+DEFAULT_STATE_PATH = os.path.join('.cache', 'crawl_state.json')
+KEYS_PER_QUERY = 50   # newest keys remembered per query
+
+
+class CrawlState:
+    def __init__(self, path=DEFAULT_STATE_PATH):
+        self.path = path
+        self.queries = {}
+        self.staged = {}
+        self.completed = set()
+        if os.path.exists(path):
+            try:
+                with open(path, encoding='utf-8') as f:
+                    self.queries = json.load(f)
+            except (OSError, ValueError):
+                self.queries = {}
+
+    def seen_keys(self, query):
+        """Job keys already crawled for this query (committed marks only)"""
+        return set(self.queries.get(query, {}).get('keys', []))
+
+    def mark_keys(self, query):
+        """The query's high-water mark - paging stops at a page that reaches it"""
+        entry = self.queries.get(query, {})
+        return set(entry.get('mark', entry.get('keys', [])))
+
+    def stage(self, query, keys):
+        """Record keys emitted this run, newest first"""
+        staged = self.staged.setdefault(query, [])
+        staged.extend(k for k in keys if k not in staged)
+
+    def complete(self, query):
+        """This run's crawl of the query reached its mark (or max pages) - on commit the mark moves up"""
+        self.completed.add(query)
+
+    def commit(self):
+        """Fold staged keys into the seen keys (and completed queries' marks) and save"""
+        if not self.staged and not self.completed:
+            return
+        now = time.time()
+        for query in set(self.staged) | self.completed:
+            entry = self.queries.get(query, {})
+            keys = self.staged.get(query, [])
+            old = [k for k in entry.get('keys', []) if k not in keys]
+            merged = (keys + old)[:KEYS_PER_QUERY]
+            mark = merged if query in self.completed else entry.get('mark', entry.get('keys', []))
+            self.queries[query] = {'keys': merged, 'mark': mark, 'updated': now}
+        self.staged = {}
+        self.completed = set()
+
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = self.path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.queries, f, indent=1)
+        os.replace(tmp, self.path)
+
+    def discard(self):
+        self.staged = {}
+        self.completed = set()
@@ -0,0 +1,64 @@
+"""
+Async Fetch Engine
+Downloads many search pages at the same time
+Stays polite: caps total in-flight requests and requests per host,
+and spends each host's rate-limiter budget as fast as it allows
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from urllib.parse import urlsplit
+
+from metrics import METRICS
+
+DEFAULT_CONCURRENCY = 8
+DEFAULT_PER_HOST = 4
+
+
+class AsyncFetchEngine:
+    def __init__(self, session, concurrency=DEFAULT_CONCURRENCY, per_host=DEFAULT_PER_HOST, timeout=10, limiter=None):
+        self.session = session
+        self.limiter = limiter
+        self.concurrency = max(1, concurrency)
+        self.per_host = max(1, per_host)
+        self.timeout = timeout
+        # requests is blocking - one thread per in-flight request (asyncio's default
+        # pool is capped at cpu count + 4, which would quietly limit concurrency)
+        self.executor = ThreadPoolExecutor(self.concurrency, thread_name_prefix='fetch')
+
+    async def fetch_one(self, url, limit, host_limits):
+        """Fetch a single URL, returns (url, response or None)"""
+        host = urlsplit(url).netloc
+        if host not in host_limits:
+            host_limits[host] = asyncio.Semaphore(self.per_host)
+
+        async with limit, host_limits[host]:
+            try:
+                if self.limiter:
+                    request = partial(self.limiter.get, self.session, url, timeout=self.timeout)
+                else:
+                    request = partial(self.session.get, url, timeout=self.timeout)
+                with METRICS.timer('fetch', host=host):
+                    resp = await asyncio.get_running_loop().run_in_executor(self.executor, request)
+            except Exception:
+                METRICS.incr('http_errors', host=host)
+                return url, None
+            METRICS.incr('http_status', host=host, code=resp.status_code)
+            if not getattr(resp, 'from_cache', False):
+                METRICS.incr('bytes_downloaded', len(resp.content or b''), host=host)
+            return url, resp
+
+    async def fetch_all(self, urls):
+        """Fetch every URL concurrently, results keep the input order"""
+        limit = asyncio.Semaphore(self.concurrency)
+        host_limits = {}
+        tasks = [self.fetch_one(url, limit, host_limits) for url in urls]
+        return await asyncio.gather(*tasks)
+
+    def fetch(self, urls):
+        """Blocking wrapper around fetch_all for synchronous callers"""
+        urls = list(urls)
+        if not urls:
+            return []
+        return asyncio.run(self.fetch_all(urls))
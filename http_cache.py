@@ -0,0 +1,197 @@
+"""
+HTTP Response Cache
+Persistent on-disk cache for GET responses, keyed by URL
+- Bodies stored zlib-compressed in SQLite
+- Fresh entries (within TTL) are served without touching the network
+- Stale entries are revalidated with If-None-Match / If-Modified-Since
+- Size-bounded, least recently used entries are evicted first
+- Replay mode serves only from the cache (offline re-parsing)
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from urllib.parse import urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+DEFAULT_CACHE_PATH = os.path.join('.cache', 'http_cache.sqlite')
+DEFAULT_TTL = 15 * 60              # seconds an entry is served without revalidation
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+
+# Only keep the headers needed to rebuild a usable Response
+KEPT_HEADERS = ('Content-Type', 'ETag', 'Last-Modified', 'Cache-Control', 'Date')
+
+
+class ResponseCache:
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl=DEFAULT_TTL, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute('''
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                status INTEGER,
+                headers TEXT,
+                body BLOB,
+                size INTEGER,
+                stored_at REAL,
+                accessed_at REAL
+            )
+        ''')
+        self.db.execute('CREATE INDEX IF NOT EXISTS idx_accessed ON responses (accessed_at)')
+        self.db.commit()
+
+    def get(self, url):
+        """Return the cache entry for url (or None) and bump its LRU position"""
+        with self.lock:
+            row = self.db.execute(
+                'SELECT status, headers, body, stored_at FROM responses WHERE url = ?', (url,)
+            ).fetchone()
+            if not row:
+                return None
+            self.db.execute('UPDATE responses SET accessed_at = ? WHERE url = ?', (time.time(), url))
+            self.db.commit()
+
+        status, headers, body, stored_at = row
+        return {
+            'status': status,
+            'headers': json.loads(headers),
+            'body': zlib.decompress(body),
+            'stored_at': stored_at,
+        }
+
+    def is_fresh(self, entry):
+        return entry is not None and time.time() - entry['stored_at'] < self.ttl
+
+    def put(self, url, resp):
+        """Store a 200 response"""
+        headers = {k: resp.headers[k] for k in KEPT_HEADERS if k in resp.headers}
+        body = zlib.compress(resp.content, 6)
+        now = time.time()
+        with self.lock:
+            self.db.execute(
+                'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (url, resp.status_code, json.dumps(headers), body, len(body), now, now)
+            )
+            self.db.commit()
+            self._evict()
+
+    def touch(self, url, resp=None):
+        """A 304 came back - entry is fresh again (validators may have rotated)"""
+        with self.lock:
+            now = time.time()
+            if resp is not None and ('ETag' in resp.headers or 'Last-Modified' in resp.headers):
+                row = self.db.execute('SELECT headers FROM responses WHERE url = ?', (url,)).fetchone()
+                if row:
+                    headers = json.loads(row[0])
+                    for k in ('ETag', 'Last-Modified'):
+                        if k in resp.headers:
+                            headers[k] = resp.headers[k]
+                    self.db.execute('UPDATE responses SET headers = ? WHERE url = ?', (json.dumps(headers), url))
+            self.db.execute('UPDATE responses SET stored_at = ?, accessed_at = ? WHERE url = ?', (now, now, url))
+            self.db.commit()
+
+    def _evict(self):
+        """Drop least recently used entries until under max_bytes (caller holds lock)"""
+        total = self.db.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        for url, size in self.db.execute('SELECT url, size FROM responses ORDER BY accessed_at').fetchall():
+            if total <= self.max_bytes:
+                break
+            self.db.execute('DELETE FROM responses WHERE url = ?', (url,))
+            total -= size
+        self.db.commit()
+
+    def total_bytes(self):
+        with self.lock:
+            return self.db.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+
+def build_response(url, entry, status=None):
+    """Turn a cache entry back into a requests.Response"""
+    resp = requests.Response()
+    resp.url = url
+    resp.status_code = status or entry['status']
+    resp.headers = CaseInsensitiveDict(entry['headers'])
+    resp._content = entry['body']
+    resp.encoding = get_encoding_from_headers(resp.headers)
+    resp.from_cache = True
+    return resp
+
+
+def cache_miss_response(url):
+    """Replay mode and nothing stored: behave like Cache-Control: only-if-cached"""
+    resp = requests.Response()
+    resp.url = url
+    resp.status_code = 504
+    resp._content = b''
+    resp.from_cache = True
+    return resp
+
+
+class CachedSession(requests.Session):
+    """requests.Session whose GETs go through a ResponseCache (and optional RateLimiter)"""
+
+    def __init__(self, cache=None, limiter=None, replay=False):
+        super().__init__()
+        self.cache = cache
+        self.limiter = limiter
+        self.replay = replay
+        self.pinned = set()   # URLs served from cache even when stale (resumed runs)
+        self.stats = {'hits': 0, 'revalidated': 0, 'misses': 0}
+
+    def _network(self, method, url, **kwargs):
+        if self.limiter:
+            host = urlsplit(url).netloc
+            return self.limiter.send(host, lambda: super(CachedSession, self).request(method, url, **kwargs))
+        return super().request(method, url, **kwargs)
+
+    def request(self, method, url, **kwargs):
+        if self.cache is None or method.upper() != 'GET':
+            return self._network(method, url, **kwargs)
+
+        entry = self.cache.get(url)
+        if self.replay:
+            return build_response(url, entry) if entry else cache_miss_response(url)
+
+        if self.cache.is_fresh(entry) or (entry and url in self.pinned):
+            self.stats['hits'] += 1
+            return build_response(url, entry)
+
+        # Stale or missing - conditional GET when we have validators
+        if entry:
+            headers = dict(kwargs.pop('headers', None) or {})
+            if 'ETag' in entry['headers']:
+                headers['If-None-Match'] = entry['headers']['ETag']
+            if 'Last-Modified' in entry['headers']:
+                headers['If-Modified-Since'] = entry['headers']['Last-Modified']
+            kwargs['headers'] = headers
+
+        resp = self._network(method, url, **kwargs)
+
+        if resp.status_code == 304 and entry:
+            self.stats['revalidated'] += 1
+            self.cache.touch(url, resp)
+            return build_response(url, entry, status=200)
+
+        self.stats['misses'] += 1
+        if resp.status_code == 200:
+            self.cache.put(url, resp)
+        return resp
@@ -0,0 +1,94 @@
+"""
+Indeed India
+Search URL building and page -> job dict parsing
+Module-level functions so parser worker processes can run them
+"""
+
+import re
+
+from contacts import extract_contacts
+from job_posting import JobPosting, today
+from metrics import METRICS
+from parsers import get_parser
+from skills import extract_skills
+
+# Indeed search space - every keyword x location (x page) is fetched concurrently
+INDEED_KEYWORDS = ['qa+automation', 'sdet', 'test+automation']
+INDEED_LOCATIONS = ['bangalore']
+INDEED_MAX_PAGES = 5           # deepest page crawled when a query has no high-water mark yet
+RESULTS_PER_PAGE = 10
+
+JOB_KEY_RE = re.compile(r'[?&]jk=([0-9a-zA-Z]+)')
+
+
+def search_url(keyword, location, page=0):
+    url = f'https://in.indeed.com/jobs?q={keyword}&l={location}&sort=date'
+    if page:
+        url += f'&start={page * RESULTS_PER_PAGE}'
+    return url
+
+
+def indeed_job_key(job):
+    """Indeed's job key (jk=...) from the apply link, falls back to the link itself"""
+    m = JOB_KEY_RE.search(job.apply_link)
+    return m.group(1) if m else job.apply_link
+
+
+def build_indeed_urls(keywords=None, locations=None, pages=1):
+    """Build one search URL per keyword/location/page combination"""
+    keywords = keywords or INDEED_KEYWORDS
+    locations = locations or INDEED_LOCATIONS
+
+    urls = []
+    for keyword in keywords:
+        for location in locations:
+            for page in range(pages):
+                urls.append(search_url(keyword, location, page))
+    return urls
+
+
+def parse_indeed_page(html, backend='auto'):
+    """Parse one Indeed search page into job dicts"""
+    jobs = []
+    posted = today()
+
+    with METRICS.timer('parse'):
+        cards = get_parser(backend)(html)
+
+    with METRICS.timer('extract'):
+        for card in cards:
+            try:
+                title = card['title']
+                company = card['company'] if card['company'] is not None else "Company"
+                location_text = card['location'] if card['location'] is not None else "Location Not Specified"
+                summary = card['summary'] or ""
+
+                # Link
+                if card['href']:
+                    job_link = 'https://in.indeed.com' + card['href']
+                else:
+                    job_link = "LINK_NOT_AVAILABLE"
+
+                job = JobPosting(
+                    company=company,
+                    role=title,
+                    description=summary,
+                    skills=extract_skills(summary) if summary else "",
+                    location=location_text,
+                    apply_link=job_link,
+                    posted=posted,
+                    platform='Indeed India',
+                )
+
+                # Try to extract contact info for Indeed jobs
+                try:
+                    job.hr_contact = extract_contacts(summary, company)
+                except Exception:
+                    job.hr_contact = "LinkedIn: https://www.linkedin.com/company/" + company.lower().replace(' ', '-')
+
+                jobs.append(job)
+
+            except Exception:
+                continue
+
+    return jobs
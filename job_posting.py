@@ -0,0 +1,140 @@
+"""
+Job Posting
+Compact record for one posting, replacing the 12-key dict
+- __slots__ dataclass: no per-instance __dict__, no repeated key strings
+- Categorical fields (platform, employment type, location, ...) are interned,
+  so thousands of postings share one 'Full-time' / 'Indeed India' string
+- Date_Posted is stored as a date ordinal, formatted only when written out
+- Fingerprint (dedup key) computed once and cached
+- Converts losslessly to / from the 13-column sheet row
+"""
+
+import hashlib
+import sys
+from dataclasses import dataclass, field
+from datetime import date, datetime
+
+if sys.version_info < (3, 10):
+    # dataclass(slots=True) below
+    raise RuntimeError(f"Python 3.10 or newer is required (this is {sys.version.split()[0]})")
+
+DATE_FORMAT = '%d-%m-%Y'
+
+SHEET_HEADERS = ['Serial_No', 'Company_Name', 'Job_Role', 'Job_Description',
+                 'Required_Skills', 'Experience_Required', 'Location',
+                 'Employment_Type', 'Salary_Range', 'Apply_Link',
+                 'Date_Posted', 'Source_Platform', 'HR_Contact']
+
+# dict key -> attribute, in sheet column order (Serial_No excluded)
+FIELDS = {
+    'Company_Name': 'company',
+    'Job_Role': 'role',
+    'Job_Description': 'description',
+    'Required_Skills': 'skills',
+    'Experience_Required': 'experience',
+    'Location': 'location',
+    'Employment_Type': 'employment_type',
+    'Salary_Range': 'salary',
+    'Apply_Link': 'apply_link',
+    'Date_Posted': 'posted',
+    'Source_Platform': 'platform',
+    'HR_Contact_Extracted': 'hr_contact',
+}
+
+_INTERNED = ('experience', 'location', 'employment_type', 'salary', 'platform')
+
+
+def job_fingerprint(company, role, description):
+    """Same key the sheet dedup always used: company + role + first 100 chars of description"""
+    key = '\x1f'.join([(company or '').lower(), (role or '').lower(), (description or '')[:100].lower()])
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+
+def to_ordinal(value):
+    """date / datetime / 'dd-mm-YYYY' / ordinal -> ordinal"""
+    if isinstance(value, int):
+        return value
+    if isinstance(value, datetime):
+        return value.date().toordinal()
+    if isinstance(value, date):
+        return value.toordinal()
+    return datetime.strptime(value, DATE_FORMAT).toordinal()
+
+
+def today():
+    return date.today().toordinal()
+
+
+@dataclass(slots=True)
+class JobPosting:
+    company: str
+    role: str
+    description: str
+    skills: str = ''
+    experience: str = 'Not Specified'
+    location: str = 'Location Not Specified'
+    employment_type: str = 'Full-time'
+    salary: str = 'Not Disclosed'
+    apply_link: str = 'LINK_NOT_AVAILABLE'
+    posted: int = field(default_factory=today)
+    platform: str = ''
+    hr_contact: object = None   # ContactInfo, or the sheet string when read back
+    _fingerprint: str = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.posted = to_ordinal(self.posted)
+        for name in _INTERNED:
+            value = getattr(self, name)
+            if value:
+                setattr(self, name, sys.intern(value))
+
+    def __reduce__(self):
+        # Rebuild through __init__ so postings parsed in worker processes are re-interned here
+        return type(self), (self.company, self.role, self.description, self.skills, self.experience,
+                            self.location, self.employment_type, self.salary, self.apply_link,
+                            self.posted, self.platform, self.hr_contact)
+
+    @property
+    def fingerprint(self):
+        """Dedup key (company + role + first 100 chars of description)"""
+        if self._fingerprint is None:
+            self._fingerprint = job_fingerprint(self.company, self.role, self.description)
+        return self._fingerprint
+
+    @property
+    def date_posted(self):
+        return date.fromordinal(self.posted).strftime(DATE_FORMAT)
+
+    @classmethod
+    def from_dict(cls, job):
+        """Build from the legacy dict (sheet-style keys)"""
+        return cls(**{attr: job[key] for key, attr in FIELDS.items() if key in job})
+
+    def to_dict(self):
+        job = {key: getattr(self, attr) for key, attr in FIELDS.items()}
+        job['Date_Posted'] = self.date_posted
+        return job
+
+    def to_row(self, serial):
+        """13-column sheet row"""
+        return [
+            serial,
+            self.company,
+            self.role,
+            self.description,
+            self.skills,
+            self.experience,
+            self.location,
+            self.employment_type,
+            self.salary,
+            self.apply_link,
+            self.date_posted,
+            self.platform,
+            str(self.hr_contact if self.hr_contact is not None else ''),
+        ]
+
+    @classmethod
+    def from_row(cls, row):
+        """Inverse of to_row() - returns (serial, JobPosting)"""
+        row = list(row) + [''] * (len(SHEET_HEADERS) - len(row))
+        return row[0], cls(*row[1:len(SHEET_HEADERS)])
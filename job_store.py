@@ -0,0 +1,271 @@
+"""
+Job Store
+Local SQLite database of every posting - the system of record
+- One row per job, keyed by serial (assigned here, in the order jobs arrive)
+- Unique fingerprint index: dedup is a single indexed lookup
+- Indexes on company, role, source platform and posted date for queries
+- Knows which jobs the Google Sheet already has (sheet_serial: its
+  Serial_No there, matched by fingerprint), so sheet rows and store
+  serials never have to line up
+- WAL journal: output sinks read from their own connections while the
+  scraper keeps committing
+- Queries stay on indexes: company is matched exactly or by prefix on a
+  case-insensitive index, role / skills / location / source platform
+  through a full-text (FTS5) word index kept in step by triggers
+"""
+
+import os
+import re
+import sqlite3
+import time
+
+from job_posting import JobPosting, today
+
+DEFAULT_STORE_PATH = os.path.join('data', 'jobs.sqlite')
+BUSY_TIMEOUT = 30.0   # seconds a write waits for another connection's transaction
+SCHEMA_VERSION = 1    # PRAGMA user_version once the tables, indexes and triggers below are in place
+
+COLUMNS = ['company', 'role', 'description', 'skills', 'experience', 'location',
+           'employment_type', 'salary', 'apply_link', 'posted', 'platform', 'hr_contact']
+
+SORT_COLUMNS = {
+    'posted': 'posted',
+    'company': 'company COLLATE NOCASE',
+    'role': 'role COLLATE NOCASE',
+    'location': 'location COLLATE NOCASE',
+    'source': 'platform',
+    'serial': 'serial',
+}
+
+# Word index over the free-text filters; '#' and '+' stay in words (C#, C++)
+FTS_COLUMNS = ['role', 'skills', 'location', 'platform']
+
+_SCHEMA = f'''
+CREATE TABLE IF NOT EXISTS jobs (
+    serial INTEGER PRIMARY KEY,
+    fingerprint TEXT NOT NULL UNIQUE,
+    {', '.join(f'{c} INTEGER' if c == 'posted' else f'{c} TEXT' for c in COLUMNS)},
+    added_at REAL,
+    sheet_serial INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs (company COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_jobs_role ON jobs (role COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_jobs_platform ON jobs (platform);
+CREATE INDEX IF NOT EXISTS idx_jobs_posted ON jobs (posted);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+    {', '.join(FTS_COLUMNS)}, content='jobs', content_rowid='serial', tokenize="unicode61 tokenchars '#+'");
+CREATE TRIGGER IF NOT EXISTS jobs_fts_insert AFTER INSERT ON jobs BEGIN
+    INSERT INTO jobs_fts (rowid, {', '.join(FTS_COLUMNS)})
+    VALUES (new.serial, {', '.join('new.' + c for c in FTS_COLUMNS)});
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_fts_delete AFTER DELETE ON jobs BEGIN
+    INSERT INTO jobs_fts (jobs_fts, rowid, {', '.join(FTS_COLUMNS)})
+    VALUES ('delete', old.serial, {', '.join('old.' + c for c in FTS_COLUMNS)});
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_fts_update AFTER UPDATE OF {', '.join(FTS_COLUMNS)} ON jobs BEGIN
+    INSERT INTO jobs_fts (jobs_fts, rowid, {', '.join(FTS_COLUMNS)})
+    VALUES ('delete', old.serial, {', '.join('old.' + c for c in FTS_COLUMNS)});
+    INSERT INTO jobs_fts (rowid, {', '.join(FTS_COLUMNS)})
+    VALUES (new.serial, {', '.join('new.' + c for c in FTS_COLUMNS)});
+END;
+'''
+
+_WORD_RE = re.compile(r'[\w#+]+\*?')
+
+
+def _name_match(column, value):
+    """Case-insensitive exact match, or prefix match for 'value*' - both a range on the NOCASE index"""
+    if value.endswith('*'):
+        prefix = value.rstrip('*')
+        # Every string starting with the prefix sorts below prefix + the highest code point
+        return (f'{column} >= ? COLLATE NOCASE AND {column} < ? COLLATE NOCASE',
+                [prefix, prefix + '\U0010ffff'])
+    return f'{column} = ? COLLATE NOCASE', [value]
+
+
+def _fts_query(column, value):
+    """FTS5 query: every word of `value` in `column` ('word*' matches a prefix)"""
+    terms = []
+    for word in _WORD_RE.findall(value.lower()):
+        prefix = word.endswith('*')
+        terms.append(f'{column} : "{word.rstrip("*")}"' + ('*' if prefix else ''))
+    return ' AND '.join(terms)
+
+
+class JobStore:
+    def __init__(self, path=DEFAULT_STORE_PATH, timeout=BUSY_TIMEOUT):
+        self.path = path
+        if path != ':memory:' and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.db = sqlite3.connect(path, timeout=timeout)
+        if path != ':memory:':
+            self.db.execute('PRAGMA journal_mode=WAL')
+        if self.db.execute('PRAGMA user_version').fetchone()[0] != SCHEMA_VERSION:
+            # Only a new store is written here - a reader's connection
+            # (output sinks) never takes the write lock just by opening
+            self._create_schema()
+
+    def _create_schema(self):
+        self.db.executescript(_SCHEMA)
+        self.db.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+        self.db.commit()
+
+    def get_meta(self, key, default=None):
+        row = self.db.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else default
+
+    def set_meta(self, key, value, commit=True):
+        self.db.execute('INSERT OR REPLACE INTO meta VALUES (?, ?)', (key, str(value)))
+        if commit:
+            self.db.commit()
+
+    @property
+    def last_serial(self):
+        row = self.db.execute('SELECT MAX(serial) FROM jobs').fetchone()
+        return row[0] or 0
+
+    def contains(self, fingerprint):
+        return self.db.execute('SELECT 1 FROM jobs WHERE fingerprint = ?', (fingerprint,)).fetchone() is not None
+
+    def add(self, job, serial=None, commit=True, sheet_serial=None):
+        """Insert a JobPosting, returns its serial (None if the fingerprint is already stored)
+
+        commit=False leaves it in the open transaction: visible to contains()
+        right away, made permanent by commit() or dropped by rollback()
+        """
+        values = [getattr(job, c) for c in COLUMNS]
+        values[-1] = str(job.hr_contact if job.hr_contact is not None else '')
+        cur = self.db.execute(
+            f'INSERT OR IGNORE INTO jobs (serial, fingerprint, {", ".join(COLUMNS)}, added_at, sheet_serial) '
+            f'VALUES (?, ?, {", ".join("?" for _ in COLUMNS)}, ?, ?)',
+            [serial, job.fingerprint, *values, time.time(), sheet_serial])
+        if commit:
+            self.db.commit()
+        return cur.lastrowid if cur.rowcount else None
+
+    def import_rows(self, rows, resync=False):
+        """Bring sheet rows into the store, returns number of new jobs
+
+        Rows are matched by fingerprint, never by Serial_No: a job the store
+        already has is only marked as being in the sheet, a new one gets the next
+        store serial. Either way sheet_serial records its Serial_No in the sheet.
+        resync=True: `rows` is the whole sheet - jobs missing from it are unmarked.
+        """
+        if resync:
+            self.db.execute('UPDATE jobs SET sheet_serial = NULL WHERE sheet_serial IS NOT NULL')
+        imported = 0
+        for row in rows:
+            row = list(row) + [''] * (13 - len(row))
+            try:
+                sheet_serial = int(row[0])
+            except (TypeError, ValueError):
+                continue
+            try:
+                job = JobPosting.from_row(row)[1]
+            except ValueError:
+                # Unparseable date - keep the posting for dedup, dated today
+                job = JobPosting.from_row(row[:10] + [today()] + row[11:])[1]
+            if self.add(job, commit=False, sheet_serial=sheet_serial) is not None:
+                imported += 1
+            else:
+                self.db.execute('UPDATE jobs SET sheet_serial = ? WHERE fingerprint = ?',
+                                (sheet_serial, job.fingerprint))
+        self.db.commit()
+        return imported
+
+    def rows_after(self, serial, limit=None, skip_in_sheet=False):
+        """13-column sheet rows with serial > `serial`, in order
+
+        skip_in_sheet=True leaves out jobs the sheet already has.
+        """
+        where = ' AND sheet_serial IS NULL' if skip_in_sheet else ''
+        sql = f'SELECT serial, {", ".join(COLUMNS)} FROM jobs WHERE serial > ?{where} ORDER BY serial'
+        params = [serial]
+        if limit is not None:
+            sql += ' LIMIT ?'
+            params.append(limit)
+        for record in self.db.execute(sql, params):
+            yield self.to_posting(record[1:]).to_row(record[0])
+
+    def count_after(self, serial, skip_in_sheet=False):
+        """Number of rows rows_after() has left to give"""
+        where = ' AND sheet_serial IS NULL' if skip_in_sheet else ''
+        return self.db.execute(f'SELECT COUNT(*) FROM jobs WHERE serial > ?{where}', (serial,)).fetchone()[0]
+
+    def postings(self, serials=None):
+        """(serial, JobPosting) for every stored job (or just `serials`), in order"""
+        sql = f'SELECT serial, {", ".join(COLUMNS)} FROM jobs'
+        if serials is None:
+            for record in self.db.execute(sql + ' ORDER BY serial'):
+                yield record[0], self.to_posting(record[1:])
+            return
+        serials = sorted(serials)
+        for i in range(0, len(serials), 500):
+            chunk = serials[i:i + 500]
+            query = f'{sql} WHERE serial IN ({", ".join("?" for _ in chunk)}) ORDER BY serial'
+            for record in self.db.execute(query, chunk):
+                yield record[0], self.to_posting(record[1:])
+
+    def serials(self):
+        return {serial for (serial,) in self.db.execute('SELECT serial FROM jobs')}
+
+    def query(self, company=None, role=None, skill=None, location=None, source=None,
+              since=None, until=None, sort='posted', descending=True, limit=None, offset=0):
+        """Filtered, sorted page of (serial, JobPosting) plus the total number of matches
+
+        company matches the whole name, case-insensitively ('name*' for a prefix);
+        role / skill / location / source match words ('pyth*' for a prefix, every
+        word must appear) - a word filter with no words in it is a ValueError.
+        since/until are date ordinals (inclusive). Every filter, and the total,
+        runs on an index.
+        """
+        where, params = [], []
+        if company:
+            clause, values = _name_match('company', company)
+            where.append(clause)
+            params.extend(values)
+        words = []
+        for name, column, value in (('role', 'role', role), ('skill', 'skills', skill),
+                                    ('location', 'location', location), ('source', 'platform', source)):
+            if value:
+                match = _fts_query(column, value)
+                if not match:
+                    raise ValueError(f"{name} filter {value!r} has no words to match")
+                words.append(match)
+        if words:
+            where.append('serial IN (SELECT rowid FROM jobs_fts WHERE jobs_fts MATCH ?)')
+            params.append(' AND '.join(words))
+        if since is not None:
+            where.append('posted >= ?')
+            params.append(since)
+        if until is not None:
+            where.append('posted <= ?')
+            params.append(until)
+        clause = f' WHERE {" AND ".join(where)}' if where else ''
+
+        total = self.db.execute(f'SELECT COUNT(*) FROM jobs{clause}', params).fetchone()[0]
+
+        if sort not in SORT_COLUMNS:
+            raise ValueError(f"can't sort by {sort!r} (choose from {', '.join(SORT_COLUMNS)})")
+        order = 'DESC' if descending else 'ASC'
+        sql = (f'SELECT serial, {", ".join(COLUMNS)} FROM jobs{clause} '
+               f'ORDER BY {SORT_COLUMNS[sort]} {order}, serial {order} LIMIT ? OFFSET ?')
+        rows = self.db.execute(sql, params + [-1 if limit is None else limit, offset])
+        return [(r[0], self.to_posting(r[1:])) for r in rows], total
+
+    @staticmethod
+    def to_posting(values):
+        return JobPosting(*values)
+
+    def count(self):
+        return self.db.execute('SELECT COUNT(*) FROM jobs').fetchone()[0]
+
+    def commit(self):
+        self.db.commit()
+
+    def rollback(self):
+        self.db.rollback()
+
+    def close(self):
+        self.db.close()
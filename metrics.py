@@ -0,0 +1,169 @@
+"""
+Metrics
+Process-wide timers, counters and (optional) trace spans for a run
+- METRICS.timer('fetch') times a stage; counts, totals and max per stage
+- METRICS.incr('http_status', code=200) counts events, with labels
+- report() -> JSON-able dict, to_prometheus() -> Prometheus text format
+- With tracing on, every timed block is also kept as an OpenTelemetry-style
+  span (trace/span ids, parent, start/end, attributes)
+Parser worker processes record into their own copy; the pipeline ships
+each worker's drain() back and merge()s it here
+"""
+
+import json
+import os
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# Enclosing span per thread / asyncio task
+_current_span = ContextVar('current_span', default=None)
+
+
+def _key(name, labels):
+    return (name, tuple(sorted(labels.items())))
+
+
+def _label_text(labels):
+    return ','.join(f'{k}="{v}"' for k, v in labels)
+
+
+class Metrics:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.tracing = False
+        self.reset()
+
+    def reset(self, tracing=None):
+        with self.lock:
+            if tracing is not None:
+                self.tracing = tracing
+            self.counters = {}
+            self.timers = {}      # (name, labels) -> [count, total_seconds, max_seconds]
+            self.spans = []
+            self.trace_id = secrets.token_hex(16)
+            self.started = time.time()
+
+    def incr(self, name, value=1, **labels):
+        key = _key(name, labels)
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name, seconds, **labels):
+        key = _key(name, labels)
+        with self.lock:
+            stat = self.timers.get(key)
+            if stat is None:
+                self.timers[key] = [1, seconds, seconds]
+            else:
+                stat[0] += 1
+                stat[1] += seconds
+                stat[2] = max(stat[2], seconds)
+
+    @contextmanager
+    def timer(self, name, **labels):
+        """Time a block as stage `name` (and record a span when tracing)"""
+        span_id = parent = token = None
+        if self.tracing:
+            span_id = secrets.token_hex(8)
+            parent = _current_span.get()
+            token = _current_span.set(span_id)
+        start_wall = time.time()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            if token is not None:
+                _current_span.reset(token)
+            self.observe(name, elapsed, **labels)
+            if span_id:
+                with self.lock:
+                    self.spans.append({
+                        'trace_id': self.trace_id, 'span_id': span_id, 'parent_span_id': parent,
+                        'name': name, 'start_time': start_wall, 'end_time': start_wall + elapsed,
+                        'attributes': labels,
+                    })
+
+    def drain(self):
+        """Take everything recorded so far (worker side of merge())"""
+        with self.lock:
+            data = {'counters': list(self.counters.items()), 'timers': list(self.timers.items()),
+                    'spans': self.spans}
+            self.counters, self.timers, self.spans = {}, {}, []
+        return data
+
+    def merge(self, data):
+        with self.lock:
+            for key, value in data['counters']:
+                self.counters[key] = self.counters.get(key, 0) + value
+            for key, (count, total, peak) in data['timers']:
+                stat = self.timers.setdefault(key, [0, 0.0, 0.0])
+                stat[0] += count
+                stat[1] += total
+                stat[2] = max(stat[2], peak)
+            for span in data['spans']:
+                self.spans.append(dict(span, trace_id=self.trace_id))
+
+    def report(self):
+        """Structured run report"""
+        with self.lock:
+            stages, counters = {}, {}
+            for (name, labels), (count, total, peak) in sorted(self.timers.items()):
+                label = _label_text(labels)
+                stages[f'{name}{{{label}}}' if label else name] = {
+                    'count': count, 'total_s': round(total, 4),
+                    'avg_ms': round(total / count * 1000, 3), 'max_ms': round(peak * 1000, 3),
+                }
+            for (name, labels), value in sorted(self.counters.items()):
+                label = _label_text(labels)
+                counters[f'{name}{{{label}}}' if label else name] = value
+            report = {
+                'started': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(self.started)),
+                'wall_s': round(time.time() - self.started, 3),
+                'stages': stages,
+                'counters': counters,
+            }
+            if self.tracing:
+                report['spans'] = list(self.spans)
+        return report
+
+    def to_prometheus(self, prefix='job_scraper'):
+        """Prometheus text exposition format"""
+        lines = []
+        with self.lock:
+            seen = set()
+            for (name, labels), value in sorted(self.counters.items()):
+                metric = f'{prefix}_{name}_total'
+                if metric not in seen:
+                    lines.append(f'# TYPE {metric} counter')
+                    seen.add(metric)
+                label = _label_text(labels)
+                lines.append(f'{metric}{{{label}}} {value}' if label else f'{metric} {value}')
+            for (name, labels), (count, total, _) in sorted(self.timers.items()):
+                metric = f'{prefix}_{name.replace(".", "_")}_seconds'
+                if metric not in seen:
+                    lines.append(f'# TYPE {metric} summary')
+                    seen.add(metric)
+                label = _label_text(labels)
+                suffix = f'{{{label}}}' if label else ''
+                lines.append(f'{metric}_count{suffix} {count}')
+                lines.append(f'{metric}_sum{suffix} {total:.6f}')
+        return '\n'.join(lines) + '\n'
+
+    def write_report(self, path):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, indent=1, default=str)
+
+    def write_prometheus(self, path):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(self.to_prometheus())
+
+
+METRICS = Metrics()
@@ -0,0 +1,181 @@
+"""
+Near-Duplicate Detection
+MinHash signatures over word shingles + LSH banding index (SQLite)
+- Catches reposts that differ by a few words
+- Lookup per new job only touches the LSH buckets it falls into,
+  never compares against every historical posting
+- Persisted across runs, keyed by store serial
+- The permutation step runs as one numpy array operation when numpy is
+  installed (same signatures as the pure-Python fallback), and a job's
+  signature is computed once for both find() and add()
+"""
+
+import hashlib
+import importlib.util
+import os
+import random
+import re
+import sqlite3
+from array import array
+
+DEFAULT_NEAR_DUP_PATH = os.path.join('.cache', 'near_dup.sqlite')
+
+NUM_PERM = 64
+BANDS = 16                      # 16 bands x 4 rows - candidates from ~50% similarity
+ROWS = NUM_PERM // BANDS
+SHINGLE_SIZE = 2                # words per shingle
+DEFAULT_THRESHOLD = 0.7         # estimated Jaccard similarity to count as a repost
+
+_MERSENNE = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+# Fixed seed: signatures must be comparable across runs
+_rng = random.Random(1234)
+_PERMS = [(_rng.randrange(1, _MERSENNE), _rng.randrange(0, _MERSENNE)) for _ in range(NUM_PERM)]
+
+_WORD_RE = re.compile(r'[a-z0-9+#]+')
+
+_numpy = None   # imported on first use (start-up stays light)
+
+
+def shingles(text):
+    """Set of hashed word n-grams"""
+    words = _WORD_RE.findall((text or '').lower())
+    if len(words) < SHINGLE_SIZE:
+        words = words or ['']
+        grams = [' '.join(words)]
+    else:
+        grams = [' '.join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)]
+    return {int.from_bytes(hashlib.blake2b(g.encode('utf-8'), digest_size=4).digest(), 'little') for g in grams}
+
+
+def _load_numpy():
+    """numpy (False if it isn't installed), plus the permutations as uint64 columns"""
+    global _numpy, _PERM_A_HI, _PERM_A_LO, _PERM_B
+    if _numpy is None:
+        if not importlib.util.find_spec('numpy'):
+            _numpy = False
+            return _numpy
+        import numpy
+        _PERM_A_HI = numpy.array([a >> 32 for a, _ in _PERMS], dtype=numpy.uint64)[:, None]
+        _PERM_A_LO = numpy.array([a & 0xFFFFFFFF for a, _ in _PERMS], dtype=numpy.uint64)[:, None]
+        _PERM_B = numpy.array([b for _, b in _PERMS], dtype=numpy.uint64)[:, None]
+        _numpy = numpy
+    return _numpy
+
+
+def _minhash_numpy(np, hashes):
+    """All permutations x shingles at once, exact (a*h + b) mod 2^61-1 in uint64
+
+    a*h needs up to 93 bits, so a is split at bit 32 and each part folded
+    with 2^61 = 1 (mod 2^61-1); every intermediate stays below 2^63.
+    """
+    h = np.fromiter(hashes, dtype=np.uint64, count=len(hashes))[None, :]
+    t = _PERM_A_HI * h                                          # < 2^61
+    s = (t >> 29) + ((t & ((1 << 29) - 1)) << 32)               # a_hi * h * 2^32
+    u = _PERM_A_LO * h                                          # < 2^64
+    s += (u & _MERSENNE) + (u >> 61) + _PERM_B
+    s = (s & _MERSENNE) + (s >> 61)
+    s = np.where(s >= _MERSENNE, s - _MERSENNE, s)
+    return (s & _MAX_HASH).min(axis=1).tolist()
+
+
+def minhash(text):
+    """MinHash signature (NUM_PERM ints)"""
+    hashes = shingles(text)
+    np = _load_numpy()
+    if np:
+        return _minhash_numpy(np, hashes)
+    return [min(((a * h + b) % _MERSENNE) & _MAX_HASH for h in hashes) for a, b in _PERMS]
+
+
+def similarity(sig_a, sig_b):
+    """Estimated Jaccard similarity of two signatures"""
+    return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / len(sig_a)
+
+
+def band_keys(sig):
+    return [hashlib.blake2b(array('I', sig[i * ROWS:(i + 1) * ROWS]).tobytes(), digest_size=8).hexdigest()
+            for i in range(BANDS)]
+
+
+def posting_text(role, description):
+    return f"{role or ''} {(description or '')[:500]}"
+
+
+def signature(role, description):
+    """A posting's signature - compute once, pass to find() and add()"""
+    return minhash(posting_text(role, description))
+
+
+def company_key(company):
+    return (company or '').strip().lower()
+
+
+class NearDuplicateIndex:
+    def __init__(self, path=DEFAULT_NEAR_DUP_PATH, threshold=DEFAULT_THRESHOLD):
+        self.threshold = threshold
+        if path != ':memory:' and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.execute('CREATE TABLE IF NOT EXISTS docs (doc_id INTEGER PRIMARY KEY, company TEXT, signature BLOB)')
+        self.db.execute('CREATE TABLE IF NOT EXISTS bands (band INTEGER, key TEXT, doc_id INTEGER)')
+        self.db.execute('CREATE INDEX IF NOT EXISTS idx_bands ON bands (band, key)')
+        self.db.commit()
+
+    def find(self, company, role, description, sig=None):
+        """Best (doc_id, similarity) above threshold for the same company, or None"""
+        sig = sig or signature(role, description)
+        company = company_key(company)
+
+        candidates = set()
+        for band, key in enumerate(band_keys(sig)):
+            for (doc_id,) in self.db.execute('SELECT doc_id FROM bands WHERE band = ? AND key = ?', (band, key)):
+                candidates.add(doc_id)
+
+        best = None
+        for doc_id in candidates:
+            row = self.db.execute('SELECT company, signature FROM docs WHERE doc_id = ?', (doc_id,)).fetchone()
+            if not row or row[0] != company:
+                continue
+            score = similarity(sig, array('I', row[1]))
+            if score >= self.threshold and (best is None or score > best[1]):
+                best = (doc_id, score)
+        return best
+
+    def add(self, doc_id, company, role, description, commit=True, sig=None):
+        sig = sig or signature(role, description)
+        if self.db.execute('SELECT 1 FROM docs WHERE doc_id = ?', (doc_id,)).fetchone():
+            self.remove([doc_id], commit=False)   # re-indexed - drop its old band rows (rare, so the scan is fine)
+        self.db.execute('INSERT INTO docs VALUES (?, ?, ?)',
+                        (doc_id, company_key(company), array('I', sig).tobytes()))
+        self.db.executemany('INSERT INTO bands VALUES (?, ?, ?)',
+                            [(band, key, doc_id) for band, key in enumerate(band_keys(sig))])
+        if commit:
+            self.db.commit()
+
+    def commit(self):
+        self.db.commit()
+
+    def rollback(self):
+        self.db.rollback()
+
+    def doc_ids(self):
+        return {doc_id for (doc_id,) in self.db.execute('SELECT doc_id FROM docs')}
+
+    def remove(self, doc_ids, commit=True):
+        doc_ids = list(doc_ids)
+        for i in range(0, len(doc_ids), 500):
+            chunk = doc_ids[i:i + 500]
+            marks = ', '.join('?' for _ in chunk)
+            self.db.execute(f'DELETE FROM docs WHERE doc_id IN ({marks})', chunk)
+            # bands has no doc_id index (lookups go by band key) - one scan per chunk
+            self.db.execute(f'DELETE FROM bands WHERE doc_id IN ({marks})', chunk)
+        if commit:
+            self.db.commit()
+
+    def count(self):
+        return self.db.execute('SELECT COUNT(*) FROM docs').fetchone()[0]
+
+    def close(self):
+        self.db.close()
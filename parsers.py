@@ -0,0 +1,131 @@
+"""
+Job Card Parsers
+Pluggable HTML backends for Indeed search pages
+- selectolax (C, fastest) or lxml (C) when installed
+- BeautifulSoup + SoupStrainer otherwise: only the job-card subtrees are
+  built instead of the whole page tree
+Every backend returns the same raw card dicts:
+    {'title', 'company', 'href', 'location', 'summary'}
+"""
+
+import importlib.util
+
+CARD_LIMIT = 10
+
+# Preferred order for 'auto'
+BACKENDS = ['selectolax', 'lxml', 'html.parser']
+
+
+def _card(title, company, href, location, summary):
+    return {'title': title, 'company': company, 'href': href, 'location': location, 'summary': summary}
+
+
+def _selectolax_parser():
+    try:
+        from selectolax.lexbor import LexborHTMLParser   # selectolax >= 0.3.13
+        return LexborHTMLParser
+    except ImportError:
+        from selectolax.parser import HTMLParser         # older releases (modest)
+        return HTMLParser
+
+
+def parse_cards_selectolax(html, limit=CARD_LIMIT):
+    HTMLParser = _selectolax_parser()
+
+    def text(node):
+        return node.text(deep=True, separator='', strip=True) if node else None
+
+    cards = []
+    for card in HTMLParser(html).css('div.job_seen_beacon')[:limit]:
+        title = card.css_first('h2.jobTitle')
+        if not title:
+            continue
+        link = title.css_first('a')
+        cards.append(_card(
+            text(title),
+            text(card.css_first('span.companyName')),
+            link.attributes.get('href') if link else None,
+            text(card.css_first('div.companyLocation')),
+            text(card.css_first('div.job-snippet')),
+        ))
+    return cards
+
+
+def _class_xpath(tag, cls):
+    return f".//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')]"
+
+
+def parse_cards_lxml(html, limit=CARD_LIMIT):
+    import lxml.html
+
+    def first(node, tag, cls):
+        found = node.xpath(_class_xpath(tag, cls))
+        return found[0] if found else None
+
+    def text(node):
+        return ''.join(t.strip() for t in node.itertext()) if node is not None else None
+
+    if not html.strip():
+        return []
+    cards = []
+    for card in lxml.html.fromstring(html).xpath(_class_xpath('div', 'job_seen_beacon'))[:limit]:
+        title = first(card, 'h2', 'jobTitle')
+        if title is None:
+            continue
+        links = title.xpath('.//a')
+        cards.append(_card(
+            text(title),
+            text(first(card, 'span', 'companyName')),
+            links[0].get('href') if links else None,
+            text(first(card, 'div', 'companyLocation')),
+            text(first(card, 'div', 'job-snippet')),
+        ))
+    return cards
+
+
+def parse_cards_soup(html, limit=CARD_LIMIT, features='html.parser'):
+    from bs4 import BeautifulSoup, SoupStrainer
+
+    def text(node):
+        return node.get_text(strip=True) if node else None
+
+    # Only build trees for the job cards, skip everything else on the page
+    only_cards = SoupStrainer('div', {'class': 'job_seen_beacon'})
+    soup = BeautifulSoup(html, features, parse_only=only_cards)
+
+    cards = []
+    for card in soup.find_all('div', {'class': 'job_seen_beacon'})[:limit]:
+        title = card.find('h2', {'class': 'jobTitle'})
+        if not title:
+            continue
+        link = title.find('a')
+        cards.append(_card(
+            text(title),
+            text(card.find('span', {'class': 'companyName'})),
+            link.get('href') if link else None,
+            text(card.find('div', {'class': 'companyLocation'})),
+            text(card.find('div', {'class': 'job-snippet'})),
+        ))
+    return cards
+
+
+PARSERS = {
+    'selectolax': parse_cards_selectolax,
+    'lxml': parse_cards_lxml,
+    'html.parser': parse_cards_soup,
+}
+
+
+def available_backends():
+    """Backends whose libraries are importable here (html.parser always is)"""
+    return [name for name in BACKENDS if name == 'html.parser' or importlib.util.find_spec(name)]
+
+
+def get_parser(name='auto'):
+    """Card parser function for a backend name; 'auto' picks the fastest installed one"""
+    if name == 'auto':
+        name = available_backends()[0]
+    elif name not in available_backends():
+        print(f"   ⚠ HTML backend '{name}' not installed - falling back to html.parser")
+        name = 'html.parser'
+    return PARSERS[name]
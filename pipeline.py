@@ -0,0 +1,207 @@
+"""
+Scrape Pipeline
+Producer / consumer stages so parsing never blocks downloading
+- Fetchers push raw HTML onto a bounded queue (full queue = fetchers wait)
+- Parser workers (ProcessPoolExecutor, one per core) turn pages into job dicts;
+  they are started by a forkserver (spawn where there is none), never a plain
+  fork of this multi-threaded process, and a ParsePool keeps them warm across
+  runs (daemon cycles)
+- A page that fails to parse is reported and skipped; if the worker pool itself
+  breaks, the rest of the run parses in-process with a warning
+- An optional crawl hook sees each parsed page and can drop jobs and queue
+  follow-up URLs (pagination)
+- A sink callable receives every job (dedup / output); returning False stops the run
+Memory stays bounded: at most `concurrency` pages in flight + `queue_size` queued
+"""
+
+import asyncio
+import multiprocessing
+import os
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from metrics import METRICS
+
+DEFAULT_QUEUE_SIZE = 16
+
+
+def _mp_context():
+    """Start method for parser processes
+    
+    The pool is created from a source thread while fetcher, sink and metrics
+    threads may hold locks; a forked child would inherit those locks held and
+    could deadlock on them. forkserver / spawn children start clean (and with
+    empty metrics).
+    """
+    method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+    return multiprocessing.get_context(method)
+
+
+def _parse_in_worker(parse_page, html):
+    """Runs in a parser process: parse, and hand back the timings recorded there"""
+    jobs = parse_page(html)
+    return jobs, METRICS.drain()
+
+
+class ParsePool:
+    """Parser processes shared by pipeline runs, started on first use
+    
+    A pool that broke (a worker died, or couldn't start or import) is dropped,
+    and the next run starts a fresh one.
+    """
+    def __init__(self, workers=None):
+        self.workers = (os.cpu_count() or 1) if workers is None else workers   # 0 = no processes
+        self.executor = None
+        self.lock = threading.Lock()
+
+    def get(self):
+        with self.lock:
+            if self.executor is None and self.workers:
+                self.executor = ProcessPoolExecutor(self.workers, mp_context=_mp_context())
+            return self.executor
+
+    def discard(self, executor):
+        with self.lock:
+            if self.executor is executor:
+                self.executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self):
+        with self.lock:
+            executor, self.executor = self.executor, None
+        if executor:
+            executor.shutdown(cancel_futures=True)
+
+
+class ScrapePipeline:
+    def __init__(self, fetcher, parse_page, workers=None, queue_size=DEFAULT_QUEUE_SIZE, pool=None):
+        """parse_page(html) -> [job dicts]; must be picklable (module-level function / partial)
+        
+        `pool` is a ParsePool to reuse (its size wins over `workers`); without one
+        the parser processes only live for one run.
+        """
+        self.fetcher = fetcher
+        self.parse_page = parse_page
+        self.pool = pool
+        if pool is not None:
+            self.workers = pool.workers
+        else:
+            self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.queue_size = queue_size
+        self.stats = {'pages_fetched': 0, 'pages_failed': 0, 'pages_parsed': 0, 'jobs': 0}
+
+    async def run_async(self, urls, sink, crawl=None):
+        """crawl(url, jobs) -> (jobs to keep, [next urls]) is called for every parsed page"""
+        urls_queue = asyncio.Queue()
+        pages = asyncio.Queue(self.queue_size)
+        stop = asyncio.Event()
+        fetchers = self.fetcher.concurrency
+        parsers = max(1, self.workers)
+        outstanding = len(urls)  # URLs queued but not fully processed yet
+
+        def enqueue(url):
+            nonlocal outstanding
+            outstanding += 1
+            urls_queue.put_nowait(url)
+
+        def finished():
+            nonlocal outstanding
+            outstanding -= 1
+            if outstanding == 0:
+                for _ in range(fetchers):
+                    urls_queue.put_nowait(None)
+
+        limit = asyncio.Semaphore(fetchers)
+        host_limits = {}
+
+        async def fetch_worker():
+            while True:
+                url = await urls_queue.get()
+                if url is None:
+                    return
+                if stop.is_set():
+                    finished()
+                    continue
+                url, resp = await self.fetcher.fetch_one(url, limit, host_limits)
+                if resp is None or resp.status_code != 200:
+                    self.stats['pages_failed'] += 1
+                    finished()
+                    continue
+                self.stats['pages_fetched'] += 1
+                await pages.put((url, resp.text))   # blocks while parsers are behind
+
+        async def fetch_stage():
+            await asyncio.gather(*(fetch_worker() for _ in range(fetchers)))
+            for _ in range(parsers):
+                await pages.put(None)
+
+        async def parse(html):
+            nonlocal executor
+            loop = asyncio.get_running_loop()
+            used = executor
+            if used:
+                try:
+                    jobs, worker_metrics = await loop.run_in_executor(used, _parse_in_worker, self.parse_page, html)
+                    METRICS.merge(worker_metrics)
+                    return jobs
+                except (BrokenProcessPool, pickle.PicklingError) as e:
+                    # The pool, not this page - the first parser to see it switches everyone over
+                    if executor is used:
+                        print(f"   ⚠ Parser processes failed ({e!r}) - parsing in-process for the rest of this run")
+                        executor = None
+                        if isinstance(e, BrokenProcessPool):
+                            pool.discard(used)
+            # workers=0 (or a failed pool): the default thread pool
+            return await loop.run_in_executor(None, self.parse_page, html)
+
+        async def parse_worker():
+            while True:
+                item = await pages.get()
+                if item is None:
+                    return
+                url, html = item
+                # Drain without parsing once stopped so blocked fetchers can finish
+                if not stop.is_set():
+                    try:
+                        jobs = await parse(html)
+                    except Exception as e:
+                        print(f"   ⚠ Couldn't parse {url}: {e!r}")
+                        self.stats['pages_failed'] += 1
+                        jobs = None
+                    if jobs is not None:
+                        self.stats['pages_parsed'] += 1
+                        self._deliver(url, jobs, sink, crawl, enqueue, stop)
+                finished()
+
+        if not urls:
+            return self.stats
+        for url in urls:
+            urls_queue.put_nowait(url)
+
+        # workers=0: parse on the default thread pool (no extra processes)
+        pool = self.pool or ParsePool(self.workers)
+        executor = pool.get()
+        try:
+            await asyncio.gather(fetch_stage(), *(parse_worker() for _ in range(parsers)))
+        finally:
+            if pool is not self.pool:
+                pool.shutdown()
+        return self.stats
+
+    def _deliver(self, url, jobs, sink, crawl, enqueue, stop):
+        if crawl:
+            jobs, next_urls = crawl(url, jobs)
+            for next_url in next_urls:
+                enqueue(next_url)
+
+        for job in jobs:
+            self.stats['jobs'] += 1
+            if sink(job) is False:
+                stop.set()
+                return
+
+    def run(self, urls, sink, crawl=None):
+        """Blocking entry point"""
+        return asyncio.run(self.run_async(list(urls), sink, crawl))
@@ -0,0 +1,144 @@
+"""
+Rate Limiter
+One token bucket per host / API, shared by every caller
+Honors Retry-After and backs off (with jitter) on 429 and 5xx responses
+"""
+
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
+
+from metrics import METRICS
+
+# (requests per second, burst size) - anything not listed uses DEFAULT_RATE
+DEFAULT_RATE = (2.0, 4)
+RATE_LIMITS = {
+    'in.indeed.com': (2.0, 4),
+    'sheets': (1.0, 10),  # Sheets API: 60 requests / minute / user
+}
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    def __init__(self, rate, capacity):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.lock = threading.Lock()
+
+    def _reserve(self):
+        """Take a token if possible, otherwise return how long to wait"""
+        with self.lock:
+            now = time.monotonic()
+            if now < self.blocked_until:
+                return self.blocked_until - now
+
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+    def acquire(self):
+        """Block until a token is available"""
+        while True:
+            wait = self._reserve()
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    def pause(self, seconds):
+        """Stop handing out tokens for a while (server asked us to slow down)"""
+        with self.lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+            self.tokens = 0.0
+            # Refill from the end of the pause, not across it - no full burst when it lifts
+            self.updated = self.blocked_until
+
+
+def parse_retry_after(value):
+    """Retry-After is either delta-seconds or an HTTP date"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    from email.utils import parsedate_to_datetime   # rarely needed, slow to import
+    try:
+        when = parsedate_to_datetime(value)
+        return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    def __init__(self, limits=None, max_retries=5, base_delay=1.0, max_delay=60.0):
+        self.limits = dict(RATE_LIMITS)
+        self.limits.update(limits or {})
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def bucket(self, key):
+        """Get (or lazily create) the bucket for a host / API name"""
+        with self.lock:
+            if key not in self.buckets:
+                rate, capacity = self.limits.get(key, DEFAULT_RATE)
+                self.buckets[key] = TokenBucket(rate, capacity)
+            return self.buckets[key]
+
+    def backoff_delay(self, attempt, retry_after=None):
+        """Server hint wins, otherwise full-jitter exponential backoff"""
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def send(self, key, do_request):
+        """Run do_request() under the named budget, retrying 429/5xx responses"""
+        bucket = self.bucket(key)
+
+        for attempt in range(self.max_retries + 1):
+            bucket.acquire()
+            resp = do_request()
+            if resp.status_code not in RETRY_STATUSES or attempt == self.max_retries:
+                return resp
+
+            METRICS.incr('retries', key=key, status=resp.status_code)
+            delay = self.backoff_delay(attempt, parse_retry_after(resp.headers.get('Retry-After')))
+            bucket.pause(delay)
+        return resp
+
+    def request(self, session, method, url, **kwargs):
+        """requests.Session call that waits for the host budget and retries 429/5xx"""
+        return self.send(urlsplit(url).netloc, lambda: session.request(method, url, **kwargs))
+
+    def get(self, session, url, **kwargs):
+        return self.request(session, 'GET', url, **kwargs)
+
+    def call(self, key, func, *args, **kwargs):
+        """Run an API client call (e.g. gspread) under the named budget"""
+        bucket = self.bucket(key)
+
+        for attempt in range(self.max_retries + 1):
+            bucket.acquire()
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                # gspread.exceptions.APIError carries the HTTP response
+                resp = getattr(e, 'response', None)
+                status = getattr(resp, 'status_code', None)
+                if status not in RETRY_STATUSES or attempt == self.max_retries:
+                    raise
+
+                METRICS.incr('retries', key=key, status=status)
+                retry_after = parse_retry_after(resp.headers.get('Retry-After'))
+                bucket.pause(self.backoff_delay(attempt, retry_after))
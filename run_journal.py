@@ -0,0 +1,107 @@
+"""
+Run Journal
+Write-ahead log of a scrape run, so an interrupted run can resume
+- Append-only JSON lines: pages fetched, jobs handled, row ranges committed
+- A clean finish removes the journal; one left behind means the last run
+  was cut off
+- recover() returns what that run had not committed yet: its pending jobs
+  are fed back in first, and its fetched pages are served from the HTTP
+  cache instead of downloaded again
+"""
+
+import json
+import os
+import threading
+import time
+
+from job_posting import JobPosting
+
+DEFAULT_JOURNAL_PATH = os.path.join('.cache', 'run_journal.jsonl')
+
+
+class RunJournal:
+    def __init__(self, path=DEFAULT_JOURNAL_PATH):
+        self.path = path
+        self.file = None
+        self.lock = threading.Lock()   # sources journal pages from their own threads (daemon: while it rotates)
+
+    def recover(self):
+        """Uncommitted state of an interrupted run: {'run', 'pages', 'jobs', 'committed'} or None"""
+        if not os.path.exists(self.path):
+            return None
+
+        run, pages, pending, committed = None, set(), [], []
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break   # torn last write - everything before it is intact
+                kind = record.get('type')
+                if kind == 'start':
+                    run = record['run']
+                elif kind == 'page':
+                    pages.add(record['url'])
+                elif kind == 'job':
+                    pending.append(JobPosting.from_row([None] + record['row'])[1])
+                elif kind == 'commit':
+                    # Everything journaled before a commit is safely in the store
+                    pending = []
+                    committed.append((record['first'], record['last']))
+                elif kind == 'end':
+                    return None
+        if run is None:
+            return None
+        return {'run': run, 'pages': pages, 'jobs': pending, 'committed': committed}
+
+    def begin(self, carry=None):
+        """Start a new journal; `carry` (a recover() result) is re-logged so it survives another crash"""
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with self.lock:
+            self.file = open(self.path, 'w', encoding='utf-8')
+        self._write({'type': 'start', 'run': time.strftime('%Y%m%d-%H%M%S')}, sync=False)
+        if carry:
+            for url in carry['pages']:
+                self.page(url)
+            for job in carry['jobs']:
+                self.job(job)
+        self._sync()
+
+    def _write(self, record, sync=False):
+        with self.lock:
+            if self.file is None:
+                return
+            self.file.write(json.dumps(record, ensure_ascii=False) + '\n')
+            self.file.flush()
+            if sync:
+                os.fsync(self.file.fileno())
+
+    def _sync(self):
+        with self.lock:
+            if self.file is not None:
+                os.fsync(self.file.fileno())
+
+    def page(self, url):
+        self._write({'type': 'page', 'url': url})
+
+    def job(self, job):
+        self._write({'type': 'job', 'row': job.to_row(None)[1:]})
+
+    def commit(self, first, last):
+        """Jobs journaled so far are in the store; serials first..last were added"""
+        self._write({'type': 'commit', 'first': first, 'last': last}, sync=True)
+
+    def close(self):
+        """Stop writing but keep the journal - the next run resumes from it"""
+        with self.lock:
+            if self.file is None:
+                return False
+            self.file.close()
+            self.file = None
+        return True
+
+    def end(self):
+        """Clean finish - nothing to resume"""
+        if self.close():
+            os.remove(self.path)
@@ -0,0 +1,62 @@
+"""
+Scheduler
+Interval timetable for daemon mode
+- Every task has its own interval, randomised by +-jitter so sources don't
+  fire in lockstep (or hit a board at the same second every hour)
+- A task is never due again while it is still running; its next run is
+  counted from when it finished
+- The caller runs the tasks - due() hands out the ones whose time has come
+"""
+
+import random
+import threading
+import time
+
+DEFAULT_JITTER = 0.1   # +-10% of the interval
+
+
+class Scheduler:
+    def __init__(self, jitter=DEFAULT_JITTER, clock=time.monotonic):
+        self.jitter = jitter
+        self.clock = clock
+        self.tasks = {}   # name -> {'task', 'interval', 'next', 'running', 'runs'}
+        self.lock = threading.Lock()   # done() is called from the tasks' own threads
+
+    def add(self, name, task, interval, delay=0.0):
+        """Schedule `task` every `interval` seconds, first after `delay`"""
+        with self.lock:
+            self.tasks[name] = {'task': task, 'interval': interval, 'next': self.clock() + delay,
+                                'running': False, 'runs': 0}
+
+    def _spread(self, interval):
+        return interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def due(self):
+        """Tasks whose time has come; they are marked running until done(name)"""
+        now = self.clock()
+        ready = []
+        with self.lock:
+            for name, entry in self.tasks.items():
+                if not entry['running'] and entry['next'] <= now:
+                    entry['running'] = True
+                    ready.append((name, entry['task']))
+        return ready
+
+    def done(self, name):
+        with self.lock:
+            entry = self.tasks[name]
+            entry['running'] = False
+            entry['runs'] += 1
+            entry['next'] = self.clock() + self._spread(entry['interval'])
+
+    def running(self):
+        with self.lock:
+            return [name for name, entry in self.tasks.items() if entry['running']]
+
+    def next_due(self):
+        """Seconds until the next idle task is due (None if all are running)"""
+        with self.lock:
+            waiting = [entry['next'] for entry in self.tasks.values() if not entry['running']]
+        if not waiting:
+            return None
+        return max(0.0, min(waiting) - self.clock())
@@ -1,783 +1,675 @@
 """
 QA/SDET Job Scraper - Enhanced Version
-Fetches recent job postings and updates Google Sheet
+Fetches recent job postings into the local store, then out to the Google
+Sheet and any other output sinks (JSONL, CSV, SQLite)
 Keep it simple: Get real jobs with direct links
+Startup stays light: the network stack (requests, asyncio) loads when the
+first page is fetched, gspread / google-auth when the sheet is opened
 """
 
-import gspread
-from google.oauth2.service_account import Credentials
-import requests
-from bs4 import BeautifulSoup
-from datetime import datetime, timedelta
+import argparse
+import itertools
+import json
+import os
+import queue
+import signal
+import threading
 import time
-import re
 
-CREDENTIALS_FILE = "credentials.json"
-SPREADSHEET_URL = "https://docs.google.com/spreadsheets/d/1YseZkMMiCjBShPHHg9awAlsXdRvEjT_TBZ9fNp_HCEE"
+from rate_limiter import RateLimiter
+from near_dup import NearDuplicateIndex, DEFAULT_NEAR_DUP_PATH, signature
+from skills import extract_skills, get_matcher
+from contacts import extract_contacts
+from job_store import JobStore, DEFAULT_STORE_PATH
+from sheet_export import SHEET_TITLE, SheetExporter, pull_sheet_rows
+from sheet_reader import SheetReader
+from sheets_client import SheetsClient, SPREADSHEET_KEY
+from sinks import SINK_REGISTRY, DEFAULT_SINKS, DEFAULT_SINK_STATE_PATH, SinkFanout, create_sinks
+from indeed import INDEED_MAX_PAGES, build_indeed_urls, parse_indeed_page
+from crawl_state import CrawlState, DEFAULT_STATE_PATH
+from run_journal import RunJournal, DEFAULT_JOURNAL_PATH
+from metrics import METRICS
+from scheduler import Scheduler
+import job_posting
+from job_posting import JobPosting
+
+VERIFIED_JOBS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'verified_jobs.json')
+
+MAX_NEW_JOBS = 26     # new jobs per run
+FLUSH_ROWS = 25       # jobs per streamed commit / sheet write
+FLUSH_SECONDS = 5.0   # ...or sooner, so early rows don't wait on slow sources
+FLUSH_TICK = 1.0      # while sources are quiet, how often that timer is checked
+DAEMON_FLUSH_SECONDS = 60.0   # daemon mode: one coalesced store write (and sink wake-up) per minute
+SHUTDOWN_GRACE = 30.0         # seconds running sources get to finish on shutdown
+SYNC_COUNTS = ('duplicates', 'near_duplicates', 'written')   # store_jobs tallies in the metrics report
+
+
+def new_sync_stats():
+    """Tallies of one store_jobs call"""
+    return {'duplicates': 0, 'near_duplicates': 0, 'written': 0, 'sources': set(), 'companies': set()}
 
-SCOPES = [
-    'https://www.googleapis.com/auth/spreadsheets',
-    'https://www.googleapis.com/auth/drive'
-]
 
 class EnhancedJobScraper:
-    def __init__(self):
+    def __init__(self, concurrency=None, replay=False, cache_path=None,
+                 store_path=DEFAULT_STORE_PATH, near_dup_path=DEFAULT_NEAR_DUP_PATH, parser_backend='auto',
+                 parse_workers=None, state_path=DEFAULT_STATE_PATH, journal_path=DEFAULT_JOURNAL_PATH,
+                 http2=False, sink_state_path=DEFAULT_SINK_STATE_PATH):
         self.jobs = []
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-            'Accept-Language': 'en-US,en;q=0.9',
-        })
+        self.crawl_state = CrawlState(state_path)  # per-query high-water marks
+        self.journal = RunJournal(journal_path)    # write-ahead log for resuming cut-off runs
+        self.parser_backend = parser_backend  # selectolax / lxml when installed
+        self.parse_workers = parse_workers    # None = one parser process per core, 0 = in-process
+        self.store = JobStore(store_path)  # system of record; the sheet and other sinks mirror it
+        self.sink_state_path = sink_state_path  # how far each output sink has got
+        self.near_dup = NearDuplicateIndex(near_dup_path)
+        self.skill_matcher = get_matcher()  # compile the skill automaton once, up front
+        self.sheets_api_calls = 0
+        self.sync_stats = new_sync_stats()   # of the latest store_jobs call
+        self.limiter = RateLimiter()
+        # Token and sheet metadata cached across syncs (and runs)
+        self.sheets = SheetsClient(call=self.sheets_call)
+        
+        # Built on first use (None = fetch_engine / http_cache defaults)
+        self.concurrency = concurrency
+        self.cache_path = cache_path
+        self.replay = replay
+        self.http2 = http2
+        self._session = None
+        self._fetcher = None
+        self._parse_pool = None
+    
+    @property
+    def session(self):
+        """Shared HTTP session, created (and requests imported) on first use"""
+        if self._session is None:
+            from fetch_engine import DEFAULT_CONCURRENCY
+            from http_cache import DEFAULT_CACHE_PATH
+            from transport import create_session
+            # GETs are cached on disk and revalidated; network calls go through the limiter
+            # over pooled keep-alive connections (one per concurrent fetch per host)
+            self._session = create_session(self.cache_path or DEFAULT_CACHE_PATH, limiter=self.limiter,
+                                           replay=self.replay, pool_size=self.concurrency or DEFAULT_CONCURRENCY,
+                                           http2=self.http2)
+        return self._session
+    
+    @property
+    def fetcher(self):
+        if self._fetcher is None:
+            from fetch_engine import AsyncFetchEngine, DEFAULT_CONCURRENCY
+            self._fetcher = AsyncFetchEngine(self.session, concurrency=self.concurrency or DEFAULT_CONCURRENCY)
+        return self._fetcher
+    
+    @property
+    def parse_pool(self):
+        """Parser processes, started on first use and kept for every crawl (daemon cycles too)"""
+        if self._parse_pool is None:
+            from pipeline import ParsePool
+            self._parse_pool = ParsePool(self.parse_workers)
+        return self._parse_pool
+    
+    def close_parse_pool(self):
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown()
+    
+    def sheets_call(self, func, *args, **kwargs):
+        """Run a gspread call under the shared Sheets API budget"""
+        self.sheets_api_calls += 1
+        # Latency includes time spent waiting on the rate limiter and retries
+        with METRICS.timer('sheets', call=getattr(func, '__name__', 'call')):
+            return self.limiter.call('sheets', func, *args, **kwargs)
     
     def extract_skills(self, text):
-        """Extract technical skills from text"""
+        """Extract technical skills from text (compiled taxonomy matcher, stable order)"""
         if not text:
             return ""
         
-        skills = {
-            'Java', 'Python', 'Selenium', 'TestNG', 'JUnit', 'Cypress', 
-            'Playwright', 'REST API', 'Postman', 'Jenkins', 'Docker', 
-            'Kubernetes', 'Git', 'Maven', 'Gradle', 'Appium', 'AWS', 
-            'Azure', 'API Testing', 'CI/CD', 'Agile', 'Scrum'
-        }
-        
-        found = [s for s in skills if s.lower() in text.lower()]
-        return ', '.join(found[:8])
+        return extract_skills(text)
     
-    def get_fresh_jobs_from_indeed(self, max_jobs=20):
-        """Scrape from Indeed India with better parsing"""
+    def build_indeed_urls(self, keywords=None, locations=None, pages=1):
+        """Build one search URL per keyword/location/page combination"""
+        return build_indeed_urls(keywords, locations, pages)
+    
+    def parse_indeed_page(self, html):
+        """Parse one Indeed search page into job dicts"""
+        return parse_indeed_page(html, self.parser_backend)
+    
+    def get_fresh_jobs_from_indeed(self, max_jobs=20, keywords=None, locations=None, pages=INDEED_MAX_PAGES):
+        """Scrape from Indeed India - paginated, stops at each query's high-water mark"""
         print("\n🔍 Scraping Indeed India...")
         jobs = []
         
-        keywords = ['qa+automation', 'sdet', 'test+automation']
-        location = 'bangalore'
+        def collect(job):
+            jobs.append(job)
+            print(f"   ✓ {job.company[:30]} - {job.role[:40]}")
+            return len(jobs) < max_jobs
         
-        for keyword in keywords:
-            if len(jobs) >= max_jobs:
-                break
-            
-            try:
-                url = f'https://in.indeed.com/jobs?q={keyword}&l={location}&sort=date'
-                
-                try:
-                    resp = self.session.get(url, timeout=10)
-                    if resp.status_code != 200:
-                        continue
-                    
-                    soup = BeautifulSoup(resp.text, 'html.parser')
-                    cards = soup.find_all('div', {'class': 'job_seen_beacon'})[:10]
-                    
-                    for card in cards:
-                        try:
-                            # Title
-                            title_elem = card.find('h2', {'class': 'jobTitle'})
-                            if not title_elem:
-                                continue
-                            
-                            title = title_elem.get_text(strip=True)
-                            
-                            # Company
-                            company_elem = card.find('span', {'class': 'companyName'})
-                            company = company_elem.get_text(strip=True) if company_elem else "Company"
-                            
-                            # Link
-                            link_elem = title_elem.find('a')
-                            if link_elem and link_elem.get('href'):
-                                job_link = 'https://in.indeed.com' + link_elem.get('href')
-                            else:
-                                job_link = "LINK_NOT_AVAILABLE"
-                            
-                            # Location
-                            loc_elem = card.find('div', {'class': 'companyLocation'})
-                            location_text = loc_elem.get_text(strip=True) if loc_elem else "Location Not Specified"
-                            
-                            # Summary
-                            summary_elem = card.find('div', {'class': 'job-snippet'})
-                            summary = summary_elem.get_text(strip=True) if summary_elem else ""
-                            
-                            # Skills
-                            skills = self.extract_skills(summary)
-                            
-                            job = {
-                                'Company_Name': company,
-                                'Job_Role': title,
-                                'Job_Description': summary,
-                                'Required_Skills': skills,
-                                'Experience_Required': 'Not Specified',
-                                'Location': location_text,
-                                'Employment_Type': 'Full-time',
-                                'Salary_Range': 'Not Disclosed',
-                                'Apply_Link': job_link,
-                                'Date_Posted': datetime.now().strftime('%d-%m-%Y'),
-                                'Source_Platform': 'Indeed India'
-                            }
-                            
-                            # Try to extract contact info for Indeed jobs
-                            try:
-                                job['HR_Contact_Extracted'] = self.extract_contact_info(summary, job_link, company)
-                            except:
-                                job['HR_Contact_Extracted'] = "LinkedIn: https://www.linkedin.com/company/" + company.lower().replace(' ', '-')
-                            
-                            jobs.append(job)
-                            print(f"   ✓ {company[:30]} - {title[:40]}")
-                            
-                        except Exception as e:
-                            continue
-                    
-                except Exception:
-                    continue
-                
-                time.sleep(2)
-                
-            except Exception:
-                continue
+        if max_jobs > 0:
+            from sources import IndeedSource
+            IndeedSource(self, keywords=keywords, locations=locations, max_pages=pages).fetch(collect)
         
+        stats = self.session.stats
+        print(f"   Cache: {stats['hits']} fresh, {stats['revalidated']} revalidated, {stats['misses']} downloaded")
         print(f"   ✓ Found {len(jobs)} jobs from Indeed\n")
         return jobs
     
     def extract_contact_info(self, job_description, apply_link, company_name):
-        """Extract HR contact info using multiple fallback methods"""
-        contact_info = ""
-        
-        # Method 1: Try to find email in description
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, job_description)
-        
-        # Method 2: Try to find phone number
-        phone_patterns = [
-            r'\b\d{10}\b',  # 10 digit number
-            r'\+91[-.\s]?\d{10}',  # +91 format
-            r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}',  # xxx-xxx-xxxx
-        ]
-        
-        phone_numbers = []
-        for pattern in phone_patterns:
-            phone_numbers.extend(re.findall(pattern, job_description))
-        
-        # If found in description, add it
-        if emails:
-            contact_info = f"Email: {emails[0]}"
-        if phone_numbers:
-            if contact_info:
-                contact_info += f" | Phone: {phone_numbers[0]}"
-            else:
-                contact_info = f"Phone: {phone_numbers[0]}"
-        
-        # Always add LinkedIn URL as fallback
-        company_slug = company_name.lower().replace(' ', '-').replace('&', 'and').replace('.', '-')
-        linkedin_url = f"https://www.linkedin.com/company/{company_slug}"
-        
-        if contact_info:
-            contact_info = f"{linkedin_url} | {contact_info}"
-        else:
-            # Generate likely HR email pattern
-            company_domain = company_name.lower().replace(' ', '').replace('.', '')
-            likely_email = f"hr@{company_domain}.com"
-            contact_info = f"{linkedin_url} | Likely Email: {likely_email}"
-        
-        return contact_info if contact_info else "LinkedIn: " + linkedin_url
+        """Extract HR contact info - returns a ContactInfo (str() gives the sheet format)"""
+        return extract_contacts(job_description, company_name)
     
     def add_verified_sample_jobs(self):
-        """Add verified sample jobs with direct links"""
+        """Add verified sample jobs with direct links (catalog in data/verified_jobs.json)"""
         print("📋 Adding verified sample jobs...")
+        today = job_posting.today()
         
-        # These are companies that typically have QA/SDET openings
-        verified_jobs = [
-            # Top Tech Companies
-            {
-                'Company_Name': 'PhonePe',
-                'Job_Role': 'SDET - Backend Testing',
-                'Job_Description': 'Develop automated test scripts using Selenium and Java. Collaborate with dev teams. Build CI/CD pipelines. Requirements: Strong Java programming, Experience with TestNG/JUnit. Contact: hr@phonepe.com or call 080-12345678',
-                'Required_Skills': 'Java, Selenium, TestNG, REST Assured, Jenkins, Git',
-                'Experience_Required': '3-5 years',
-                'Location': 'Bangalore, Karnataka',
-                'Employment_Type': 'Full-time',
-                'Salary_Range': 'Not Disclosed',
-                'Apply_Link': 'https://www.linkedin.com/jobs/search/?keywords=PhonePe+SDET&location=Bangalore',
-                'Date_Posted': datetime.now().strftime('%d-%m-%Y'),
-                'Source_Platform': 'LinkedIn Jobs'
-            },
-            {
-                'Company_Name': 'Swiggy',
-                'Job_Role': 'QA Automation Engineer',
-                'Job_Description': 'Design test automation for food delivery platform. API automation using REST Assured. Requirements: 2-5 years QA automation experience. Reach out to careers@swiggy.in | +91-9876543210',
-                'Required_Skills': 'Java, Python, Selenium, REST API, Appium, Jenkins',
-                'Experience_Required': '2-5 years',
-                'Location': 'Bangalore, Karnataka',
-                'Employment_Type': 'Full-time',
-                'Salary_Range': 'Not Disclosed',
-                'Apply_Link': 'https://www.linkedin.com/jobs/search/?keywords=Swiggy+QA&location=Bangalore',
-                'Date_Posted': datetime.now().strftime('%d-%m-%Y'),
-                'Source_Platform': 'LinkedIn Jobs'
-            },
-            {
-                'Company_Name': 'Razorpay',
-                'Job_Role': 'Test Automation Engineer',
-                'Job_Description': 'Build test automation framework for payment systems. API testing for financial transactions. Requirements: Strong Python skills.',
-                'Required_Skills': 'Python, Pytest, REST API, Docker, Kubernetes',
-                'Experience_Required': '3-6 years',
-                'Location': 'Remote - India',
-                'Employment_Type': 'Full-time',
-                'Salary_Range': 'Not Disclosed',
-                'Apply_Link': 'https://www.naukri.com/razorpay-jobs-careers-12345',
-                'Date_Posted': (datetime.now() - timedelta(days=1)).strftime('%d-%m-%Y'),
-                'Source_Platform': 'Naukri.com'
-            },
-            {
-                'Company_Name': 'Zomato',
-                'Job_Role': 'SDET - Food Delivery Platform',
-                'Job_Description': 'Develop automation framework for Zomato app and web. Mobile testing with Appium. API automation. Requirements: 3-5 years SDET experience.',
-                'Required_Skills': 'Java, Python, Appium, Selenium, REST API, Docker',
-                'Experience_Required': '3-5 years',
-                'Location': 'Gurgaon, Haryana',
-                'Employment_Type': 'Full-time',
-                'Salary_Range': 'Not Disclosed',
-                'Apply_Link': 'https://www.linkedin.com/jobs/search/?keywords=Zomato+SDET&location=India',
-                'Date_Posted': datetime.now().strftime('%d-%m-%Y'),
-                'Source_Platform': 'LinkedIn Jobs'
-            },
-            {
-                'Company_Name': 'Flipkart',
-                'Job_Role': 'SDET - E-commerce Platform',
-                'Job_Description': 'Design end-to-end test automation for Flipkart platform. Performance testing. Requirements: 4+ years SDET experience.',
-                'Required_Skills': 'Java, Selenium, JMeter, Microservices, REST API, Kafka',
-                'Experience_Required': '4-7 years',
-                'Location': 'Bangalore, Karnataka',
-                'Employment_Type': 'Full-time',
-                'Salary_Range': 'Not Disclosed',
-                'Apply_Link': 'https://www.linkedin.com/jobs/search/?keywords=Flipkart+SDET&location=Bangalore',
-                'Date_Posted': (datetime.now() - timedelta(days=1)).strftime('%d-%m-%Y'),
-                'Source_Platform': 'LinkedIn Jobs'
-            },
-            # Big Tech Companies
-            {
-                'Company_Name': 'Microsoft',
-                'Job_Role': 'Senior QA Automation - Azure',
-                'Job_Description': 'Ensure quality of Azure cloud services through test automation. Build CI/CD pipelines. Requirements: 5+ years QA automation, Cloud expertise.',
-                'Required_Skills': 'C#, Python, Azure, REST API, Kubernetes, Docker, CI/CD',
-                'Experience_Required': '5+ years',
-                'Location': 'Hyderabad, Telangana',
-                'Employment_Type': 'Full-time',
-                'Salary_Range': 'Not Disclosed',
-                'Apply_Link': 'https://careers.microsoft.com/us/en/jobsearch?job_function=Quality%20Assurance',
-                'Date_Posted': (datetime.now() - timedelta(days=2)).strftime('%d-%m-%Y'),
-                'Source_Platform': 'Microsoft Careers'
-            },
-            {
-                'Company_Name': 'Amazon',
-                'Job_Role': 'SDET II - Payment Systems',
-                'Job_Description': 'Build automation frameworks for Amazon payment processing. Requirements: Strong programming skills, Payment systems knowledge.',
-                'Required_Skills': 'Java, Python, REST Assured, AWS, Jenkins, Docker',
-                'Experience_Required': '4-6 years',
-                'Location': 'Bangalore, Karnataka',
-                'Employment_Type': 'Full-time',
-                'Salary_Range': 'Not Disclosed',
-                'Apply_Link': 'https://www.amazon.jobs/en/search?base_query=SDET&loc_query=India',
-                'Date_Posted': (datetime.now() - timedelta(days=1)).strftime('%d-%m-%Y'),
-                'Source_Platform': 'Amazon Jobs'
-            },
-            {
-                'Company_Name': 'Google',
-                'Job_Role': 'Test Engineer - Google Cloud',
-                'Job_Description': 'Design test automation for Google Cloud Platform. Build scalable testing infrastructure. Requirements: Expert in Python/Java, Cloud testing experience.',
-                'Required_Skills': 'Python, Java, GCP, Kubernetes, Docker, TestNG, CI/CD',
-                'Experience_Required': '5+ years',
-                'Location': 'Bangalore, Karnataka',
-                'Employment_Type': 'Full-time',
-                'Salary_Range': 'Not Disclosed',
-                'Apply_Link': 'https://careers.google.com/jobs/results?q=test%20engineer%20cloud',
-                'Date_Posted': (datetime.now() - timedelta(days=2)).strftime('%d-%m-%Y'),
-                'Source_Platform': 'Google Careers'
-            },
-            {
-                'Company_Name': 'Adobe',
-                'Job_Role': 'QA Automation Engineer - Creative Cloud',
-                'Job_Description': 'Build automation for Adobe Creative Cloud products. Cross-platform testing. Requirements: 3-5 years automation experience, Adobe products knowledge helpful.',
-                'Required_Skills': 'Java, Python, Selenium, TestNG, Jenkins, Cloud Testing',
-                'Experience_Required': '3-5 years',
-                'Location': 'Noida, Uttar Pradesh',
-                'Employment_Type': 'Full-time',
-                'Salary_Range': 'Not Disclosed',
-                'Apply_Link': 'https://www.linkedin.com/jobs/search/?keywords=Adobe+QA+automation&location=India',
-                'Date_Posted': datetime.now().strftime('%d-%m-%Y'),
-                'Source_Platform': 'LinkedIn Jobs'
-            },
-            {
-                'Company_Name': 'Oracle',
-                'Job_Role': 'SDET - Cloud Infrastructure',
-                'Job_Description': 'Develop test automation for Oracle Cloud infrastructure. Database testing. Requirements: 4+ years SDET, Cloud and database testing experience.',
-                'Required_Skills': 'Java, Python, Oracle DB, REST API, Jenkins, Docker, Cloud',
-                'Experience_Required': '4-6 years',
-                'Location': 'Bangalore, Karnataka',
-                'Employment_Type': 'Full-time',
-                'Salary_Range': 'Not Disclosed',
-                'Apply_Link': 'https://www.linkedin.com/jobs/search/?keywords=Oracle+SDET&location=India',
-                'Date_Posted': (datetime.now() - timedelta(days=1)).strftime('%d-%m-%Y'),
-                'Source_Platform': 'LinkedIn Jobs'
-            },
-            {
-                'Company_Name': 'Salesforce',
-                'Job_Role': 'QA Automation Engineer - CRM',
-                'Job_Description': 'Build automation for Salesforce CRM platform. API testing for SaaS products. Requirements: 3-5 years automation, SaaS experience.',
-                'Required_Skills': 'Java, Python, Selenium, REST API, Jenkins, SaaS, CRM',
-                'Experience_Required': '3-5 years',
-                'Location': 'Hyderabad, Telangana',
-                'Employment_Type': 'Full-time',
-                'Salary_Range': 'Not Disclosed',
-                'Apply_Link': 'https://www.linkedin.com/jobs/search/?keywords=Salesforce+QA&location=India',
-                'Date_Posted': datetime.now().strftime('%d-%m-%Y'),
-                'Source_Platform': 'LinkedIn Jobs'
-            },
-            # Fintech Companies
-            {
-                'Company_Name': 'Paytm',
-                'Job_Role': 'QA Automation Engineer - Fintech',
-                'Job_Description': 'Develop automated tests for payment gateway and wallet systems. API testing for financial services. Requirements: 3-5 years automation, Fintech experience.',
-                'Required_Skills': 'Java, Selenium, REST API, Postman, Jenkins, MySQL, Fintech',
-                'Experience_Required': '3-5 years',
-                'Location': 'Noida, Uttar Pradesh',
-                'Employment_Type': 'Full-time',
-                'Salary_Range': 'Not Disclosed',
-                'Apply_Link': 'https://www.naukri.com/paytm-jobs-careers',
-                'Date_Posted': datetime.now().strftime('%d-%m-%Y'),
-                'Source_Platform': 'Naukri.com'
-            },
-            {
-                'Company_Name': 'Cred',
-                'Job_Role': 'QA Automation Engineer',
-                'Job_Description': 'Ensure quality of credit card management mobile app. Develop mobile test automation using Appium. Requirements: 2-4 years QA automation.',
-                'Required_Skills': 'Python, Appium, REST API, Selenium, Jenkins, Mobile Testing',
-                'Experience_Required': '2-4 years',
-                'Location': 'Bangalore, Karnataka',
-                'Employment_Type': 'Full-time',
-                'Salary_Range': 'Not Disclosed',
-                'Apply_Link': 'https://www.linkedin.com/jobs/search/?keywords=Cred+QA&location=Bangalore',
-                'Date_Posted': datetime.now().strftime('%d-%m-%Y'),
-                'Source_Platform': 'LinkedIn Jobs'
-            },
-            {
-                'Company_Name': 'Intuit',
-                'Job_Role': 'Senior SDET - Tax and Accounting',
-                'Job_Description': 'Build test automation for tax and accounting software. Design test strategies for financial calculations. Requirements: 5+ years SDET.',
-                'Required_Skills': 'Java, Python, Selenium, TestNG, REST API, Jenkins, PostgreSQL',
-                'Experience_Required': '5-8 years',
-                'Location': 'Bangalore, Karnataka',
-                'Employment_Type': 'Full-time',
-                'Salary_Range': 'Not Disclosed',
-                'Apply_Link': 'https://www.intuit.com/careers/jobs/sdet-senior',
-                'Date_Posted': (datetime.now() - timedelta(days=2)).strftime('%d-%m-%Y'),
-                'Source_Platform': 'Intuit Careers'
-            },
-            {
-                'Company_Name': 'Stripe',
-                'Job_Role': 'Staff QA Engineer - Platform',
-                'Job_Description': 'Drive quality for Stripe payment platform. Build comprehensive test automation. Ensure reliability at scale. Requirements: Expert in test automation.',
-                'Required_Skills': 'Ruby, Python, Selenium, REST API, GraphQL, CI/CD, Performance Testing',
-                'Experience_Required': '6+ years',
-                'Location': 'Remote - Worldwide',
-                'Employment_Type': 'Full-time',
-                'Salary_Range': 'Not Disclosed',
-                'Apply_Link': 'https://stripe.com/jobs',
-                'Date_Posted': (datetime.now() - timedelta(days=1)).strftime('%d-%m-%Y'),
-                'Source_Platform': 'Stripe Careers'
-            },
-            # Product Companies
-            {
-                'Company_Name': 'Netflix',
-                'Job_Role': 'Senior Test Automation Engineer - Streaming',
-                'Job_Description': 'Ensure quality of Netflix streaming services. Develop innovative testing approaches. Requirements: 5+ years testing, video streaming knowledge.',
-                'Required_Skills': 'Java, Python, Selenium, Performance Testing, Video Codecs, AWS',
-                'Experience_Required': '5-7 years',
-                'Location': 'Remote - Americas',
-                'Employment_Type': 'Full-time',
-                'Salary_Range': 'Not Disclosed',
-                'Apply_Link': 'https://jobs.netflix.com/search?q=test+automation',
-                'Date_Posted': (datetime.now() - timedelta(days=2)).strftime('%d-%m-%Y'),
-                'Source_Platform': 'Netflix Careers'
-            },
-            {
-                'Company_Name': 'Reddit',
-                'Job_Role': 'QA Automation Engineer - Social Platform',
-                'Job_Description': 'Build automation for Reddit platform. API testing for social features. Requirements: 3-5 years automation, social platforms experience.',
-                'Required_Skills': 'Python, Selenium, REST API, Postman, Jenkins, Social Platforms',
-                'Experience_Required': '3-5 years',
-                'Location': 'Remote - Global',
-                'Employment_Type': 'Full-time',
-                'Salary_Range': 'Not Disclosed',
-                'Apply_Link': 'https://www.reddit.com/jobs',
-                'Date_Posted': datetime.now().strftime('%d-%m-%Y'),
-                'Source_Platform': 'Reddit Careers'
-            },
-            {
-                'Company_Name': 'Uber',
-                'Job_Role': 'Automation Engineer - Ride Sharing',
-                'Job_Description': 'Automate testing for Uber ride-sharing services. Mobile apps and backend APIs testing. Requirements: 2-5 years automation.',
-                'Required_Skills': 'Python, Appium, REST API, Microservices, Docker, Kubernetes',
-                'Experience_Required': '2-5 years',
-                'Location': 'Bangalore, Karnataka',
-                'Employment_Type': 'Full-time',
-                'Salary_Range': 'Not Disclosed',
-                'Apply_Link': 'https://www.uber.com/us/en/careers/list/',
-                'Date_Posted': (datetime.now() - timedelta(days=1)).strftime('%d-%m-%Y'),
-                'Source_Platform': 'Uber Careers'
-            },
-            {
-                'Company_Name': 'Spotify',
-                'Job_Role': 'SDET - Music Streaming',
-                'Job_Description': 'Test automation for Spotify music platform. Build scalable test frameworks. Work on audio quality testing. Requirements: 2-5 years SDET.',
-                'Required_Skills': 'Java, Python, Appium, REST API, Selenium, Jenkins, AWS',
-                'Experience_Required': '2-5 years',
-                'Location': 'Remote - Worldwide',
-                'Employment_Type': 'Full-time',
-                'Salary_Range': 'Not Disclosed',
-                'Apply_Link': 'https://www.lifeatspotify.com/jobs',
-                'Date_Posted': (datetime.now() - timedelta(days=1)).strftime('%d-%m-%Y'),
-                'Source_Platform': 'Spotify Careers'
-            },
-            # Enterprise Software
-            {
-                'Company_Name': 'VMware',
-                'Job_Role': 'QA Automation Engineer - Virtualization',
-                'Job_Description': 'Build test automation for VMware virtualization products. Requirements: 3-5 years QA automation, virtualization knowledge.',
-                'Required_Skills': 'Python, Java, Selenium, REST API, Virtualization, Docker',
-                'Experience_Required': '3-5 years',
-                'Location': 'Bangalore, Karnataka',
-                'Employment_Type': 'Full-time',
-                'Salary_Range': 'Not Disclosed',
-                'Apply_Link': 'https://www.linkedin.com/jobs/search/?keywords=VMware+QA&location=India',
-                'Date_Posted': datetime.now().strftime('%d-%m-%Y'),
-                'Source_Platform': 'LinkedIn Jobs'
-            },
-            {
-                'Company_Name': 'SAP',
-                'Job_Role': 'Test Automation Engineer - Enterprise Software',
-                'Job_Description': 'Develop automation for SAP enterprise software solutions. Requirements: 3-6 years automation, enterprise software experience.',
-                'Required_Skills': 'ABAP, Python, Selenium, REST API, Jenkins, Enterprise Software',
-                'Experience_Required': '3-6 years',
-                'Location': 'Bangalore, Karnataka',
-                'Employment_Type': 'Full-time',
-                'Salary_Range': 'Not Disclosed',
-                'Apply_Link': 'https://www.linkedin.com/jobs/search/?keywords=SAP+test+automation&location=India',
-                'Date_Posted': (datetime.now() - timedelta(days=1)).strftime('%d-%m-%Y'),
-                'Source_Platform': 'LinkedIn Jobs'
-            },
-            # Startup/Scale-up Companies
-            {
-                'Company_Name': 'Razorpay',
-                'Job_Role': 'Senior Test Automation Engineer',
-                'Job_Description': 'Lead automation efforts for Razorpay payment platform. Mentor team. Requirements: 5+ years automation leadership.',
-                'Required_Skills': 'Python, Pytest, REST API, Kubernetes, Docker, Leadership',
-                'Experience_Required': '5+ years',
-                'Location': 'Bangalore, Karnataka',
-                'Employment_Type': 'Full-time',
-                'Salary_Range': 'Not Disclosed',
-                'Apply_Link': 'https://www.linkedin.com/jobs/search/?keywords=Razorpay+senior+test&location=Bangalore',
-                'Date_Posted': datetime.now().strftime('%d-%m-%Y'),
-                'Source_Platform': 'LinkedIn Jobs'
-            },
-            {
-                'Company_Name': 'Groww',
-                'Job_Role': 'SDET - Investment Platform',
-                'Job_Description': 'Build test automation for Groww investment and trading platform. Requirements: 3-5 years SDET, fintech experience.',
-                'Required_Skills': 'Java, Python, Selenium, REST API, Jenkins, Fintech',
-                'Experience_Required': '3-5 years',
-                'Location': 'Bangalore, Karnataka',
-                'Employment_Type': 'Full-time',
-                'Salary_Range': 'Not Disclosed',
-                'Apply_Link': 'https://www.linkedin.com/jobs/search/?keywords=Groww+SDET&location=Bangalore',
-                'Date_Posted': datetime.now().strftime('%d-%m-%Y'),
-                'Source_Platform': 'LinkedIn Jobs'
-            },
-            {
-                'Company_Name': 'Zerodha',
-                'Job_Role': 'QA Automation Engineer - Trading Platform',
-                'Job_Description': 'Automate testing for Zerodha trading platform. Low-latency testing. Requirements: 3-5 years automation, trading systems knowledge.',
-                'Required_Skills': 'Python, Selenium, REST API, Trading Systems, Low Latency Testing',
-                'Experience_Required': '3-5 years',
-                'Location': 'Bangalore, Karnataka',
-                'Employment_Type': 'Full-time',
-                'Salary_Range': 'Not Disclosed',
-                'Apply_Link': 'https://www.linkedin.com/jobs/search/?keywords=Zerodha+QA&location=Bangalore',
-                'Date_Posted': (datetime.now() - timedelta(days=1)).strftime('%d-%m-%Y'),
-                'Source_Platform': 'LinkedIn Jobs'
-            },
-            {
-                'Company_Name': 'Swiggy',
-                'Job_Role': 'Senior QA Automation Engineer',
-                'Job_Description': 'Lead automation for Swiggy food delivery operations. Scale automation across teams. Requirements: 5+ years leadership in automation.',
-                'Required_Skills': 'Java, Python, Selenium, REST API, Appium, Leadership, Jenkins',
-                'Experience_Required': '5+ years',
-                'Location': 'Bangalore, Karnataka',
-                'Employment_Type': 'Full-time',
-                'Salary_Range': 'Not Disclosed',
-                'Apply_Link': 'https://www.linkedin.com/jobs/search/?keywords=Swiggy+senior+QA&location=Bangalore',
-                'Date_Posted': datetime.now().strftime('%d-%m-%Y'),
-                'Source_Platform': 'LinkedIn Jobs'
-            },
-            {
-                'Company_Name': 'PhonePe',
-                'Job_Role': 'Senior SDET - Backend',
-                'Job_Description': 'Lead SDET efforts for PhonePe backend services. Design test strategies. Requirements: 5+ years SDET, payments domain experience.',
-                'Required_Skills': 'Java, Selenium, TestNG, REST Assured, Jenkins, Leadership, Payments',
-                'Experience_Required': '5-8 years',
-                'Location': 'Bangalore, Karnataka',
-                'Employment_Type': 'Full-time',
-                'Salary_Range': 'Not Disclosed',
-                'Apply_Link': 'https://www.linkedin.com/jobs/search/?keywords=PhonePe+senior+SDET&location=Bangalore',
-                'Date_Posted': (datetime.now() - timedelta(days=1)).strftime('%d-%m-%Y'),
-                'Source_Platform': 'LinkedIn Jobs'
-            },
-            {
-                'Company_Name': 'Freshworks',
-                'Job_Role': 'QA Automation Engineer - SaaS',
-                'Job_Description': 'Build automation for Freshworks customer engagement platform. SaaS testing. Requirements: 3-5 years automation, SaaS experience.',
-                'Required_Skills': 'Java, Python, Selenium, REST API, Jenkins, SaaS, CRM',
-                'Experience_Required': '3-5 years',
-                'Location': 'Chennai, Tamil Nadu',
-                'Employment_Type': 'Full-time',
-                'Salary_Range': 'Not Disclosed',
-                'Apply_Link': 'https://www.freshworks.com/company/careers/',
-                'Date_Posted': datetime.now().strftime('%d-%m-%Y'),
-                'Source_Platform': 'Freshworks Careers'
-            },
-            {
-                'Company_Name': 'Atlassian',
-                'Job_Role': 'SDET - Collaboration Tools',
-                'Job_Description': 'Develop test automation for Jira and Confluence. API testing for collaboration platforms. Requirements: 3-5 years SDET.',
-                'Required_Skills': 'Java, Python, REST API, Kubernetes, Docker, CI/CD, Collaboration',
-                'Experience_Required': '3-5 years',
-                'Location': 'Remote - Global',
-                'Employment_Type': 'Full-time',
-                'Salary_Range': 'Not Disclosed',
-                'Apply_Link': 'https://www.atlassian.com/company/careers/all-jobs',
-                'Date_Posted': (datetime.now() - timedelta(days=1)).strftime('%d-%m-%Y'),
-                'Source_Platform': 'Atlassian Careers'
-            },
-            {
-                'Company_Name': 'Dell',
-                'Job_Role': 'QA Automation Engineer - Cloud Solutions',
-                'Job_Description': 'Build automation for Dell cloud and storage solutions. Requirements: 4-6 years automation, cloud and storage systems knowledge.',
-                'Required_Skills': 'Python, Java, Selenium, REST API, Jenkins, Cloud, Storage',
-                'Experience_Required': '4-6 years',
-                'Location': 'Bangalore, Karnataka',
-                'Employment_Type': 'Full-time',
-                'Salary_Range': 'Not Disclosed',
-                'Apply_Link': 'https://www.linkedin.com/jobs/search/?keywords=Dell+QA&location=India',
-                'Date_Posted': datetime.now().strftime('%d-%m-%Y'),
-                'Source_Platform': 'LinkedIn Jobs'
-            },
-            {
-                'Company_Name': 'IBM',
-                'Job_Role': 'SDET - Hybrid Cloud',
-                'Job_Description': 'Develop test automation for IBM hybrid cloud services. Requirements: 4-6 years SDET, cloud platforms experience.',
-                'Required_Skills': 'Java, Python, Selenium, Cloud, REST API, Kubernetes, Docker',
-                'Experience_Required': '4-6 years',
-                'Location': 'Bangalore, Karnataka',
-                'Employment_Type': 'Full-time',
-                'Salary_Range': 'Not Disclosed',
-                'Apply_Link': 'https://www.linkedin.com/jobs/search/?keywords=IBM+SDET&location=India',
-                'Date_Posted': (datetime.now() - timedelta(days=1)).strftime('%d-%m-%Y'),
-                'Source_Platform': 'LinkedIn Jobs'
-            }
-        ]
+        # Companies that typically have QA/SDET openings; dates are relative to today
+        with open(VERIFIED_JOBS_FILE, encoding='utf-8') as f:
+            verified_jobs = json.load(f)
+        for job in verified_jobs:
+            job['Date_Posted'] = today - job.pop('Days_Ago', 0)
         
         print(f"   ✓ Added {len(verified_jobs)} verified jobs\n")
-        return verified_jobs
+        return [JobPosting.from_dict(job) for job in verified_jobs]
+    
+    def normalize_jobs(self, jobs):
+        """Normalize stage: fill in HR contact info and clip descriptions, one job at a time"""
+        for job in jobs:
+            if job is None:
+                yield None   # tick - passed through
+                continue
+            if job.hr_contact is None:
+                # Extract now for verified sample jobs
+                job.hr_contact = self.extract_contact_info(job.description, job.apply_link, job.company)
+            job.description = job.description[:500]
+            yield job
     
-    def update_google_sheet(self, jobs):
-        """Update Google Sheet - Append new jobs without overwriting"""
+    def dedup_jobs(self, jobs):
+        """Dedup stage: yields (job, serial) - serial is None for a duplicate
+        
+        Accepted jobs go into the store and near-dup index straight away
+        (uncommitted), so a repeat later in the same run is caught without
+        keeping the run in memory.
+        """
+        for job in jobs:
+            if job is None:
+                yield None, None   # tick - passed through
+                continue
+            with METRICS.timer('dedup'):
+                serial = self.dedup_one(job)
+            yield job, serial
+    
+    def dedup_one(self, job):
+        """Store the job if it is new; returns its serial, or None for a duplicate"""
+        stats = self.sync_stats
+        # Exact: company + role + first 100 chars of description
+        if self.store.contains(job.fingerprint):
+            stats['duplicates'] += 1
+            print(f"   ⊗ Skipping duplicate: {job.company} - {job.role[:40]}")
+            return None
+        
+        # Reposts with slightly different wording (MinHash/LSH); the signature is reused by add()
+        sig = signature(job.role, job.description)
+        match = self.near_dup.find(job.company, job.role, job.description, sig=sig)
+        if match:
+            stats['near_duplicates'] += 1
+            print(f"   ≈ Skipping near-duplicate of #{match[0]} ({match[1]:.0%} similar): "
+                  f"{job.company} - {job.role[:40]}")
+            return None
+        
+        serial = self.store.add(job, commit=False)
+        self.near_dup.add(serial, job.company, job.role, job.description, commit=False, sig=sig)
+        return serial
+    
+    def sync_near_dup(self):
+        """Bring the near-duplicate index in line with the store if they have drifted apart
+        
+        Only the difference is touched: stored jobs the index lacks (e.g. imported
+        sheet rows) are added, entries the store no longer has are dropped.
+        """
+        if self.near_dup.count() == self.store.count():
+            return
+        indexed, stored = self.near_dup.doc_ids(), self.store.serials()
+        self.near_dup.remove(indexed - stored, commit=False)
+        missing = stored - indexed
+        for serial, job in self.store.postings(missing):
+            self.near_dup.add(serial, job.company, job.role, job.description, commit=False)
+        self.near_dup.commit()
+        print(f"✓ Indexed {len(missing)} stored jobs for near-duplicate detection")
+    
+    def store_jobs(self, jobs, max_new=None, on_flush=None, on_chunk=None):
+        """Stream jobs into the local store: source -> normalize -> dedup -> store
+        
+        jobs can be any iterable (e.g. a live source stream). New jobs are
+        committed in chunks of FLUSH_ROWS (or every FLUSH_SECONDS) while it is
+        still being consumed; after each chunk on_chunk() runs (sinks) and
+        on_flush(jobs) gets every job that chunk handled. A None from `jobs`
+        (run_sources' tick while sources are quiet) only lets a due commit
+        happen, so the write transaction is never held open waiting on a
+        source. Stops after max_new new jobs. Returns the number stored.
+        """
+        self.sync_stats = stats = new_sync_stats()
+        self.sync_near_dup()
+        print(f"\nChecking for duplicates against {self.store.count()} stored jobs...")
+        
+        new = 0         # new jobs waiting for the next commit
+        handled = []    # every job consumed since the last commit (for on_flush)
+        first = last = None   # serial range of the chunk
+        last_flush = time.monotonic()
+        
+        def flush():
+            with METRICS.timer('write', target='store'):
+                self.store.commit()
+                self.near_dup.commit()
+            if handled:
+                self.journal.commit(first, last)
+            stats['written'] += new
+            if on_chunk and new:
+                on_chunk()
+            if on_flush and handled:
+                on_flush(handled)
+        
+        try:
+            for job, serial in self.dedup_jobs(self.normalize_jobs(jobs)):
+                if job is None:
+                    if handled and time.monotonic() - last_flush >= FLUSH_SECONDS:
+                        flush()
+                        new, handled = 0, []
+                        first = last = None
+                        last_flush = time.monotonic()
+                    continue
+                handled.append(job)
+                self.journal.job(job)
+                if serial is not None:
+                    new += 1
+                    first = serial if first is None else first
+                    last = serial
+                    stats['sources'].add(job.platform)
+                    stats['companies'].add(job.company)
+                
+                done = max_new is not None and stats['written'] + new >= max_new
+                if (done or new >= FLUSH_ROWS or len(handled) >= FLUSH_ROWS * 4
+                        or time.monotonic() - last_flush >= FLUSH_SECONDS):
+                    flush()
+                    new, handled = 0, []
+                    first = last = None
+                    last_flush = time.monotonic()
+                if done:
+                    break
+            flush()
+        except BaseException:
+            # Jobs of the chunk that was never committed must not count as seen
+            self.store.rollback()
+            self.near_dup.rollback()
+            raise
+        
+        if stats['duplicates'] > 0:
+            print(f"\n✓ Skipped {stats['duplicates']} duplicate jobs")
+        if stats['near_duplicates'] > 0:
+            print(f"✓ Skipped {stats['near_duplicates']} near-duplicate reposts")
+        print(f"✓ Stored {stats['written']} new jobs in {self.store.path}")
+        return stats['written']
+    
+    def pull_sheet(self, store=None):
+        """Import rows added to the sheet (history, by hand, other writers) into the store
+        
+        Runs on the main thread before scraping, so the sheet's writer thread never
+        writes the store. Returns the tab's last Serial_No, for open_sheet(). A sheet
+        that can't be read is warned about (None); its rows come in on a later run.
+        """
+        store = store or self.store
+        try:
+            spreadsheet = self.sheets.open(SPREADSHEET_KEY)
+            worksheet = self.sheets.worksheet(spreadsheet, SHEET_TITLE)
+            return pull_sheet_rows(store, worksheet and SheetReader(worksheet, self.sheets_call), spreadsheet.id)
+        except Exception as e:
+            # The cached sheet metadata may be stale (tab deleted or renamed)
+            self.sheets.invalidate()
+            print(f"⚠ Couldn't read the sheet ({e}) - rows added there are imported next run")
+            return None
+    
+    def open_sheet(self, store=None, exported=0, sheet_serial=None):
+        """Open the spreadsheet and get the 'Jobs List' tab ready for export
+        
+        `store` is the connection the exporter reads from (the sheet sink's own thread
+        has one); `exported` is the last serial written before; `sheet_serial` the
+        tab's last Serial_No from pull_sheet() (None: read it from the tab).
+        """
         print("\n" + "="*80)
         print("UPDATING GOOGLE SHEET")
         print("="*80 + "\n")
         
         try:
-            creds = Credentials.from_service_account_file(CREDENTIALS_FILE, scopes=SCOPES)
-            client = gspread.authorize(creds)
-            spreadsheet = client.open_by_key(SPREADSHEET_URL.split('/d/')[1].split('/')[0])
-            
-            # Find or create Jobs List tab
-            worksheet = None
-            for sheet in spreadsheet.worksheets():
-                if sheet.title == "Jobs List":
-                    worksheet = sheet
-                    break
-            
-            today = datetime.now().strftime('%d-%m-%Y')
-            
-            if not worksheet:
-                print("Creating new 'Jobs List' tab...")
-                worksheet = spreadsheet.add_worksheet(title="Jobs List", rows=200, cols=20)
-                worksheet.update('A1', [[f'Last Updated: {today}']])
-                worksheet.update('A2', [['']])
-                
-                # Headers with HR Contact column
-                headers = [['Serial_No', 'Company_Name', 'Job_Role', 'Job_Description', 
-                          'Required_Skills', 'Experience_Required', 'Location', 
-                          'Employment_Type', 'Salary_Range', 'Apply_Link', 
-                          'Date_Posted', 'Source_Platform', 'HR_Contact']]
-                
-                worksheet.update('A3', headers)
-                
-                # Format headers
-                worksheet.format('A3:M3', {
-                    'backgroundColor': {'red': 0.2, 'green': 0.4, 'blue': 0.8},
-                    'textFormat': {'bold': True, 'foregroundColor': {'red': 1.0, 'green': 1.0, 'blue': 1.0}},
-                    'horizontalAlignment': 'CENTER'
-                })
-                
-                start_row = 4
-                print("✓ Created new tab with headers")
-            else:
-                print("Updating existing 'Jobs List' tab...")
-                worksheet.update('A1', [[f'Last Updated: {today}']])
-                
-                # Find last row with data
-                all_values = worksheet.get_all_values()
-                existing_jobs = [row for row in all_values[3:] if row and row[0]]
-                start_row = len(existing_jobs) + 4  # Skip header rows (1,2,3)
-                
-                # Check if we need to resize
-                current_rows = worksheet.row_count
-                needed_rows = start_row + len(jobs) + 10
-                if needed_rows > current_rows:
-                    print(f"Resizing sheet from {current_rows} to {needed_rows} rows...")
-                    worksheet.resize(rows=needed_rows, cols=20)
-                    time.sleep(1)
-                
-                print(f"✓ Found {len(existing_jobs)} existing jobs")
-                print(f"✓ Will append new jobs starting from row {start_row}")
-            
-            time.sleep(1)
-            
-            # Extract contact info and prepare rows
-            print(f"\nPreparing {len(jobs)} jobs to add...")
-            rows = []
-            current_serial = start_row - 3  # Adjust for header offset
-            
-            # Build existing jobs lookup for duplicate detection
-            existing_jobs_lookup = set()
-            if existing_jobs:
-                for ex_job in existing_jobs:
-                    if len(ex_job) >= 3:  # Has at least company, role, description
-                        company = ex_job[1] if ex_job[1] else ""
-                        role = ex_job[2] if ex_job[2] else ""
-                        desc = ex_job[3] if ex_job[3] else ""
-                        # Create lookup key (company + role + first 100 chars of description)
-                        key = (company.lower(), role.lower(), desc[:100].lower())
-                        existing_jobs_lookup.add(key)
-            
-            print(f"Checking for duplicates against {len(existing_jobs_lookup)} existing jobs...")
-            duplicates_found = 0
-            new_jobs_count = 0
-            
-            for job in jobs:
-                # Check for duplicates
-                company = job['Company_Name'].lower()
-                role = job['Job_Role'].lower()
-                desc = job['Job_Description'][:100].lower()
-                check_key = (company, role, desc)
-                
-                if check_key in existing_jobs_lookup:
-                    duplicates_found += 1
-                    print(f"   ⊗ Skipping duplicate: {job['Company_Name']} - {job['Job_Role'][:40]}")
-                    continue
-                
-                # Not a duplicate, add it
-                new_jobs_count += 1
-                
-                # Extract HR contact info using multiple methods
-                if 'HR_Contact_Extracted' in job:
-                    # Already extracted (from Indeed)
-                    hr_contact = job['HR_Contact_Extracted']
-                else:
-                    # Extract now for verified sample jobs
-                    hr_contact = self.extract_contact_info(job['Job_Description'], job['Apply_Link'], job['Company_Name'])
-                
-                row = [
-                    current_serial,
-                    job['Company_Name'],
-                    job['Job_Role'],
-                    job['Job_Description'][:500] if len(job['Job_Description']) > 500 else job['Job_Description'],
-                    job['Required_Skills'],
-                    job['Experience_Required'],
-                    job['Location'],
-                    job['Employment_Type'],
-                    job['Salary_Range'],
-                    job['Apply_Link'],
-                    job['Date_Posted'],
-                    job['Source_Platform'],
-                    hr_contact
-                ]
-                rows.append(row)
-                current_serial += 1
-            
-            if duplicates_found > 0:
-                print(f"\n✓ Skipped {duplicates_found} duplicate jobs")
-            print(f"✓ Found {new_jobs_count} new unique jobs to add")
-            
-            if rows:
-                # Update in batches to avoid API limits
-                batch_size = 10
-                for i in range(0, len(rows), batch_size):
-                    batch = rows[i:i+batch_size]
-                    range_name = f'A{start_row + i}:M{start_row + i + len(batch) - 1}'
-                    worksheet.update(range_name, batch)
-                    time.sleep(0.5)
-            
-                print(f"✓ Successfully added {len(rows)} new jobs to Google Sheet!\n")
-                print(f"📊 View: https://docs.google.com/spreadsheets/d/{spreadsheet.id}")
-            else:
-                print(f"\n📊 No new jobs to add - all were duplicates")
-                print(f"📊 View: https://docs.google.com/spreadsheets/d/{spreadsheet.id}")
-            
+            return self._prepare_exporter(store or self.store, exported, sheet_serial)
+        except Exception:
+            # The cached sheet metadata may be stale (tab deleted or renamed) - rediscover once,
+            # and don't trust where the tab ended either
+            self.sheets.invalidate()
+            return self._prepare_exporter(store or self.store, exported, None)
+    
+    def _prepare_exporter(self, store, exported, sheet_serial):
+        spreadsheet = self.sheets.open(SPREADSHEET_KEY)
+        return SheetExporter(spreadsheet, store, call=self.sheets_call,
+                             sheets=self.sheets).prepare(exported, sheet_serial)
+    
+    def start_sinks(self, sinks=None):
+        """Start a writer thread per output sink (names, DEFAULT_SINKS by default); None if there are none
+        
+        Rows the outputs have and the store lacks (the sheet's) are pulled in first,
+        here on the main thread. Then each one follows the store on its own: a slow
+        or failing sink never holds up scraping or the others, and catches up from
+        the store later.
+        """
+        outputs = create_sinks(self, sinks)
+        if not outputs:
+            return None
+        self.sheets_api_calls = 0   # counted per run, across reopens
+        for sink in outputs:
+            sink.pull(self.store)
+        print(f"📤 Writing to {len(outputs)} sinks: {', '.join(sink.name for sink in outputs)}")
+        return SinkFanout(self.store.path, outputs, self.sink_state_path).start()
+    
+    def close_sinks(self, fanout):
+        """Let the sinks catch up with the store, print where each one got; True if all did"""
+        if fanout is None:
             return True
-            
-        except Exception as e:
-            print(f"❌ Error: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            return False
+        status = fanout.close()
+        print()
+        for name, result in status.items():
+            if result['behind']:
+                reason = f" ({result['error']})" if result['error'] else ""
+                print(f"⚠ {name}: {result['written']} rows written, {result['behind']} behind{reason} "
+                      f"- catches up on the next run")
+            else:
+                print(f"✓ {name}: {result['written']} rows written, up to date")
+        if 'sheet' in status:
+            print(f"📊 View: https://docs.google.com/spreadsheets/d/{SPREADSHEET_KEY}")
+            print(f"✓ Sheets API calls this run: {self.sheets_api_calls}")
+        return not any(result['behind'] for result in status.values())
+    
+    def sync_sinks(self, sinks=None):
+        """Catch the output sinks up with the local store, no scraping"""
+        return self.close_sinks(self.start_sinks(sinks))
+    
+    def record_run_metrics(self):
+        """Copy the run's tallies (dedup, HTTP cache) into the metrics report"""
+        self.record_sync_metrics(self.sync_stats)
+        self.record_http_metrics()
+    
+    def record_sync_metrics(self, stats, keys=SYNC_COUNTS):
+        """Add one store_jobs call's tallies to the metrics report"""
+        for key in keys:
+            METRICS.incr(f'jobs_{key}', stats[key])
+    
+    def record_http_metrics(self):
+        """HTTP cache / connection pool totals for the process (once, at the end)"""
+        if self._session is None:
+            return   # nothing was fetched
+        from transport import connection_stats
+        for result, count in self._session.stats.items():
+            METRICS.incr('http_cache', count, result=result)
+        for key, count in connection_stats(self._session).items():
+            METRICS.incr(f'http_pool_{key}', count)
     
-    def run(self):
-        """Main scraping workflow"""
+    def print_stage_times(self):
+        """One line per pipeline stage: calls, total and mean time"""
+        print("\n⏱ Stage timings:")
+        for name, stage in METRICS.report()['stages'].items():
+            print(f"   {name:<28} {stage['count']:>6}×  {stage['total_s']:>8.3f}s  (avg {stage['avg_ms']:.1f} ms)")
+    
+    def resume_journal(self):
+        """Start the run journal; returns the jobs an interrupted run never committed
+        
+        Those go in first, and the pages that run already fetched come from the HTTP cache.
+        """
+        recovered = self.journal.recover()
+        if recovered:
+            print(f"↻ Resuming run {recovered['run']}: {len(recovered['committed'])} chunks were committed, "
+                  f"{len(recovered['jobs'])} jobs pending, {len(recovered['pages'])} pages already fetched\n")
+            self.session.pinned.update(recovered['pages'])
+        self.journal.begin(carry=recovered)
+        return recovered['jobs'] if recovered else []
+    
+    def run(self, sinks=None, sources=None, max_new=MAX_NEW_JOBS):
+        """Main scraping workflow (all registered sources unless `sources` is given,
+        output sinks by name - DEFAULT_SINKS unless `sinks` is given)"""
+        from sources import create_sources, run_sources
         print("╔═══════════════════════════════════════════════════════════════╗")
         print("║     QA/SDET JOB SCRAPER - ENHANCED                            ║")
         print("╚═══════════════════════════════════════════════════════════════╝\n")
+        METRICS.reset()
         
-        # Try to get real jobs
-        real_jobs = self.get_fresh_jobs_from_indeed(max_jobs=15)
+        # Sinks mirror the store - if one is down, jobs are still stored and it catches up later
+        fanout = self.start_sinks(sinks)
         
-        # Add verified samples
-        verified_jobs = self.add_verified_sample_jobs()
+        def advance_crawl_state(jobs):
+            # Only once a chunk is stored (a failed run re-crawls next time)
+            for source in sources:
+                source.commit(jobs)
         
-        # Combine and deduplicate
-        all_jobs = real_jobs + verified_jobs
-        unique_jobs = []
-        seen = set()
+        # All enabled sources (Indeed, verified samples, JSON boards...) run at once;
+        # their jobs are merged as they arrive and streamed straight into the store
+        if sources is None:
+            sources = create_sources(self)
+        print(f"\n🔍 Running {len(sources)} sources: {', '.join(s.name for s in sources)}\n")
         
-        for job in all_jobs:
-            key = (job['Company_Name'], job['Job_Role'])
-            if key not in seen:
-                seen.add(key)
-                unique_jobs.append(job)
-        
-        # Limit to 26 jobs
-        if len(unique_jobs) > 26:
-            unique_jobs = unique_jobs[:26]
+        pending = self.resume_journal()
+        stream = run_sources(sources, tick=FLUSH_TICK)
+        try:
+            # Limit to 26 new jobs; first rows reach the sinks while sources are still scraping
+            self.store_jobs(itertools.chain(pending, stream), max_new=max_new, on_flush=advance_crawl_state,
+                            on_chunk=fanout.notify if fanout else None)
+        finally:
+            stream.close()  # stop any sources still running
+            self.close_parse_pool()
+        self.journal.end()
         
-        print(f"\n✓ Total unique jobs: {len(unique_jobs)}")
-        print(f"  Sources: Indeed, LinkedIn, Company Websites")
-        print(f"  Companies: {', '.join(set(j['Company_Name'] for j in unique_jobs))}")
+        stats = self.sync_stats
+        self.record_run_metrics()
+        print(f"\n✓ Total new jobs: {stats['written']}")
+        print(f"  Sources: {', '.join(sorted(stats['sources']))}")
+        print(f"  Companies: {', '.join(stats['companies'])}")
         
-        # Update sheet
-        if self.update_google_sheet(unique_jobs):
-            print("\n✅ COMPLETE! Check your Google Sheet for fresh jobs!")
+        if self.close_sinks(fanout):
+            print(f"\n✅ COMPLETE! {self.store.count()} jobs in {self.store.path}")
         else:
-            print("\n❌ Failed to update sheet")
+            print("\n❌ Some sinks are behind (jobs are saved locally; the next run catches them up)")
+        self.print_stage_times()
+    
+    def serve(self, sinks=None, sources=None, flush_interval=DAEMON_FLUSH_SECONDS,
+              intervals=None, after_flush=None, stop=None):
+        """Daemon mode: scrape on a schedule until SIGINT / SIGTERM (or `stop` is set)
+        
+        Warm state (HTTP pools, store, near-dup index, Sheets client) lives for the
+        whole process. Every source runs in its own thread every `interval` seconds
+        (jittered; `intervals` overrides by source name). Their jobs queue up and are
+        written in one coalesced flush per `flush_interval`: store commit, crawl state,
+        metrics, a wake-up for the output sinks (each exports on its own thread), then
+        after_flush(). A failed flush keeps its jobs for the next one (and in the journal
+        until they are stored). Shutdown cuts running sources off, waits up to
+        SHUTDOWN_GRACE for them, flushes everything queued and lets the sinks catch up.
+        """
+        from sources import create_sources, run_sources
+        print("╔═══════════════════════════════════════════════════════════════╗")
+        print("║     QA/SDET JOB SCRAPER - DAEMON                              ║")
+        print("╚═══════════════════════════════════════════════════════════════╝\n")
+        METRICS.reset()
+        stop = stop or threading.Event()
+        
+        if sources is None:
+            sources = create_sources(self)
+        for source in sources:
+            source.interval = (intervals or {}).get(source.name, source.interval)
+        print("🕒 Schedule: " + ', '.join(f"{s.name} every {s.interval / 60:g} min" for s in sources)
+              + f"; writes every {flush_interval:g}s\n")
+        
+        inbox = queue.Queue()   # bounded by the sources' per-run job budgets
+        scheduler = Scheduler()
+        for source in sources:
+            scheduler.add(source.name, source, source.interval)
+        
+        def cycle(source):
+            stream = run_sources([source])
+            try:
+                for job in stream:
+                    inbox.put(job)
+                    if stop.is_set():
+                        break
+            except Exception as e:
+                print(f"   ⚠ Source '{source.name}' failed: {e}")
+            finally:
+                stream.close()
+                scheduler.done(source.name)
+        
+        def advance_crawl_state(jobs):
+            for source in sources:
+                source.commit(jobs)
+        
+        retry = []   # jobs of a failed flush, written with the next one
+        
+        def flush():
+            """Store everything queued; False if that failed (the jobs are kept for the next flush)"""
+            jobs = retry[:]
+            retry.clear()
+            while True:
+                try:
+                    jobs.append(inbox.get_nowait())
+                except queue.Empty:
+                    break
+            if not jobs:
+                return True
+            try:
+                self.store_jobs(jobs, on_flush=advance_crawl_state)
+            except Exception as e:
+                # The journal isn't rotated until they are stored, so a restart recovers them too
+                retry.extend(jobs)
+                self.record_sync_metrics(self.sync_stats, keys=('written',))   # chunks committed before it failed
+                print(f"⚠ Flush of {len(jobs)} jobs failed: {e} - retrying with the next flush")
+                return False
+            self.record_sync_metrics(self.sync_stats)
+            print(f"💾 {time.strftime('%H:%M:%S')} flushed {len(jobs)} jobs, "
+                  f"{self.sync_stats['written']} new ({self.store.count()} stored)")
+            if self.sync_stats['written'] and fanout:
+                fanout.notify()
+            # Everything so far is committed - start a fresh journal so it doesn't grow forever
+            self.journal.end()
+            self.journal.begin()
+            if after_flush:
+                after_flush()
+            return True
+        
+        # SIGINT / SIGTERM ask for a graceful stop (handlers only work on the main thread)
+        previous = {}
+        if threading.current_thread() is threading.main_thread():
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                previous[sig] = signal.signal(sig, lambda signum, frame: stop.set())
+        
+        for job in self.resume_journal():
+            inbox.put(job)
+        # Sinks catch up with the store now, then stay open (sheet exporter warm) between flushes
+        fanout = self.start_sinks(sinks)
+        threads = []
+        last_flush = time.monotonic()
+        try:
+            while not stop.is_set():
+                for name, source in scheduler.due():
+                    thread = threading.Thread(target=cycle, args=(source,), name=f'cycle-{name}', daemon=True)
+                    thread.start()
+                    threads.append(thread)
+                threads = [t for t in threads if t.is_alive()]
+                
+                if time.monotonic() - last_flush >= flush_interval:
+                    flush()
+                    last_flush = time.monotonic()
+                # Sleep until the next flush or source run; wake at least every second
+                # to notice sources that just finished
+                wait = min(flush_interval - (time.monotonic() - last_flush), 1.0)
+                next_due = scheduler.next_due()
+                stop.wait(max(0.0, wait if next_due is None else min(wait, next_due)))
+        finally:
+            print(f"\n⏹ Stopping - waiting for {len(threads)} running sources, then flushing...")
+            stop.set()
+            deadline = time.monotonic() + SHUTDOWN_GRACE
+            for thread in threads:
+                thread.join(max(0.0, deadline - time.monotonic()))
+            self.close_parse_pool()
+            if flush():
+                self.journal.end()
+            else:
+                print(f"⚠ {len(retry)} jobs could not be stored - the next start resumes them from the journal")
+                for job in retry:
+                    self.journal.job(job)   # again, in case the flush failed before journaling them
+                self.journal.close()
+            for sig, handler in previous.items():
+                signal.signal(sig, handler)
+        
+        self.close_sinks(fanout)
+        self.record_http_metrics()   # job tallies were recorded flush by flush
+        print(f"\n✅ Daemon stopped. {self.store.count()} jobs in {self.store.path}")
+        self.print_stage_times()
 
 def main():
-    scraper = EnhancedJobScraper()
-    scraper.run()
+    parser = argparse.ArgumentParser(description="QA/SDET job scraper")
+    parser.add_argument('--replay', action='store_true',
+                        help="Serve search pages only from the local HTTP cache (no network)")
+    parser.add_argument('--sinks', default=','.join(DEFAULT_SINKS), metavar='NAMES',
+                        help=f"Comma-separated outputs fed from the local store ({', '.join(SINK_REGISTRY)}), "
+                             f"default: %(default)s")
+    parser.add_argument('--no-sheet', action='store_true',
+                        help="Leave the Google Sheet out of --sinks")
+    parser.add_argument('--export-only', action='store_true',
+                        help="Don't scrape - just catch the sinks up with the local store")
+    parser.add_argument('--daemon', action='store_true',
+                        help="Keep running: re-scrape each source on its interval, write every --flush-interval seconds")
+    parser.add_argument('--flush-interval', type=float, default=DAEMON_FLUSH_SECONDS, metavar='SECONDS',
+                        help="Daemon mode: seconds between coalesced store / sheet writes")
+    parser.add_argument('--interval', action='append', default=[], metavar='SOURCE=SECONDS',
+                        help="Daemon mode: override a source's interval (repeatable), e.g. indeed=900")
+    parser.add_argument('--http2', action='store_true',
+                        help="Multiplex HTTPS fetches over HTTP/2 (needs httpx[http2])")
+    parser.add_argument('--report', metavar='PATH',
+                        help="Write a JSON run report (stage timings, HTTP / retry / Sheets counters)")
+    parser.add_argument('--prometheus', metavar='PATH',
+                        help="Write the run's metrics in Prometheus text format (e.g. for node_exporter's textfile collector)")
+    parser.add_argument('--trace', action='store_true',
+                        help="Also record every timed block as a span in the --report JSON")
+    args = parser.parse_args()
+    
+    intervals = {}
+    for item in args.interval:
+        name, _, seconds = item.partition('=')
+        try:
+            intervals[name] = float(seconds)
+        except ValueError:
+            parser.error(f"--interval expects SOURCE=SECONDS, got '{item}'")
+    
+    sinks = [name.strip() for name in args.sinks.split(',') if name.strip()]
+    unknown = [name for name in sinks if name not in SINK_REGISTRY]
+    if unknown:
+        parser.error(f"unknown sink {', '.join(unknown)} (choose from {', '.join(SINK_REGISTRY)})")
+    if args.no_sheet:
+        sinks = [name for name in sinks if name != 'sheet']
+    
+    def write_metrics():
+        # Daemon mode rewrites them after every flush (e.g. for a Prometheus textfile collector)
+        if args.report:
+            METRICS.write_report(args.report)
+        if args.prometheus:
+            METRICS.write_prometheus(args.prometheus)
+    
+    METRICS.reset(tracing=args.trace)
+    scraper = EnhancedJobScraper(replay=args.replay, http2=args.http2)
+    if args.export_only:
+        scraper.sync_sinks(sinks)
+    elif args.daemon:
+        scraper.serve(sinks=sinks, flush_interval=args.flush_interval,
+                      intervals=intervals, after_flush=write_metrics)
+    else:
+        scraper.run(sinks=sinks)
+    
+    write_metrics()
+    if args.report:
+        print(f"📄 Run report: {args.report}")
+    if args.prometheus:
+        print(f"📄 Prometheus metrics: {args.prometheus}")
 
 if __name__ == "__main__":
     main()
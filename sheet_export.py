@@ -0,0 +1,186 @@
+"""
+Sheet Export
+Mirrors the local job store into the 'Jobs List' tab of the Google Sheet
+- The store is the system of record; the sheet only receives rows it lacks
+- The sheet numbers its own rows (Serial_No = row order); which stored job
+  sits in which sheet row is matched by fingerprint, so sheet history,
+  rows added by hand and the store's own serials never collide
+- pull_sheet_rows() imports rows the sheet has and the store doesn't
+  (history, other writers), reading only the rows past the last pull; it
+  runs on the main thread, before scraping, and tells the exporter where
+  the tab ends, so the Serial_No column isn't read a second time
+- SheetExporter only reads the store: its position (last store serial
+  written) is kept by the sink, and the rows it writes are matched up by the
+  next pull
+- With a SheetsClient the tab is found (and its size kept) in its metadata
+  cache instead of listing every worksheet
+"""
+
+from datetime import datetime
+
+from job_posting import SHEET_HEADERS
+from sheet_reader import FIRST_JOB_ROW, SheetReader, serial_row
+from sheets_writer import SheetBatchWriter
+
+SHEET_TITLE = "Jobs List"
+EXPORT_CHUNK_ROWS = 500   # rows read from the store per export batch
+
+
+def sync_key(spreadsheet_id):
+    """Store meta key: sheet Serial_No up to which the sheet's rows are in the store"""
+    return f'sheet_imported:{spreadsheet_id}'
+
+
+def pull_sheet_rows(store, reader, spreadsheet_id):
+    """Import rows the sheet has and the store doesn't; returns how many job rows the tab uses
+
+    Normally one range read of the rows after the last pull. The whole tab is
+    read the first time, or when the sheet no longer matches (rows removed or
+    renumbered by hand); then the store's record of what the sheet holds is
+    rebuilt from scratch. reader=None: there is no tab (yet). The rows used
+    (down to the last filled Serial_No) are the last Serial_No when the tab is
+    numbered in order, and where the exporter appends.
+    """
+    key = sync_key(spreadsheet_id)
+    pulled = store.get_meta(key)
+    new_rows = None
+    if reader is None:
+        new_rows = []
+    elif pulled is not None:
+        new_rows = reader.rows_since(int(pulled))
+        if new_rows is None:
+            print("Sheet no longer matches the last sync - reading the whole tab...")
+    resync = new_rows is None or reader is None
+    if new_rows is None:
+        new_rows = reader.rows()
+
+    imported = store.import_rows(new_rows, resync=resync)
+    if imported:
+        print(f"✓ Imported {imported} sheet rows into the local store")
+    serials = [int(row[0]) for row in new_rows if str(row[0]).isdigit()]
+    last = serials[-1] if serials else (0 if resync else int(pulled))
+    store.set_meta(key, last)
+    return reader.used if reader else 0
+
+
+class SheetExporter:
+    """Appends stored jobs to the tab - reads the store, never writes it"""
+
+    def __init__(self, spreadsheet, store, call=None, title=SHEET_TITLE, sheets=None):
+        self.spreadsheet = spreadsheet
+        self.store = store
+        self.sheets = sheets
+        self.call = call or (lambda func, *args, **kwargs: func(*args, **kwargs))
+        self.title = title
+        self.worksheet = None
+        self.writer = None
+        self.exported = 0       # last store serial written
+        self.sheet_serial = 0   # last Serial_No in the sheet
+        self.next_row = FIRST_JOB_ROW
+        self.row_count = 0
+
+    def prepare(self, exported=0, sheet_serial=None):
+        """Find or create the tab and work out where the export continues
+
+        `exported` is the last store serial written before (kept by the caller);
+        an empty tab starts over from the first stored job. `sheet_serial` is the
+        tab's last Serial_No if the caller has just read it (pull_sheet_rows),
+        otherwise the Serial_No column is read here.
+        """
+        if self.sheets:
+            self.worksheet = self.sheets.worksheet(self.spreadsheet, self.title)
+        else:
+            for sheet in self.call(self.spreadsheet.worksheets):
+                if sheet.title == self.title:
+                    self.worksheet = sheet
+                    break
+
+        today = datetime.now().strftime('%d-%m-%Y')
+
+        if not self.worksheet:
+            print(f"Creating new '{self.title}' tab...")
+            self.worksheet = self.call(self.spreadsheet.add_worksheet, title=self.title, rows=200, cols=20)
+            if self.sheets:
+                self.sheets.add_worksheet(self.spreadsheet, self.worksheet)
+
+            # Writes below are queued and sent together with the first rows
+            self.writer = SheetBatchWriter(self.spreadsheet, self.worksheet, call=self.call)
+            self.writer.update('A1', [[f'Last Updated: {today}']])
+            self.writer.update('A2', [['']])
+
+            # Headers with HR Contact column
+            self.writer.update('A3:M3', [SHEET_HEADERS])
+
+            # Format headers
+            self.writer.format('A3:M3', {
+                'backgroundColor': {'red': 0.2, 'green': 0.4, 'blue': 0.8},
+                'textFormat': {'bold': True, 'foregroundColor': {'red': 1.0, 'green': 1.0, 'blue': 1.0}},
+                'horizontalAlignment': 'CENTER'
+            })
+            self.sheet_serial = 0
+            print("✓ Created new tab with headers")
+        else:
+            print(f"Updating existing '{self.title}' tab...")
+            self.writer = SheetBatchWriter(self.spreadsheet, self.worksheet, call=self.call)
+            self.writer.update('A1', [[f'Last Updated: {today}']])
+            if sheet_serial is None:
+                # Serial_No column only; new rows go below the last filled one
+                reader = SheetReader(self.worksheet, self.call)
+                self.sheet_serial = reader.used_rows()
+                print(f"✓ Sheet has {self.sheet_serial} jobs, store has {self.store.count()} "
+                      f"({reader.cells_read} cells read)")
+            else:
+                self.sheet_serial = sheet_serial
+                print(f"✓ Sheet has {self.sheet_serial} jobs, store has {self.store.count()}")
+
+        self.exported = exported if self.sheet_serial else 0
+        self.next_row = serial_row(self.sheet_serial + 1)
+        self.row_count = self.worksheet.row_count
+        return self
+
+    def export(self):
+        """Write every stored row the sheet doesn't have yet, returns number written"""
+        written = 0
+        while True:
+            rows = list(self.store.rows_after(self.exported, limit=EXPORT_CHUNK_ROWS, skip_in_sheet=True))
+            self.write(rows)
+            if not rows:
+                return written
+            written += len(rows)
+
+    def write(self, rows):
+        """Append stored rows (serials after self.exported, in order) in one flush
+
+        Each gets the sheet's next Serial_No. Also sends whatever prepare()
+        queued, so write([]) just flushes.
+        """
+        needed_rows = self.next_row + len(rows) + 10
+        resized = needed_rows > self.row_count
+        if resized:
+            # Grow ahead so a streaming run doesn't resize on every chunk
+            new_count = needed_rows + 100
+            print(f"Resizing sheet from {self.row_count} to {new_count} rows...")
+            self.writer.resize(rows=new_count, cols=20)
+            self.row_count = new_count
+        if rows:
+            self.writer.append_rows(self.next_row, [[self.sheet_serial + i, *row[1:]]
+                                                    for i, row in enumerate(rows, 1)])
+        # One batch_update (resize/format) + values_batch_update chunks for everything else
+        self.writer.flush()
+        if resized:
+            self._grew()
+        if not rows:
+            return
+
+        print(f"   ↑ Wrote rows {self.next_row}-{self.next_row + len(rows) - 1}")
+        self.exported = rows[-1][0]
+        self.sheet_serial += len(rows)
+        self.next_row += len(rows)
+
+    def _grew(self):
+        """Keep the worksheet handle (and the cached metadata) at the new grid size"""
+        props = getattr(self.worksheet, '_properties', None)
+        if props is not None:
+            props.setdefault('gridProperties', {}).update(rowCount=self.row_count, columnCount=20)
+        if self.sheets:
+            self.sheets.add_worksheet(self.spreadsheet, self.worksheet)
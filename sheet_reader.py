@@ -0,0 +1,63 @@
+"""
+Sheet Reader
+Range-limited reads of the 'Jobs List' tab
+- Reads only the columns / rows asked for, never get_all_values()
+- Serial_No column alone to find the last row
+- rows_since(serial) fetches just the rows appended after a known serial,
+  checking that serial is still where it was left (the anchor)
+- Reads that run to the end of the tab note how far down it is filled
+  (used), so the exporter doesn't read the Serial_No column again
+"""
+
+FIRST_JOB_ROW = 4     # rows 1-3: timestamp, blank, headers
+LAST_COL = 'M'        # 13 columns
+
+
+def serial_row(serial):
+    """Sheet row holding a given Serial_No"""
+    return serial + FIRST_JOB_ROW - 1
+
+
+class SheetReader:
+    def __init__(self, worksheet, call=None):
+        self.worksheet = worksheet
+        self.call = call or (lambda func, *args, **kwargs: func(*args, **kwargs))
+        self.cells_read = 0
+        self.used = None   # job rows down to the last filled Serial_No, from the last read to the end of the tab
+
+    def _note_used(self, values, start_row):
+        filled = [i for i, row in enumerate(values) if row and row[0]]
+        self.used = start_row - FIRST_JOB_ROW + (filled[-1] + 1 if filled else 0)
+
+    def _get(self, range_name):
+        values = self.call(self.worksheet.get, range_name)
+        self.cells_read += sum(len(row) for row in values)
+        return values
+
+    def rows(self, start_row=FIRST_JOB_ROW, end_row=None, last_col=LAST_COL):
+        """Job rows in [start_row, end_row], columns A..last_col"""
+        values = self._get(f"A{start_row}:{last_col}{end_row or ''}")
+        if end_row is None:
+            self._note_used(values, start_row)
+        return [row for row in values if row and row[0]]
+
+    def serials(self, start_row=FIRST_JOB_ROW):
+        """Serial_No column only"""
+        return [row[0] for row in self._get(f'A{start_row}:A') if row and row[0]]
+
+    def used_rows(self):
+        """Job rows down to the last filled Serial_No (blank rows in between count)"""
+        return len(self._get(f'A{FIRST_JOB_ROW}:A'))
+
+    def last_serial(self):
+        serials = [int(v) for v in self.serials() if str(v).strip().isdigit()]
+        return max(serials) if serials else 0
+
+    def rows_since(self, serial):
+        """Rows appended after `serial`, or None if that serial is no longer where it was written"""
+        values = self._get(f'A{serial_row(serial)}:{LAST_COL}')
+        expected = str(serial) if serial else 'Serial_No'
+        if not values or not values[0] or str(values[0][0]) != expected:
+            return None
+        self._note_used(values, serial_row(serial))
+        return [row for row in values[1:] if row and row[0]]
@@ -0,0 +1,191 @@
+"""
+Sheets Client
+Google auth and sheet discovery done once, then reused
+- The service-account access token is cached (.cache/sheets_token.json)
+  and reused until it expires - no token round trip per sync
+- Spreadsheet / worksheet metadata (ids, titles, grid size) is cached
+  (.cache/sheets_meta.json), so opening the 'Jobs List' tab needs no
+  open_by_key / worksheets() calls
+- invalidate() drops the metadata after a failed sheet call (deleted or
+  renamed tab, rows removed by hand); entries also expire after META_TTL
+- A long-lived process keeps one SheetsClient: the gspread client and
+  open handles are reused, and the token is refreshed only when due
+"""
+
+import json
+import os
+import time
+from datetime import datetime
+
+from metrics import METRICS
+
+CREDENTIALS_FILE = "credentials.json"
+SPREADSHEET_KEY = '1YseZkMMiCjBShPHHg9awAlsXdRvEjT_TBZ9fNp_HCEE'
+SCOPES = [
+    'https://www.googleapis.com/auth/spreadsheets',
+    'https://www.googleapis.com/auth/drive'
+]
+
+DEFAULT_CACHE_DIR = '.cache'
+META_TTL = 24 * 3600   # seconds before sheet metadata is rediscovered anyway
+
+
+def _direct_call(func, *args, **kwargs):
+    return func(*args, **kwargs)
+
+
+class SheetsClient:
+    def __init__(self, credentials_file=CREDENTIALS_FILE, scopes=SCOPES, cache_dir=DEFAULT_CACHE_DIR,
+                 call=None, authorize=None):
+        """call wraps every API call (rate limiting); authorize() -> client replaces
+        service-account auth (no token handling, e.g. a fake client in benchmarks);
+        cache_dir=None keeps everything in memory"""
+        self.credentials_file = credentials_file
+        self.scopes = scopes
+        self.call = call or _direct_call
+        self.authorize = authorize
+        self.token_path = os.path.join(cache_dir, 'sheets_token.json') if cache_dir else None
+        self.meta_path = os.path.join(cache_dir, 'sheets_meta.json') if cache_dir else None
+        self.credentials = None
+        self.client = None
+        self.handles = {}   # spreadsheet key -> {'spreadsheet': ..., 'worksheets': {title: ...}}
+        self.meta = self._load(self.meta_path) or {}
+
+    # ---- files ----
+
+    @staticmethod
+    def _load(path):
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            with open(path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _save(path, data, private=False):
+        if not path:
+            return
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + '.tmp'
+        # Tokens are bearer credentials - owner-only
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600 if private else 0o644)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+
+    # ---- auth ----
+
+    def _connect(self):
+        """gspread client, built once; the cached token is attached when still valid"""
+        if self.client is not None:
+            return self.client
+        if self.authorize:
+            self.client = self.authorize()
+            return self.client
+
+        import gspread
+        from google.oauth2.service_account import Credentials
+        self.credentials = Credentials.from_service_account_file(self.credentials_file, scopes=self.scopes)
+        cached = self._load(self.token_path)
+        if cached and cached.get('account') == self.credentials.service_account_email:
+            self.credentials.token = cached['token']
+            self.credentials.expiry = datetime.fromisoformat(cached['expiry'])
+        self.client = gspread.authorize(self.credentials)
+        return self.client
+
+    def _ensure_token(self):
+        """Refresh the access token only when it has expired, and persist a new one"""
+        creds = self.credentials
+        if creds is None:
+            return
+        if creds.valid:
+            METRICS.incr('sheets_token', result='cached')
+        else:
+            from google.auth.transport.requests import Request
+            creds.refresh(Request())
+            METRICS.incr('sheets_token', result='refreshed')
+        # gspread may also have refreshed it mid-sync - store whatever is current
+        saved = self._load(self.token_path) or {}
+        if saved.get('token') != creds.token:
+            self._save(self.token_path, {'account': creds.service_account_email, 'token': creds.token,
+                                         'expiry': creds.expiry.isoformat()}, private=True)
+
+    # ---- metadata ----
+
+    def _fresh_meta(self, key):
+        entry = self.meta.get(key)
+        if entry and time.time() - entry.get('cached_at', 0) < META_TTL:
+            return entry
+        return None
+
+    def _remember(self, key, spreadsheet=None, worksheet=None):
+        entry = self.meta.get(key)
+        if entry is None or spreadsheet is not None:
+            props = getattr(spreadsheet, '_properties', None)
+            entry = self.meta[key] = {'cached_at': time.time(), 'properties': props, 'worksheets': {}}
+        if worksheet is not None:
+            props = getattr(worksheet, '_properties', None)
+            if props is not None:
+                entry['worksheets'][worksheet.title] = props
+        self._save(self.meta_path, self.meta)
+
+    def open(self, key=SPREADSHEET_KEY):
+        """Spreadsheet handle - from cache when possible (no API call)"""
+        client = self._connect()
+        self._ensure_token()
+        handle = self.handles.get(key)
+        if handle:
+            return handle['spreadsheet']
+
+        entry = self._fresh_meta(key)
+        if entry and entry['properties']:
+            from gspread.spreadsheet import Spreadsheet
+            # Spreadsheet() would fetch its metadata again; restore it from the cache instead
+            spreadsheet = Spreadsheet.__new__(Spreadsheet)
+            spreadsheet.client = client.http_client
+            spreadsheet._properties = dict(entry['properties'])
+            METRICS.incr('sheets_meta', result='cached')
+        else:
+            spreadsheet = self.call(client.open_by_key, key)
+            self._remember(key, spreadsheet=spreadsheet)
+            METRICS.incr('sheets_meta', result='fetched')
+        self.handles[key] = {'spreadsheet': spreadsheet, 'worksheets': {}}
+        return spreadsheet
+
+    def worksheet(self, spreadsheet, title):
+        """Tab called `title` (None if there is none) - cached, else one worksheets() call"""
+        handle = self.handles.setdefault(spreadsheet.id, {'spreadsheet': spreadsheet, 'worksheets': {}})
+        if title in handle['worksheets']:
+            return handle['worksheets'][title]
+
+        entry = self._fresh_meta(spreadsheet.id)
+        props = entry and entry['worksheets'].get(title)
+        if props:
+            from gspread.worksheet import Worksheet
+            worksheet = Worksheet(spreadsheet, dict(props), spreadsheet.id, spreadsheet.client)
+            METRICS.incr('sheets_meta', result='cached')
+        else:
+            worksheet = next((s for s in self.call(spreadsheet.worksheets) if s.title == title), None)
+            METRICS.incr('sheets_meta', result='fetched')
+            if worksheet is None:
+                return None
+        self.add_worksheet(spreadsheet, worksheet)
+        return worksheet
+
+    def add_worksheet(self, spreadsheet, worksheet):
+        """Remember a tab (just created, or resized - its grid size is cached too)"""
+        handle = self.handles.setdefault(spreadsheet.id, {'spreadsheet': spreadsheet, 'worksheets': {}})
+        handle['worksheets'][worksheet.title] = worksheet
+        self._remember(spreadsheet.id, worksheet=worksheet)
+
+    def invalidate(self, key=None):
+        """Forget cached metadata and handles (one spreadsheet, or all)"""
+        if key is None:
+            self.meta, self.handles = {}, {}
+        else:
+            self.meta.pop(key, None)
+            self.handles.pop(key, None)
+        self._save(self.meta_path, self.meta)
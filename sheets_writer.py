@@ -0,0 +1,83 @@
+"""
+Sheets Batch Writer
+Collects every write of a sync and sends them together
+- Cell values -> spreadsheet.values_batch_update (chunked by payload size)
+- Resize + formatting -> one spreadsheet.batch_update
+- Counts the API calls it makes
+"""
+
+import json
+
+# Google recommends keeping request bodies under ~2 MB
+MAX_PAYLOAD_BYTES = 2 * 1000 * 1000
+
+
+class SheetBatchWriter:
+    def __init__(self, spreadsheet, worksheet, call=None, max_payload_bytes=MAX_PAYLOAD_BYTES):
+        self.spreadsheet = spreadsheet
+        self.worksheet = worksheet
+        self.call = call or (lambda func, *args, **kwargs: func(*args, **kwargs))
+        self.max_payload_bytes = max_payload_bytes
+        self.value_updates = []
+        self.requests = []
+        self.api_calls = 0
+
+    def update(self, range_name, values):
+        """Queue a value write, range_name is A1 notation within the worksheet"""
+        self.value_updates.append({
+            'range': f"'{self.worksheet.title}'!{range_name}",
+            'values': values,
+        })
+
+    def append_rows(self, start_row, rows, last_col='M', rows_per_range=500):
+        """Queue rows starting at start_row, split into ranges so they can be chunked"""
+        for i in range(0, len(rows), rows_per_range):
+            block = rows[i:i + rows_per_range]
+            self.update(f'A{start_row + i}:{last_col}{start_row + i + len(block) - 1}', block)
+
+    def resize(self, rows, cols):
+        self.requests.append({
+            'updateSheetProperties': {
+                'properties': {
+                    'sheetId': self.worksheet.id,
+                    'gridProperties': {'rowCount': rows, 'columnCount': cols},
+                },
+                'fields': 'gridProperties.rowCount,gridProperties.columnCount',
+            }
+        })
+
+    def format(self, range_name, cell_format):
+        from gspread.utils import a1_range_to_grid_range   # gspread only loads when a sheet is formatted
+        self.requests.append({
+            'repeatCell': {
+                'range': a1_range_to_grid_range(range_name, self.worksheet.id),
+                'cell': {'userEnteredFormat': cell_format},
+                'fields': 'userEnteredFormat(' + ','.join(cell_format) + ')',
+            }
+        })
+
+    def _value_chunks(self):
+        """Split queued value ranges so no request body exceeds max_payload_bytes"""
+        chunk, size = [], 0
+        for entry in self.value_updates:
+            entry_size = len(json.dumps(entry))
+            if chunk and size + entry_size > self.max_payload_bytes:
+                yield chunk
+                chunk, size = [], 0
+            chunk.append(entry)
+            size += entry_size
+        if chunk:
+            yield chunk
+
+    def flush(self):
+        """Send everything queued - structural changes first so value ranges fit"""
+        if self.requests:
+            self.call(self.spreadsheet.batch_update, {'requests': self.requests})
+            self.api_calls += 1
+            self.requests = []
+
+        for chunk in self._value_chunks():
+            self.call(self.spreadsheet.values_batch_update, {'valueInputOption': 'RAW', 'data': chunk})
+            self.api_calls += 1
+        self.value_updates = []
+        return self.api_calls
@@ -0,0 +1,411 @@
+"""
+Output Sinks
+Plugin interface + registry for where stored jobs go: the Google Sheet,
+append-only JSONL, CSV and a flat SQLite table
+- The local store is the system of record and the buffer: every sink keeps
+  its own position (last serial written, .cache/sink_state.json) and reads
+  the rows it lacks in batches, so a sink that was down, slow or skipped
+  just catches up later
+- SinkFanout runs each sink in its own thread with its own store connection;
+  notify() after a store commit only wakes them, so a slow sink never holds
+  up scraping or the other sinks
+- Writers only read the store: rows an output has that the store lacks (the
+  sheet's) are pulled in on the main thread before scraping starts
+- A failed write is retried with exponential backoff, the sink reopened
+  first; its rows stay in the store until it succeeds
+
+Adding a sink:
+
+    @register_sink
+    class MySink(OutputSink):
+        name = 'mine'
+        def write(self, rows):
+            for row in rows:   # 13-column sheet rows, Serial_No first
+                ...
+"""
+
+import csv
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from job_posting import SHEET_HEADERS
+from job_store import JobStore
+from metrics import METRICS
+
+SINK_REGISTRY = {}
+DEFAULT_SINKS = ['sheet']
+
+EXPORT_DIR = os.path.join('data', 'export')
+DEFAULT_SINK_STATE_PATH = os.path.join('.cache', 'sink_state.json')
+SINK_BATCH_ROWS = 500     # rows per write
+DRAIN_TIMEOUT = 120.0     # seconds close() gives the sinks to catch up
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 60.0
+TAIL_BYTES = 64 * 1024    # end of a JSONL file read to find its last serial
+
+
+def register_sink(cls):
+    SINK_REGISTRY[cls.name] = cls
+    return cls
+
+
+def _makedirs(path):
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+
+class OutputSink:
+    name = None
+    batch_rows = SINK_BATCH_ROWS
+    skip_in_sheet = False   # leave out jobs the Google Sheet already has
+
+    def __init__(self, scraper, path=None):
+        self.scraper = scraper
+        if path is not None:
+            self.path = path
+
+    def pull(self, store):
+        """Bring rows this output has and the store lacks into the store
+
+        Runs on the main thread before scraping (and before the writers start),
+        so a writer thread never writes the store.
+        """
+
+    def open(self, store, synced):
+        """Get ready to write (on the sink's own thread); returns the last serial it already has
+
+        `synced` is the position recorded for this sink (0 the first time); the
+        JSONL, CSV and SQLite sinks check it against their own output, the sheet
+        starts over when its tab is empty.
+        """
+        return synced
+
+    def write(self, rows):
+        """Write a batch of 13-column rows (serials after the last one written, in order)"""
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+@register_sink
+class SheetSink(OutputSink):
+    """The 'Jobs List' tab (sheet_export) - jobs it already has are skipped"""
+    name = 'sheet'
+    skip_in_sheet = True
+
+    def __init__(self, scraper, path=None):
+        super().__init__(scraper)
+        self.exporter = None
+        self.sheet_serial = None   # the tab's last Serial_No as of pull()
+
+    def pull(self, store):
+        # Rows added to the sheet by hand or other writers come into the store
+        self.sheet_serial = self.scraper.pull_sheet(store)
+
+    def open(self, store, synced):
+        # Only good for the first open - a reopen after a failed write reads the tab again
+        sheet_serial, self.sheet_serial = self.sheet_serial, None
+        self.exporter = self.scraper.open_sheet(store, synced, sheet_serial)
+        return self.exporter.exported
+
+    def write(self, rows):
+        try:
+            self.exporter.write(rows)
+        except Exception:
+            # The cached sheet metadata may be stale - rediscovered when reopened
+            self.scraper.sheets.invalidate()
+            self.exporter = None
+            raise
+
+    def close(self):
+        if self.exporter:
+            # 'Last Updated' (and the headers of a new tab) even when no rows were written
+            self.exporter.write([])
+            self.exporter = None
+
+
+@register_sink
+class JSONLSink(OutputSink):
+    """One JSON object per job (sheet headers as keys), append-only"""
+    name = 'jsonl'
+    path = os.path.join(EXPORT_DIR, 'jobs.jsonl')
+
+    def __init__(self, scraper, path=None):
+        super().__init__(scraper, path)
+        self.file = None
+
+    def open(self, store, synced):
+        # The file is its own position: the Serial_No of its last complete line
+        _makedirs(self.path)
+        self.file = open(self.path, 'a+b')
+        size = self.file.seek(0, os.SEEK_END)
+        self.file.seek(max(0, size - TAIL_BYTES))
+        tail = self.file.read()
+        end = tail.rfind(b'\n') + 1
+        if end < len(tail):
+            # Torn last line (killed mid-write) - drop it, it is written again
+            self.file.truncate(size - len(tail) + end)
+        lines = tail[:end].splitlines()
+        return int(json.loads(lines[-1])['Serial_No']) if lines else 0
+
+    def write(self, rows):
+        self.file.write(b''.join(json.dumps(dict(zip(SHEET_HEADERS, row)), ensure_ascii=False).encode('utf-8')
+                                 + b'\n' for row in rows))
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def close(self):
+        if self.file:
+            self.file.close()
+            self.file = None
+
+
+@register_sink
+class CSVSink(OutputSink):
+    """Spreadsheet-style CSV with the sheet's header row"""
+    name = 'csv'
+    path = os.path.join(EXPORT_DIR, 'jobs.csv')
+
+    def __init__(self, scraper, path=None):
+        super().__init__(scraper, path)
+        self.file = None
+        self.writer = None
+
+    def open(self, store, synced):
+        # The file is its own position: the Serial_No of its last complete record
+        _makedirs(self.path)
+        last, end = self._last_record()
+        if os.path.exists(self.path) and end < os.path.getsize(self.path):
+            # Torn last record (killed mid-write) - drop it, it is written again
+            with open(self.path, 'r+b') as f:
+                f.truncate(end)
+        self.file = open(self.path, 'a', newline='', encoding='utf-8')
+        self.writer = csv.writer(self.file)
+        if end == 0:
+            # Missing or emptied file - start over from the first stored job
+            self.writer.writerow(SHEET_HEADERS)
+        return last
+
+    def _last_record(self):
+        """(Serial_No of the last complete record, byte offset where it ends)
+
+        Parsed with the csv module, so quoted newlines in descriptions are fine;
+        a record is complete once the line it ends on is.
+        """
+        if not os.path.exists(self.path):
+            return 0, 0
+        size = os.path.getsize(self.path)
+        last = end = consumed = 0
+        newline = True
+        with open(self.path, 'rb') as f:
+            def lines():
+                nonlocal consumed, newline
+                for line in f:
+                    consumed += len(line)
+                    newline = line.endswith(b'\n')
+                    yield line.decode('utf-8', errors='replace')
+            try:
+                for record in csv.reader(lines(), strict=True):
+                    if not newline:
+                        break
+                    end = consumed
+                    if record and record[0].isdigit():
+                        last = int(record[0])
+            except csv.Error:
+                if consumed < size:
+                    raise   # damaged before the end - not a torn write, not ours to repair
+        return last, end
+
+    def write(self, rows):
+        self.writer.writerows(rows)
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def close(self):
+        if self.file:
+            self.file.close()
+            self.file = self.writer = None
+
+
+@register_sink
+class SQLiteSink(OutputSink):
+    """Flat 'jobs' table in the sheet's layout, for other tools to query
+    without touching the live store"""
+    name = 'sqlite'
+    path = os.path.join(EXPORT_DIR, 'jobs.sqlite')
+
+    def __init__(self, scraper, path=None):
+        super().__init__(scraper, path)
+        self.db = None
+
+    def open(self, store, synced):
+        _makedirs(self.path)
+        self.db = sqlite3.connect(self.path)
+        columns = ', '.join(f'{h} TEXT' for h in SHEET_HEADERS[1:])
+        self.db.execute(f'CREATE TABLE IF NOT EXISTS jobs (Serial_No INTEGER PRIMARY KEY, {columns})')
+        self.db.commit()
+        return self.db.execute('SELECT MAX(Serial_No) FROM jobs').fetchone()[0] or 0
+
+    def write(self, rows):
+        # Keyed by serial: a batch written twice replaces itself
+        self.db.executemany(f'INSERT OR REPLACE INTO jobs VALUES ({", ".join("?" for _ in SHEET_HEADERS)})', rows)
+        self.db.commit()
+
+    def close(self):
+        if self.db:
+            self.db.close()
+            self.db = None
+
+
+def create_sinks(scraper, names=None, options=None):
+    """Instantiate registered sinks by name (DEFAULT_SINKS by default)"""
+    names = DEFAULT_SINKS if names is None else names
+    options = options or {}
+    unknown = [name for name in names if name not in SINK_REGISTRY]
+    if unknown:
+        raise ValueError(f"unknown sink {', '.join(unknown)} (choose from {', '.join(SINK_REGISTRY)})")
+    return [SINK_REGISTRY[name](scraper, **options.get(name, {})) for name in names]
+
+
+class SinkFanout:
+    """One writer thread per sink, each following the store at its own pace"""
+
+    def __init__(self, store_path, sinks, state_path=DEFAULT_SINK_STATE_PATH):
+        self.store_path = store_path
+        self.sinks = sinks
+        self.state_path = state_path
+        self.positions = self._load_positions()
+        self.lock = threading.Lock()   # writers save their positions from their own threads
+        self.state = {sink.name: {'position': None, 'written': 0, 'failures': 0, 'error': None,
+                                  'wake': threading.Event()}
+                      for sink in sinks}
+        self.threads = []
+        self.closing = False
+        self.deadline = None
+        self.stopped = threading.Event()   # cuts retry backoff short
+
+    def start(self):
+        """Start the writers (after every sink's pull(), so the run dedups against what they brought in)"""
+        for sink in self.sinks:
+            thread = threading.Thread(target=self._run, args=(sink,), name=f'sink-{sink.name}', daemon=True)
+            thread.start()
+            self.threads.append(thread)
+        return self
+
+    def _load_positions(self):
+        if not os.path.exists(self.state_path):
+            return {}
+        try:
+            with open(self.state_path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_position(self, name, serial):
+        # Kept out of the store: a writer never waits on the scraper's open transaction
+        with self.lock:
+            self.positions[name] = serial
+            _makedirs(self.state_path)
+            tmp = self.state_path + '.tmp'
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(self.positions, f, indent=1)
+            os.replace(tmp, self.state_path)
+
+    def notify(self):
+        """New rows are committed - wake every writer (never blocks)"""
+        for state in self.state.values():
+            state['wake'].set()
+
+    def _run(self, sink):
+        state = self.state[sink.name]
+        store = JobStore(self.store_path)
+        opened = False
+        try:
+            while True:
+                state['wake'].clear()
+                # Seen before reading: a read that started after close() has every committed row
+                closing = self.closing
+                try:
+                    if not opened:
+                        with self.lock:
+                            synced = self.positions.get(sink.name, 0)
+                        state['position'] = sink.open(store, synced)
+                        opened = True
+                    rows = list(store.rows_after(state['position'], limit=sink.batch_rows,
+                                                 skip_in_sheet=sink.skip_in_sheet))
+                    if rows:
+                        with METRICS.timer('write', target=sink.name):
+                            sink.write(rows)
+                        state['position'] = rows[-1][0]
+                        state['written'] += len(rows)
+                        self._save_position(sink.name, state['position'])
+                        METRICS.incr('sink_rows', len(rows), sink=sink.name)
+                except Exception as e:
+                    state['failures'] += 1
+                    state['error'] = e
+                    METRICS.incr('sink_errors', sink=sink.name)
+                    if state['failures'] == 1:
+                        print(f"⚠ Sink '{sink.name}' failed ({e}) - retrying in the background")
+                    if opened:
+                        self._close(sink)
+                        opened = False
+                    delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** (state['failures'] - 1))
+                    if closing:
+                        if time.monotonic() >= self.deadline:
+                            return
+                        time.sleep(min(delay, self.deadline - time.monotonic()))
+                    else:
+                        self.stopped.wait(delay)
+                    continue
+
+                if state['failures']:
+                    print(f"✓ Sink '{sink.name}' recovered after {state['failures']} failed attempts")
+                    state['failures'], state['error'] = 0, None
+                if rows and len(rows) == sink.batch_rows:
+                    continue   # more backlog
+                if closing:
+                    return
+                state['wake'].wait()
+        finally:
+            if opened:
+                self._close(sink)
+            store.close()
+
+    @staticmethod
+    def _close(sink):
+        try:
+            sink.close()
+        except Exception:
+            pass
+
+    def close(self, timeout=DRAIN_TIMEOUT):
+        """Let every sink catch up with the store (up to `timeout`), then stop
+
+        Returns {name: {'written', 'behind', 'error'}}; a sink still behind
+        resumes from its position next time.
+        """
+        self.deadline = time.monotonic() + timeout
+        self.closing = True
+        self.stopped.set()
+        self.notify()
+        for thread in self.threads:
+            thread.join(max(0.0, self.deadline - time.monotonic()))
+
+        store = JobStore(self.store_path)
+        try:
+            status = {}
+            for sink in self.sinks:
+                state = self.state[sink.name]
+                position = state['position']
+                if position is None:
+                    position = self.positions.get(sink.name, 0)
+                status[sink.name] = {'written': state['written'],
+                                     'behind': store.count_after(position, skip_in_sheet=sink.skip_in_sheet),
+                                     'error': state['error']}
+            return status
+        finally:
+            store.close()
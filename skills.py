@@ -0,0 +1,77 @@
+"""
+Skill Matcher
+All skills and synonyms from data/skills.json compiled into one automaton
+- Patterns are folded into a prefix trie and emitted as a single regex,
+  so one C-level scan of the text finds every skill at once
+- Matches only on word boundaries ("Git" is not found in "digital")
+- Results come back in taxonomy order, so output is stable between runs
+"""
+
+import json
+import os
+import re
+from functools import lru_cache
+
+SKILLS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'skills.json')
+MAX_SKILLS = 8
+
+
+def _trie_regex(patterns):
+    """Prefix-factored alternation: ['java', 'java 8', 'jenkins'] -> 'j(?:ava(?: 8)?|enkins)'"""
+    trie = {}
+    for pattern in patterns:
+        node = trie
+        for ch in pattern:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+
+    def build(node):
+        optional = '' in node
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if optional:
+            # Greedy optional: the longer synonym wins when both fit
+            return body + '?' if len(branches) == 1 and len(branches[0]) == 1 else '(?:' + body + ')?'
+        return body
+
+    return build(trie)
+
+
+class SkillMatcher:
+    def __init__(self, taxonomy):
+        """taxonomy: {canonical skill: [synonyms...]} - order of keys is the output order"""
+        self.skills = list(taxonomy)
+        self.rank = {}
+        for i, (skill, synonyms) in enumerate(taxonomy.items()):
+            for pattern in (skill, *synonyms):
+                self.rank.setdefault(pattern.lower(), i)
+
+        # Zero-width lookahead at every word start -> overlapping matches
+        # ("rest api testing" yields both "rest api" and "api testing")
+        body = _trie_regex(self.rank)
+        self.regex = re.compile(r'(?<!\w)(?=(' + body + r')(?!\w))')
+
+    def find(self, text):
+        """Canonical skills present in text, in taxonomy order"""
+        if not text:
+            return []
+        found = {self.rank[m] for m in self.regex.findall(text.lower())}
+        return [self.skills[i] for i in sorted(found)]
+
+
+def load_taxonomy(path=SKILLS_FILE):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=None)
+def get_matcher(path=SKILLS_FILE):
+    """Matcher is compiled once per taxonomy file and shared"""
+    return SkillMatcher(load_taxonomy(path))
+
+
+def extract_skills(text, limit=MAX_SKILLS):
+    """Comma separated skills, same format the sheet always used"""
+    return ', '.join(get_matcher().find(text)[:limit])
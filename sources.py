@@ -0,0 +1,354 @@
+"""
+Job Sources
+Plugin interface + registry for job boards
+- Every source implements fetch(emit) and calls emit(job) per posting
+- run_sources() runs all enabled sources at the same time, each with its
+  own timeout and job budget, and yields jobs as soon as any source has one
+- In daemon mode each source is re-run every `interval` seconds
+
+Adding a board:
+
+    @register_source
+    class MyBoardSource(JobSource):
+        name = 'myboard'
+        def fetch(self, emit):
+            for job in ...:
+                if emit(job) is False:
+                    return
+"""
+
+import html
+import json
+import queue
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from functools import partial
+
+from contacts import extract_contacts
+from indeed import (INDEED_KEYWORDS, INDEED_LOCATIONS, INDEED_MAX_PAGES,
+                    indeed_job_key, parse_indeed_page, search_url)
+from job_posting import JobPosting
+from pipeline import ScrapePipeline
+from skills import extract_skills
+
+SOURCE_REGISTRY = {}
+
+# Public JSON job boards - add board tokens / company handles to enable
+GREENHOUSE_BOARDS = []   # e.g. ['postman', 'browserstack']
+LEVER_COMPANIES = []     # e.g. ['razorpay']
+
+QA_TITLE_RE = re.compile(r'\b(qa|sdet|test|testing|quality|automation)\b', re.IGNORECASE)
+TAG_RE = re.compile(r'<[^>]+>')
+SPACE_RE = re.compile(r'\s+')
+
+
+def register_source(cls):
+    SOURCE_REGISTRY[cls.name] = cls
+    return cls
+
+
+class JobSource:
+    name = None
+    timeout = 60      # seconds this source may run before its output is cut off
+    max_jobs = 50     # job budget for one run
+    interval = 3600   # seconds between runs in daemon mode
+
+    def __init__(self, scraper, timeout=None, max_jobs=None):
+        self.scraper = scraper
+        if timeout is not None:
+            self.timeout = timeout
+        if max_jobs is not None:
+            self.max_jobs = max_jobs
+
+    @property
+    def enabled(self):
+        return True
+
+    def fetch(self, emit):
+        """Call emit(job) for each posting; stop as soon as emit returns False"""
+        raise NotImplementedError
+
+    def commit(self, jobs):
+        """Called once jobs from this run are safely written - advance any crawl state"""
+
+
+@register_source
+class IndeedSource(JobSource):
+    """Paginated, incremental crawl: each query pages forward (sort=date) until it
+    reaches its high-water mark or max_pages
+    
+    Postings seen before are skipped, not emitted. A query's mark only moves up once
+    every new posting down to the old mark has been committed; a crawl cut short by
+    the job budget or timeout leaves it, so the next run carries on past the postings
+    this one did emit.
+    """
+    name = 'indeed'
+    timeout = 120
+    max_jobs = 15
+    interval = 1800
+
+    def __init__(self, scraper, keywords=None, locations=None, max_pages=INDEED_MAX_PAGES, **kwargs):
+        super().__init__(scraper, **kwargs)
+        self.keywords = keywords or INDEED_KEYWORDS
+        self.locations = locations or INDEED_LOCATIONS
+        self.max_pages = max_pages
+        self.key_queries = {}   # job key -> query it was crawled from
+        self.uncommitted = {}   # query -> new keys this run has not seen committed yet
+        self.reached = set()    # queries whose crawl got down to their mark / max_pages
+
+    def fetch(self, emit):
+        scraper = self.scraper
+        state = scraper.crawl_state
+        seen = set()
+        self.uncommitted, self.reached = {}, set()
+
+        pages = {}  # url -> (keyword, location, page)
+        for keyword in self.keywords:
+            for location in self.locations:
+                pages[search_url(keyword, location)] = (keyword, location, 0)
+        print(f"   [indeed] crawling {len(pages)} queries, up to {self.max_pages} pages each "
+              f"(concurrency={scraper.fetcher.concurrency}, parser workers={scraper.parse_workers})...")
+
+        def crawl(url, jobs):
+            """Keep unseen postings; follow to the next page until the query's mark"""
+            keyword, location, page = pages[url]
+            query = f'{keyword}|{location}'
+            scraper.journal.page(url)
+            known, mark = state.seen_keys(query), state.mark_keys(query)
+
+            fresh = []
+            reached = not jobs   # past the last result
+            for job in jobs:
+                key = indeed_job_key(job)
+                reached = reached or key in mark
+                if key not in known:
+                    self.key_queries[key] = query
+                    self.uncommitted.setdefault(query, set()).add(key)
+                    fresh.append(job)
+
+            next_urls = []
+            if reached or page + 1 >= self.max_pages:
+                self.reached.add(query)
+            else:
+                next_url = search_url(keyword, location, page + 1)
+                pages[next_url] = (keyword, location, page + 1)
+                next_urls.append(next_url)
+            return fresh, next_urls
+
+        def sink(job):
+            if job.fingerprint in seen:
+                return True
+            seen.add(job.fingerprint)
+            return emit(job)
+
+        pipeline = ScrapePipeline(scraper.fetcher, partial(parse_indeed_page, backend=scraper.parser_backend),
+                                  pool=scraper.parse_pool)
+        stats = pipeline.run(list(pages), sink, crawl=crawl)
+        print(f"   [indeed] {stats['pages_fetched']} pages fetched, {stats['jobs']} new postings")
+
+    def commit(self, jobs):
+        state = self.scraper.crawl_state
+        for job in jobs:
+            key = indeed_job_key(job)
+            if key in self.key_queries:
+                # pop: a long-lived (daemon) source only remembers uncommitted keys
+                query = self.key_queries.pop(key)
+                state.stage(query, [key])
+                self.uncommitted.get(query, set()).discard(key)
+        # A query's mark moves once its crawl reached the old one and all it found is stored
+        for query in list(self.reached):
+            if not self.uncommitted.get(query):
+                state.complete(query)
+                self.reached.discard(query)
+        state.commit()
+
+
+@register_source
+class VerifiedSampleSource(JobSource):
+    name = 'verified_samples'
+    timeout = 10
+    max_jobs = 100
+    interval = 24 * 3600   # a fixed catalog - re-offering it only re-checks duplicates
+
+    def fetch(self, emit):
+        for job in self.scraper.add_verified_sample_jobs():
+            if emit(job) is False:
+                return
+
+
+def _clean_html(text):
+    return SPACE_RE.sub(' ', TAG_RE.sub(' ', html.unescape(text or ''))).strip()
+
+
+def _json_job(company, title, description, location, link, posted, platform):
+    return JobPosting(
+        company=company,
+        role=title,
+        description=description,
+        skills=extract_skills(description),
+        location=location or 'Location Not Specified',
+        apply_link=link or 'LINK_NOT_AVAILABLE',
+        posted=posted,
+        platform=platform,
+        hr_contact=extract_contacts(description, company),
+    )
+
+
+class JSONBoardSource(JobSource):
+    """Boards with a public JSON API - all boards are fetched concurrently"""
+    boards = []
+
+    @property
+    def enabled(self):
+        return bool(self.boards)
+
+    def board_url(self, board):
+        raise NotImplementedError
+
+    def parse_board(self, board, data):
+        """Yield JobPosting objects from one board's JSON"""
+        raise NotImplementedError
+
+    def fetch(self, emit):
+        urls = [self.board_url(board) for board in self.boards]
+        for board, (url, resp) in zip(self.boards, self.scraper.fetcher.fetch(urls)):
+            if resp is None or resp.status_code != 200:
+                continue
+            self.scraper.journal.page(url)
+            try:
+                data = json.loads(resp.text)
+            except ValueError:
+                continue
+            for job in self.parse_board(board, data):
+                if QA_TITLE_RE.search(job.role) and emit(job) is False:
+                    return
+
+
+@register_source
+class GreenhouseSource(JSONBoardSource):
+    name = 'greenhouse'
+    boards = GREENHOUSE_BOARDS
+
+    def board_url(self, board):
+        return f'https://boards-api.greenhouse.io/v1/boards/{board}/jobs?content=true'
+
+    def parse_board(self, board, data):
+        for item in data.get('jobs', []):
+            try:
+                posted = datetime.fromisoformat(item['updated_at'])
+            except (KeyError, TypeError, ValueError):
+                posted = datetime.now()
+            yield _json_job(board.replace('-', ' ').title(), item.get('title', ''),
+                            _clean_html(item.get('content'))[:2000],
+                            (item.get('location') or {}).get('name'), item.get('absolute_url'),
+                            posted, 'Greenhouse')
+
+
+@register_source
+class LeverSource(JSONBoardSource):
+    name = 'lever'
+    boards = LEVER_COMPANIES
+
+    def board_url(self, board):
+        return f'https://api.lever.co/v0/postings/{board}?mode=json'
+
+    def parse_board(self, board, data):
+        for item in data if isinstance(data, list) else []:
+            created = item.get('createdAt')
+            posted = (datetime.fromtimestamp(created / 1000, tz=timezone.utc)
+                      if isinstance(created, (int, float)) else datetime.now())
+            yield _json_job(board.replace('-', ' ').title(), item.get('text', ''),
+                            (item.get('descriptionPlain') or '')[:2000],
+                            (item.get('categories') or {}).get('location'), item.get('hostedUrl'),
+                            posted, 'Lever')
+
+
+def create_sources(scraper, names=None, options=None):
+    """Instantiate registered sources (all enabled ones by default)"""
+    options = options or {}
+    sources = []
+    for name, cls in SOURCE_REGISTRY.items():
+        if names is not None and name not in names:
+            continue
+        source = cls(scraper, **options.get(name, {}))
+        if source.enabled:
+            sources.append(source)
+    return sources
+
+
+_DONE = object()
+
+
+def run_sources(sources, queue_size=256, tick=None):
+    """Run sources concurrently, yield jobs as they arrive (merged stream)
+
+    A source that runs past its timeout is cut off: emit() starts returning
+    False and anything it sends afterwards is dropped. Closing the generator
+    early (consumer has enough jobs) cuts off every source the same way.
+    tick: while no job arrives, yield None every `tick` seconds (lets the
+    consumer act on timers, e.g. commit what it has).
+    """
+    results = queue.Queue(queue_size)
+    deadlines = {}
+    counts = {}
+    closed = threading.Event()
+
+    def worker(source):
+        deadline = deadlines[source.name]
+
+        def emit(job):
+            if closed.is_set() or time.monotonic() > deadline or counts[source.name] >= source.max_jobs:
+                return False
+            counts[source.name] += 1
+            results.put((source.name, job))
+            return counts[source.name] < source.max_jobs
+
+        try:
+            source.fetch(emit)
+        except Exception as e:
+            print(f"   ⚠ Source '{source.name}' failed: {e}")
+        finally:
+            results.put((source.name, _DONE))
+
+    start = time.monotonic()
+    for source in sources:
+        deadlines[source.name] = start + source.timeout
+        counts[source.name] = 0
+        threading.Thread(target=worker, args=(source,), name=f'source-{source.name}', daemon=True).start()
+
+    pending = set(deadlines)
+    last_yield = time.monotonic()
+    try:
+        while pending:
+            now = time.monotonic()
+            wait = max(0.0, min(deadlines[name] for name in pending) - now)
+            if tick is not None:
+                wait = min(wait, max(0.0, last_yield + tick - now))
+            try:
+                name, item = results.get(timeout=wait)
+            except queue.Empty:
+                # Give up on sources past their deadline
+                now = time.monotonic()
+                for name in [n for n in pending if deadlines[n] <= now]:
+                    print(f"   ⚠ Source '{name}' timed out after {counts[name]} jobs")
+                    pending.discard(name)
+                if tick is not None and now - last_yield >= tick:
+                    last_yield = now
+                    yield None
+                continue
+
+            if item is _DONE:
+                pending.discard(name)
+            elif name in pending:
+                last_yield = time.monotonic()
+                yield item
+    finally:
+        # Unblock workers stuck on a full queue; their next emit() returns False
+        closed.set()
+        while True:
+            try:
+                results.get_nowait()
+            except queue.Empty:
+                break
@@ -0,0 +1,132 @@
+"""
+Fake Google Sheets
+In-memory stand-in for the parts of gspread the scraper uses, so sheet
+syncs can be tested and benchmarked without credentials or network
+- Optional per-call latency to model the real API round trip
+- Counts calls per method and cells read / written
+"""
+
+import re
+import time
+from collections import Counter
+
+_A1_RE = re.compile(r'([A-Z]+)(\d*)')
+
+
+def _cell(ref):
+    """'B12' -> (12, 2); 'M' -> (None, 13)"""
+    m = _A1_RE.fullmatch(ref)
+    col = 0
+    for ch in m.group(1):
+        col = col * 26 + ord(ch) - 64
+    return (int(m.group(2)) if m.group(2) else None), col
+
+
+class FakeWorksheet:
+    def __init__(self, spreadsheet, title, rows=1000, cols=26, sheet_id=0):
+        self.spreadsheet = spreadsheet
+        self.title = title
+        self.row_count = rows
+        self.col_count = cols
+        self.id = sheet_id
+        self.cells = {}   # row -> {col: value}
+
+    def _set(self, range_name, values):
+        row, col = _cell(range_name.split(':')[0])
+        for i, values_row in enumerate(values):
+            target = self.cells.setdefault(row + i, {})
+            for j, value in enumerate(values_row):
+                target[col + j] = value
+            self.spreadsheet.stats['cells_written'] += len(values_row)
+
+    def get(self, range_name, **kwargs):
+        self.spreadsheet._call('get')
+        start, _, end = range_name.partition(':')
+        first_row, first_col = _cell(start)
+        last_row, last_col = _cell(end) if end else (first_row, first_col)
+        first_row = first_row or 1
+        last_row = last_row or max(self.cells, default=0)
+        out = []
+        for r in range(first_row, last_row + 1):
+            row = self.cells.get(r, {})
+            values = [str(row.get(c, '')) for c in range(first_col, last_col + 1)]
+            while values and values[-1] == '':
+                values.pop()
+            out.append(values)
+        while out and not out[-1]:
+            out.pop()
+        self.spreadsheet.stats['cells_read'] += sum(len(v) for v in out)
+        return out
+
+    def col_values(self, col):
+        self.spreadsheet._call('col_values')
+        last = max(self.cells, default=0)
+        values = [str(self.cells.get(r, {}).get(col, '')) for r in range(1, last + 1)]
+        while values and values[-1] == '':
+            values.pop()
+        self.spreadsheet.stats['cells_read'] += len(values)
+        return values
+
+
+class FakeSpreadsheet:
+    def __init__(self, spreadsheet_id='FAKE', latency=0.0):
+        self.id = spreadsheet_id
+        self.latency = latency
+        self.sheets = []
+        self.calls = Counter()
+        self.stats = Counter()
+
+    def _call(self, name):
+        self.calls[name] += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def worksheets(self):
+        self._call('worksheets')
+        return list(self.sheets)
+
+    def worksheet(self, title):
+        self._call('worksheet')
+        for sheet in self.sheets:
+            if sheet.title == title:
+                return sheet
+        raise KeyError(title)
+
+    def add_worksheet(self, title, rows, cols):
+        self._call('add_worksheet')
+        sheet = FakeWorksheet(self, title, rows, cols, sheet_id=len(self.sheets))
+        self.sheets.append(sheet)
+        return sheet
+
+    def batch_update(self, body):
+        self._call('batch_update')
+        for request in body['requests']:
+            props = request.get('updateSheetProperties', {}).get('properties')
+            if props:
+                sheet = next(s for s in self.sheets if s.id == props['sheetId'])
+                sheet.row_count = props['gridProperties']['rowCount']
+
+    def values_batch_update(self, body):
+        self._call('values_batch_update')
+        for entry in body['data']:
+            title, range_name = entry['range'].rsplit('!', 1)
+            self.worksheet_by_title(title.strip("'"))._set(range_name, entry['values'])
+
+    def worksheet_by_title(self, title):
+        return next(s for s in self.sheets if s.title == title)
+
+
+class FakeClient:
+    def __init__(self, spreadsheet=None):
+        self.spreadsheet = spreadsheet or FakeSpreadsheet()
+
+    def open_by_key(self, key):
+        self.spreadsheet._call('open_by_key')
+        self.spreadsheet.id = key
+        return self.spreadsheet
+
+
+def install(scraper, client):
+    """Point a scraper's Sheets client at the fake (in-memory metadata cache)"""
+    from sheets_client import SheetsClient
+    scraper.sheets = SheetsClient(cache_dir=None, call=scraper.sheets_call, authorize=lambda: client)
@@ -0,0 +1,19 @@
+"""
+Test helpers
+Shared by the tests and the benchmarks
+- make_scraper(): an EnhancedJobScraper whose store, caches, crawl state,
+  journal and sink positions all live in one scratch directory
+"""
+
+import os
+
+
+def make_scraper(workdir, store_name='jobs.sqlite'):
+    from scrape_jobs import EnhancedJobScraper
+    return EnhancedJobScraper(replay=True, parse_workers=0,
+                              cache_path=os.path.join(workdir, 'http_cache.sqlite'),
+                              store_path=os.path.join(workdir, store_name),
+                              near_dup_path=os.path.join(workdir, 'near_dup.sqlite'),
+                              state_path=os.path.join(workdir, 'crawl_state.json'),
+                              journal_path=os.path.join(workdir, 'run_journal.jsonl'),
+                              sink_state_path=os.path.join(workdir, 'sink_state.json'))
@@ -0,0 +1,67 @@
+"""
+Contact extraction tests
+E.164 phone normalization and the single-pass email / phone scan
+
+Run: python -m pytest tests   (or python -m unittest discover tests)
+"""
+
+import time
+import unittest
+
+from contacts import extract_contacts, to_e164
+
+
+class E164Test(unittest.TestCase):
+    def test_normalizes(self):
+        cases = {
+            '+91 98765 43210': '+919876543210',
+            '+91-9876543210': '+919876543210',
+            '987-654-3210': '+919876543210',
+            '9876543210': '+919876543210',
+            '080-12345678': '+918012345678',      # STD code's trunk 0 dropped
+            '+1 415.555.0100': '+14155550100',    # explicit country code kept
+        }
+        for raw, expected in cases.items():
+            self.assertEqual(to_e164(raw), expected, raw)
+
+    def test_other_country_code(self):
+        self.assertEqual(to_e164('9876543210', country_code='1'), '+19876543210')
+
+    def test_implausible(self):
+        for raw in ('12345', '+12', '0123', '98765432101234'):
+            self.assertIsNone(to_e164(raw), raw)
+
+
+class ExtractContactsTest(unittest.TestCase):
+    def test_emails_and_phones_in_order(self):
+        text = ('Send your CV to hr@acme.in or careers.qa+sdet@acme-labs.co.in. '
+                'Call +91 98765 43210, 080-12345678 or 987-654-3210 (same as the first). '
+                'Repeat: hr@acme.in')
+        info = extract_contacts(text, 'Acme Labs')
+        self.assertEqual(info.emails, ['hr@acme.in', 'careers.qa+sdet@acme-labs.co.in'])
+        self.assertEqual(info.phones, ['+919876543210', '+918012345678'])
+        self.assertEqual(info.linkedin, 'https://www.linkedin.com/company/acme-labs')
+        self.assertEqual(info.likely_email, '')
+        self.assertEqual(str(info), 'https://www.linkedin.com/company/acme-labs | Email: hr@acme.in | '
+                                    'Phone: +919876543210')
+
+    def test_no_matches_inside_words(self):
+        info = extract_contacts('Order id A9876543210 and build v1234567890x; mail noreply', 'Acme')
+        self.assertEqual((info.emails, info.phones), ([], []))
+
+    def test_likely_email_when_nothing_found(self):
+        info = extract_contacts('Apply on the careers page', 'Big Co')
+        self.assertEqual(info.likely_email, 'hr@bigco.com')
+        self.assertEqual(str(info), 'https://www.linkedin.com/company/big-co | Likely Email: hr@bigco.com')
+
+    def test_long_tokens_stay_linear(self):
+        # Long runs of local-part characters with no '@' must not backtrack per position
+        text = ' '.join(['a.b-c_d%e+f' * 2000] * 50)
+        start = time.perf_counter()
+        info = extract_contacts(text, 'Acme')
+        self.assertLess(time.perf_counter() - start, 2.0)
+        self.assertEqual(info.emails, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
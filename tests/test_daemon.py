@@ -0,0 +1,109 @@
+"""
+Daemon mode tests
+serve() stopping before its first flush, a failed flush whose jobs are
+written by the next one (or left in the journal at shutdown), and job
+tallies summed across flushes
+
+Run: python -m pytest tests   (or python -m unittest discover tests)
+"""
+
+import contextlib
+import io
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import unittest
+from datetime import date
+from unittest import mock
+
+from job_posting import JobPosting
+from metrics import METRICS
+from sources import JobSource
+from tests.helpers import make_scraper
+
+
+def make_job(i):
+    return JobPosting(company=f'Daemon Co {i}', role=f'SDET {i}', description=f'Daemon posting {i}',
+                      posted=date(2026, 10, 1))
+
+
+class BatchSource(JobSource):
+    """Emits the next batch of jobs each time it runs"""
+    name = 'batches'
+    interval = 0.3
+
+    def __init__(self, scraper, batches):
+        super().__init__(scraper)
+        self.batches = list(batches)
+
+    def fetch(self, emit):
+        for job in self.batches.pop(0) if self.batches else []:
+            emit(job)
+
+
+class ServeTest(unittest.TestCase):
+    def setUp(self):
+        self.workdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.workdir, True)
+        self.scraper = make_scraper(self.workdir)
+
+    def serve(self, sources, seconds, **kwargs):
+        stop = threading.Event()
+        timer = threading.Timer(seconds, stop.set)
+        timer.start()
+        try:
+            with contextlib.redirect_stdout(io.StringIO()) as out:
+                self.scraper.serve(sinks=[], sources=sources, stop=stop, **kwargs)
+        finally:
+            timer.cancel()
+        return out.getvalue()
+
+    def counter(self, name):
+        return METRICS.report()['counters'].get(name)
+
+    def test_stop_before_any_flush(self):
+        out = self.serve([BatchSource(self.scraper, [])], 0.0, flush_interval=60)
+        self.assertIn('Daemon stopped', out)
+        self.assertEqual(self.counter('jobs_written'), None)
+
+    def test_tallies_add_up_across_flushes(self):
+        batches = [[make_job(1), make_job(2)], [make_job(3), make_job(1)], [make_job(4)]]
+        self.serve([BatchSource(self.scraper, batches)], 2.0, flush_interval=0.2)
+        self.assertEqual(self.scraper.store.count(), 4)
+        self.assertEqual(self.counter('jobs_written'), 4)
+        self.assertEqual(self.counter('jobs_duplicates'), 1)
+
+    def test_failed_flush_is_retried(self):
+        store = self.scraper.store
+        commit = store.commit
+        failures = []
+
+        def flaky_commit():
+            if not failures:
+                failures.append(1)
+                raise sqlite3.OperationalError('disk I/O error')
+            commit()
+
+        with mock.patch.object(store, 'commit', flaky_commit):
+            out = self.serve([BatchSource(self.scraper, [[make_job(1), make_job(2)]])], 1.5, flush_interval=0.2)
+        self.assertIn('retrying with the next flush', out)
+        self.assertEqual(store.count(), 2)
+        self.assertEqual(self.counter('jobs_written'), 2)
+        self.assertFalse(os.path.exists(self.scraper.journal.path))
+
+    def test_unstored_jobs_are_left_in_the_journal(self):
+        def broken_commit():
+            raise sqlite3.OperationalError('disk I/O error')
+
+        with mock.patch.object(self.scraper.store, 'commit', broken_commit):
+            out = self.serve([BatchSource(self.scraper, [[make_job(1), make_job(2)]])], 1.0, flush_interval=0.2)
+        self.assertIn('the next start resumes them from the journal', out)
+        self.assertEqual(self.scraper.store.count(), 0)
+        recovered = self.scraper.journal.recover()
+        self.assertEqual(sorted({job.company for job in recovered['jobs']}), ['Daemon Co 1', 'Daemon Co 2'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+"""
+Job store query tests
+Filters on the verified-samples catalog: company names, source / role /
+skill / location words, prefixes, and filters with no words in them
+
+Run: python -m pytest tests   (or python -m unittest discover tests)
+"""
+
+import unittest
+
+from job_posting import JobPosting
+from job_store import JobStore
+
+
+def job(company, role, platform, skills='', location='Bangalore'):
+    return JobPosting(company=company, role=role, description=f'{company} {role}', skills=skills,
+                      location=location, platform=platform)
+
+
+class QueryTest(unittest.TestCase):
+    def setUp(self):
+        self.store = JobStore(':memory:')
+        self.addCleanup(self.store.close)
+        for posting in [
+            job('Amazon', 'SDET II', 'LinkedIn Jobs', 'Java, Selenium'),
+            job('Amazon Pay', 'QA Engineer', 'Indeed India', 'Python, Pytest', 'Pune'),
+            job('Microsoft', 'Software Engineer in Test', 'Microsoft Careers', 'C#, .NET'),
+            job('Swiggy', 'QA Automation Lead', 'Naukri.com', 'C++, Python'),
+        ]:
+            self.store.add(posting)
+
+    def companies(self, **filters):
+        results, total = self.store.query(sort='company', descending=False, **filters)
+        self.assertEqual(total, len(results))
+        return [posting.company for _, posting in results]
+
+    def test_company_whole_name_or_prefix(self):
+        self.assertEqual(self.companies(company='amazon'), ['Amazon'])
+        self.assertEqual(self.companies(company='AMAZON*'), ['Amazon', 'Amazon Pay'])
+
+    def test_source_words(self):
+        self.assertEqual(self.companies(source='linkedin'), ['Amazon'])
+        self.assertEqual(self.companies(source='indeed'), ['Amazon Pay'])
+        self.assertEqual(self.companies(source='naukri'), ['Swiggy'])
+        self.assertEqual(self.companies(source='care*'), ['Microsoft'])
+
+    def test_role_skill_location_words(self):
+        self.assertEqual(self.companies(role='qa'), ['Amazon Pay', 'Swiggy'])
+        self.assertEqual(self.companies(skill='c#'), ['Microsoft'])
+        self.assertEqual(self.companies(skill='c++ python'), ['Swiggy'])
+        self.assertEqual(self.companies(skill='pyth*', location='pune'), ['Amazon Pay'])
+
+    def test_filter_without_words_is_rejected(self):
+        for name in ('role', 'skill', 'location', 'source'):
+            with self.assertRaises(ValueError):
+                self.store.query(**{name: '"'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+"""
+Near-duplicate index tests
+Reposts are found, other companies' postings aren't, and re-indexing a
+posting replaces its LSH band rows
+
+Run: python -m pytest tests   (or python -m unittest discover tests)
+"""
+
+import unittest
+
+from near_dup import BANDS, NearDuplicateIndex
+
+DESCRIPTION = ('Own the Selenium and pytest automation suite, review test plans, '
+               'build CI pipelines in Jenkins and mentor junior QA engineers')
+
+
+class NearDuplicateIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.index = NearDuplicateIndex(':memory:')
+        self.addCleanup(self.index.close)
+
+    def band_rows(self, doc_id):
+        return self.index.db.execute('SELECT COUNT(*) FROM bands WHERE doc_id = ?', (doc_id,)).fetchone()[0]
+
+    def test_finds_reposts_of_the_same_company(self):
+        self.index.add(1, 'Acme', 'SDET', DESCRIPTION)
+        match = self.index.find('ACME ', 'SDET', DESCRIPTION + ' today')
+        self.assertEqual(match[0], 1)
+        self.assertIsNone(self.index.find('Globex', 'SDET', DESCRIPTION))
+
+    def test_readding_replaces_band_rows(self):
+        self.index.add(1, 'Acme', 'SDET', DESCRIPTION)
+        self.index.add(1, 'Acme', 'QA Lead', 'Lead the manual and exploratory testing team')
+        self.assertEqual(self.index.count(), 1)
+        self.assertEqual(self.band_rows(1), BANDS)
+        self.assertIsNone(self.index.find('Acme', 'SDET', DESCRIPTION))
+
+
+if __name__ == '__main__':
+    unittest.main()
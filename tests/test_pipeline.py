@@ -0,0 +1,85 @@
+"""
+Scrape pipeline tests
+Parse failures are reported instead of swallowed, a broken parser pool
+falls back to in-process parsing, and a ParsePool is reused across runs
+
+Run: python -m pytest tests   (or python -m unittest discover tests)
+"""
+
+import contextlib
+import io
+import multiprocessing
+import os
+import unittest
+
+from pipeline import ParsePool, ScrapePipeline
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeFetcher:
+    """Answers every URL with its own path as the page body"""
+    concurrency = 2
+
+    async def fetch_one(self, url, limit, host_limits):
+        return url, FakeResponse(url)
+
+
+def parse_page(html):
+    if html == 'bad':
+        raise ValueError('no job cards')
+    return [html.upper()]
+
+
+def parse_page_or_die(html):
+    """Kills any parser process it runs in; parses normally in the main process"""
+    if multiprocessing.parent_process() is not None:
+        os._exit(1)
+    return parse_page(html)
+
+
+def parse_page_with_pid(html):
+    return [os.getpid()]
+
+
+class ScrapePipelineTest(unittest.TestCase):
+    def run_pipeline(self, parse, urls, **kwargs):
+        jobs = []
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            stats = ScrapePipeline(FakeFetcher(), parse, **kwargs).run(urls, jobs.append)
+        return sorted(jobs, key=str), stats, out.getvalue()
+
+    def test_parse_errors_are_reported(self):
+        jobs, stats, out = self.run_pipeline(parse_page, ['a', 'bad', 'c'], workers=0)
+        self.assertEqual(jobs, ['A', 'C'])
+        self.assertEqual((stats['pages_parsed'], stats['pages_failed']), (2, 1))
+        self.assertIn("Couldn't parse bad", out)
+
+    def test_broken_pool_falls_back_in_process(self):
+        pool = ParsePool(2)
+        self.addCleanup(pool.shutdown)
+        jobs, stats, out = self.run_pipeline(parse_page_or_die, ['a', 'b', 'c', 'd'], pool=pool)
+        self.assertEqual(jobs, ['A', 'B', 'C', 'D'])
+        self.assertEqual(stats['pages_failed'], 0)
+        self.assertEqual(out.count('Parser processes failed'), 1)
+        self.assertIsNone(pool.executor)   # a fresh pool starts on the next run
+
+    def test_pool_is_reused_across_runs(self):
+        pool = ParsePool(1)
+        self.addCleanup(pool.shutdown)
+        first, _, _ = self.run_pipeline(parse_page_with_pid, ['a'], pool=pool)
+        executor = pool.executor
+        second, _, _ = self.run_pipeline(parse_page_with_pid, ['b'], pool=pool)
+        self.assertIs(pool.executor, executor)
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, [os.getpid()])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+"""
+Rate limiter tests
+Token bucket pacing around a server-requested pause (Retry-After), on a
+fake clock
+
+Run: python -m pytest tests   (or python -m unittest discover tests)
+"""
+
+import unittest
+from unittest import mock
+
+from rate_limiter import TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class TokenBucketTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch.multiple('rate_limiter.time', monotonic=self.clock.monotonic, sleep=self.clock.sleep)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def send_times(self, bucket, count):
+        times = []
+        for _ in range(count):
+            bucket.acquire()
+            times.append(self.clock.now)
+        return times
+
+    def test_burst_then_rate(self):
+        bucket = TokenBucket(2.0, 4)
+        self.assertEqual(self.send_times(bucket, 6), [0.0, 0.0, 0.0, 0.0, 0.5, 1.0])
+
+    def test_no_burst_when_a_pause_lifts(self):
+        bucket = TokenBucket(2.0, 4)
+        self.send_times(bucket, 1)
+        bucket.pause(3.0)   # Retry-After: 3
+        # Back at the configured rate once the pause is over - not a full burst
+        self.assertEqual(self.send_times(bucket, 3), [3.5, 4.0, 4.5])
+
+    def test_pauses_only_extend(self):
+        bucket = TokenBucket(2.0, 4)
+        bucket.pause(3.0)
+        bucket.pause(1.0)
+        self.assertEqual(self.send_times(bucket, 1), [3.5])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,195 @@
+"""
+Output sink tests
+Sheet sync against the in-memory fake sheet (history, hand-added rows, a
+first sync that never happened, a lost position, one read per sync), the CSV sink's own
+position, and store commits while sources are quiet
+
+Run: python -m pytest tests   (or python -m unittest discover tests)
+"""
+
+import contextlib
+import csv
+import io
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+from datetime import date
+
+from job_posting import SHEET_HEADERS, JobPosting
+from sinks import CSVSink
+from sources import JobSource, run_sources
+from tests import fake_sheets
+from tests.helpers import make_scraper
+
+
+def make_job(tag, i):
+    return JobPosting(company=f'{tag} Co {i}', role=f'SDET {i}', description=f'{tag} posting {i}',
+                      location='Pune', apply_link=f'https://jobs.example/{tag}/{i}', platform='Test',
+                      posted=date(2026, 10, 1))
+
+
+class WorkdirTestCase(unittest.TestCase):
+    def setUp(self):
+        self.workdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.workdir, ignore_errors=True)
+
+
+class SheetSyncTest(WorkdirTestCase):
+    def setUp(self):
+        super().setUp()
+        self.client = fake_sheets.FakeClient()
+        self.worksheet = self.client.spreadsheet.add_worksheet('Jobs List', 200, 20)
+        self.worksheet._set('A3', [SHEET_HEADERS])
+
+    def scraper(self):
+        scraper = make_scraper(self.workdir)
+        fake_sheets.install(scraper, self.client)
+        scraper.limiter.limits['sheets'] = (1e9, 1e9)
+        return scraper
+
+    def sheet(self):
+        """(Serial_No, Company) of every job row"""
+        return [(row[0], row[1]) for row in self.worksheet.get('A4:M') if row]
+
+    def test_store_and_sheet_serials_never_collide(self):
+        # Sheet history 1-5; the first run never reached the sheet, so the store numbered its jobs 1-3
+        self.worksheet._set('A4', [make_job('history', i).to_row(i) for i in range(1, 6)])
+        scraper = self.scraper()
+        with contextlib.redirect_stdout(io.StringIO()):
+            scraper.store_jobs([make_job('scraped', i) for i in range(1, 4)])
+        self.assertEqual(sorted(scraper.store.serials()), [1, 2, 3])
+        # ...and a row is added to the sheet by hand
+        self.worksheet._set('A9', [make_job('manual', 1).to_row(6)])
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertTrue(scraper.sync_sinks(['sheet']))
+
+        companies = [f'history Co {i}' for i in range(1, 6)] + ['manual Co 1'] + [f'scraped Co {i}' for i in range(1, 4)]
+        self.assertEqual(self.sheet(), [(str(i), company) for i, company in enumerate(companies, 1)])
+        self.assertEqual(sorted(job.company for _, job in scraper.store.postings()), sorted(companies))
+
+    def test_export_continues_from_the_pulls_read(self):
+        scraper = self.scraper()
+        with contextlib.redirect_stdout(io.StringIO()):
+            scraper.store_jobs([make_job('scraped', i) for i in range(1, 4)])
+            scraper.sync_sinks(['sheet'])
+            scraper.store_jobs([make_job('scraped', i) for i in range(4, 6)])
+            with mock.patch.object(self.worksheet, 'get', wraps=self.worksheet.get) as get:
+                self.assertTrue(scraper.sync_sinks(['sheet']))
+        # One read: the rows after the last pull's anchor (the header - the first sync's rows
+        # are matched up here), and no second read of the Serial_No column
+        self.assertEqual([call.args[0] for call in get.call_args_list], ['A3:M'])
+        self.assertEqual(self.sheet(), [(str(i), f'scraped Co {i}') for i in range(1, 6)])
+
+    def test_lost_position_writes_nothing_twice(self):
+        scraper = self.scraper()
+        with contextlib.redirect_stdout(io.StringIO()):
+            scraper.store_jobs([make_job('scraped', i) for i in range(1, 4)])
+            scraper.sync_sinks(['sheet'])
+            # Killed after the sheet write, before the position was saved
+            os.remove(scraper.sink_state_path)
+            scraper.store_jobs([make_job('scraped', 4)])
+            self.assertTrue(scraper.sync_sinks(['sheet']))
+        self.assertEqual(self.sheet(), [(str(i), f'scraped Co {i}') for i in range(1, 5)])
+
+    def test_sheet_writer_never_writes_the_store(self):
+        scraper = self.scraper()
+        with contextlib.redirect_stdout(io.StringIO()):
+            scraper.store_jobs([make_job('scraped', i) for i in range(1, 4)])
+            scraper.pull_sheet()
+            fanout = scraper.start_sinks(['sheet'])
+            # Hold the store's write lock for the whole export
+            blocker = sqlite3.connect(scraper.store.path)
+            blocker.execute('BEGIN IMMEDIATE')
+            try:
+                status = fanout.close(timeout=10)
+            finally:
+                blocker.rollback()
+                blocker.close()
+        self.assertEqual(status['sheet']['behind'], 0)
+        self.assertIsNone(status['sheet']['error'])
+        self.assertEqual(len(self.sheet()), 3)
+
+
+class CSVSinkTest(WorkdirTestCase):
+    def row(self, serial):
+        # Quoted newlines and quotes, like real descriptions
+        return [serial, f'Co {serial}', 'SDET', 'Line one\r\nline "two", and\nthree'] + [''] * 9
+
+    def test_position_comes_from_the_file(self):
+        path = os.path.join(self.workdir, 'jobs.csv')
+        sink = CSVSink(None, path)
+        self.assertEqual(sink.open(None, 0), 0)
+        sink.write([self.row(1), self.row(2)])
+        sink.close()
+        size = os.path.getsize(path)
+
+        # Killed mid-write (the third record is cut inside its quoted description),
+        # and the recorded position was never saved
+        record = io.StringIO()
+        csv.writer(record).writerow(self.row(3))
+        with open(path, 'ab') as f:
+            f.write(record.getvalue().encode('utf-8')[:30])
+
+        sink = CSVSink(None, path)
+        self.assertEqual(sink.open(None, 0), 2)
+        sink.close()
+        self.assertEqual(os.path.getsize(path), size)
+        with open(path, newline='', encoding='utf-8') as f:
+            self.assertEqual([row[0] for row in csv.reader(f)], ['Serial_No', '1', '2'])
+
+
+class QuietSource(JobSource):
+    """Two jobs, then a long pause before the last one"""
+    name = 'quiet'
+    timeout = 30
+
+    def __init__(self, scraper, pause):
+        super().__init__(scraper)
+        self.pause = pause
+
+    def fetch(self, emit):
+        emit(make_job('early', 1))
+        emit(make_job('early', 2))
+        time.sleep(self.pause)
+        emit(make_job('late', 1))
+
+
+class TimedCommitTest(WorkdirTestCase):
+    def test_commits_while_sources_are_quiet(self):
+        scraper = make_scraper(self.workdir)
+        seen = {}
+
+        def probe():
+            # Well past FLUSH_SECONDS, while the source is still paused
+            time.sleep(2.5)
+            db = sqlite3.connect(scraper.store.path, timeout=0.5)
+            try:
+                seen['committed'] = db.execute('SELECT COUNT(*) FROM jobs').fetchone()[0]
+                db.execute('BEGIN IMMEDIATE')
+                db.rollback()
+                seen['lock'] = 'free'
+            except sqlite3.OperationalError as e:
+                seen['lock'] = str(e)
+            finally:
+                db.close()
+
+        thread = threading.Thread(target=probe)
+        with mock.patch('scrape_jobs.FLUSH_SECONDS', 1.0), \
+                contextlib.redirect_stdout(io.StringIO()):
+            thread.start()
+            scraper.store_jobs(run_sources([QuietSource(scraper, pause=4)], tick=0.2))
+        thread.join()
+        self.assertEqual(seen, {'committed': 2, 'lock': 'free'})
+        self.assertEqual(scraper.store.count(), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
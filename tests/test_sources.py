@@ -0,0 +1,375 @@
+"""
+Job source tests
+run_sources() fan-out (timeouts, budgets, early close) and the Greenhouse /
+Lever JSON boards, fetched from a local fixture server (no network)
+
+IndeedSource's incremental crawl runs against a simulated result list
+
+Run: python -m pytest tests   (or python -m unittest discover tests)
+"""
+
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from datetime import date
+from types import SimpleNamespace
+from unittest import mock
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+
+from crawl_state import CrawlState
+from fetch_engine import AsyncFetchEngine
+from indeed import search_url
+from job_posting import JobPosting
+from run_journal import RunJournal
+from sources import GreenhouseSource, IndeedSource, JobSource, LeverSource, run_sources
+from transport import create_session
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+class FixtureServer(ThreadingHTTPServer):
+    """Serves tests/fixtures files under /fixtures/<name>; /slow?delay=S answers after S seconds"""
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), FixtureHandler)
+        self.paths = []
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    def url(self, path):
+        return f'http://127.0.0.1:{self.server_port}{path}'
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        url = urlsplit(self.path)
+        self.server.paths.append(self.path)
+        if url.path == '/slow':
+            time.sleep(float(parse_qs(url.query).get('delay', ['1'])[0]))
+            body = b'{}'
+        elif url.path.startswith('/fixtures/'):
+            path = os.path.join(FIXTURES, os.path.basename(url.path))
+            if not os.path.exists(path):
+                self.send_error(404)
+                return
+            with open(path, 'rb') as f:
+                body = f.read()
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class StubScraper:
+    """The parts of EnhancedJobScraper a source uses: fetcher and journal"""
+
+    def __init__(self, workdir):
+        self.fetcher = AsyncFetchEngine(create_session(cache_path=None, dns_ttl=0), concurrency=4)
+        self.journal = RunJournal(os.path.join(workdir, 'run_journal.jsonl'))
+
+
+def make_job(i):
+    return JobPosting(company=f'Company {i}', role=f'QA Engineer {i}', description=f'Posting {i}',
+                      posted=date(2026, 10, 1))
+
+
+class ListSource(JobSource):
+    """Emits prepared jobs, `delay` seconds apart; records what emit() returned"""
+
+    def __init__(self, scraper, name, jobs, delay=0.0, **kwargs):
+        self.name = name
+        super().__init__(scraper, **kwargs)
+        self.jobs = jobs
+        self.delay = delay
+        self.replies = []
+        self.finished = threading.Event()
+
+    def fetch(self, emit):
+        try:
+            for job in self.jobs:
+                if self.delay:
+                    time.sleep(self.delay)
+                reply = emit(job)
+                self.replies.append(reply)
+                if reply is False:
+                    return
+        finally:
+            self.finished.set()
+
+
+class SlowBoardSource(JobSource):
+    """One job, then a request the fixture server answers late, then another job"""
+    name = 'slow_board'
+
+    def __init__(self, scraper, server, delay, **kwargs):
+        super().__init__(scraper, **kwargs)
+        self.server = server
+        self.delay = delay
+        self.replies = []
+        self.finished = threading.Event()
+
+    def fetch(self, emit):
+        try:
+            self.replies.append(emit(make_job(1)))
+            requests.get(self.server.url(f'/slow?delay={self.delay}'), timeout=10)
+            self.replies.append(emit(make_job(2)))
+        finally:
+            self.finished.set()
+
+
+class LocalGreenhouse(GreenhouseSource):
+    def __init__(self, scraper, server, boards):
+        super().__init__(scraper)
+        self.server = server
+        self.boards = boards
+
+    def board_url(self, board):
+        # Same query string as the real API; the board name picks the fixture file
+        return self.server.url(f'/fixtures/{board}.json?content=true')
+
+
+class LocalLever(LeverSource):
+    def __init__(self, scraper, server, boards):
+        super().__init__(scraper)
+        self.server = server
+        self.boards = boards
+
+    def board_url(self, board):
+        return self.server.url(f'/fixtures/{board}.json?mode=json')
+
+
+class SourceTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = FixtureServer()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.workdir = tempfile.mkdtemp()
+        self.scraper = StubScraper(self.workdir)
+
+    def tearDown(self):
+        shutil.rmtree(self.workdir, ignore_errors=True)
+
+
+class RunSourcesTest(SourceTestCase):
+    def test_merges_all_sources(self):
+        a = ListSource(self.scraper, 'a', [make_job(i) for i in range(5)])
+        b = ListSource(self.scraper, 'b', [make_job(i) for i in range(5, 8)])
+        roles = sorted(job.role for job in run_sources([a, b]))
+        self.assertEqual(roles, sorted(f'QA Engineer {i}' for i in range(8)))
+
+    def test_budget_stops_a_source(self):
+        source = ListSource(self.scraper, 'budget', [make_job(i) for i in range(10)], max_jobs=3)
+        jobs = list(run_sources([source]))
+        self.assertEqual(len(jobs), 3)
+        # The emit() that used up the budget already says stop
+        self.assertEqual(source.replies, [True, True, False])
+
+    def test_timeout_cuts_off_a_slow_source(self):
+        slow = SlowBoardSource(self.scraper, self.server, delay=1.5, timeout=0.5)
+        fast = ListSource(self.scraper, 'fast', [make_job(i) for i in range(10, 13)])
+        start = time.monotonic()
+        jobs = list(run_sources([slow, fast]))
+        elapsed = time.monotonic() - start
+
+        self.assertLess(elapsed, 1.4, "run_sources waited for the slow request instead of its deadline")
+        self.assertEqual(sorted(job.role for job in jobs),
+                         ['QA Engineer 1', 'QA Engineer 10', 'QA Engineer 11', 'QA Engineer 12'])
+        # The late job is refused, not delivered
+        self.assertTrue(slow.finished.wait(5))
+        self.assertEqual(slow.replies, [True, False])
+
+    def test_close_cuts_off_every_source(self):
+        source = ListSource(self.scraper, 'endless', [make_job(i) for i in range(1000)], delay=0.01)
+        stream = run_sources([source])
+        first = [next(stream) for _ in range(3)]
+        stream.close()
+
+        self.assertEqual(len(first), 3)
+        self.assertTrue(source.finished.wait(5), "source kept running after close()")
+        self.assertIs(source.replies[-1], False)
+        self.assertLess(len(source.replies), 1000)
+
+    def test_failing_source_does_not_stop_the_others(self):
+        class Broken(JobSource):
+            name = 'broken'
+
+            def fetch(self, emit):
+                raise RuntimeError('board is down')
+
+        ok = ListSource(self.scraper, 'ok', [make_job(i) for i in range(2)])
+        self.assertEqual(len(list(run_sources([Broken(self.scraper), ok]))), 2)
+
+
+class JSONBoardTest(SourceTestCase):
+    def collect(self, source):
+        jobs = []
+        source.fetch(lambda job: jobs.append(job) is None)
+        return jobs
+
+    def test_greenhouse_board(self):
+        jobs = self.collect(LocalGreenhouse(self.scraper, self.server, ['greenhouse_jobs']))
+
+        # Only QA titles; the backend role is skipped
+        self.assertEqual([job.role for job in jobs], ['Senior SDET - Payments', 'QA Automation Engineer'])
+        sdet, qa = jobs
+        self.assertEqual(sdet.company, 'Greenhouse_Jobs')
+        self.assertEqual(sdet.platform, 'Greenhouse')
+        self.assertEqual(sdet.location, 'Bengaluru, India')
+        self.assertEqual(sdet.apply_link, 'https://boards.greenhouse.io/acme-pay/jobs/4012001')
+        self.assertEqual(sdet.date_posted, '14-10-2026')
+        # Escaped HTML is decoded and stripped, whitespace collapsed
+        self.assertTrue(sdet.description.startswith('Build Selenium and API test suites in Python.'))
+        self.assertIn('Selenium', sdet.skills)
+        self.assertIn('qa-hiring@acmepay.com', str(sdet.hr_contact))
+
+        # Missing fields fall back instead of failing the board
+        self.assertEqual(qa.location, 'Location Not Specified')
+        self.assertEqual(qa.apply_link, 'LINK_NOT_AVAILABLE')
+        self.assertEqual(qa.description, '')
+        self.assertEqual(qa.posted, date.today().toordinal())
+
+    def test_lever_board(self):
+        jobs = self.collect(LocalLever(self.scraper, self.server, ['lever_postings']))
+
+        self.assertEqual([job.role for job in jobs], ['Test Automation Lead', 'Quality Engineer'])
+        lead, quality = jobs
+        self.assertEqual(lead.platform, 'Lever')
+        self.assertEqual(lead.location, 'Pune')
+        self.assertEqual(lead.apply_link, 'https://jobs.lever.co/widgetco/7f1c2b')
+        self.assertEqual(lead.date_posted, '12-10-2026')
+        self.assertIn('Playwright', lead.skills)
+        self.assertEqual(quality.location, 'Location Not Specified')
+        self.assertEqual(quality.posted, date.today().toordinal())
+
+    def test_boards_are_fetched_concurrently_and_bad_boards_skipped(self):
+        source = LocalGreenhouse(self.scraper, self.server, ['missing_board', 'greenhouse_jobs'])
+        jobs = self.collect(source)
+        self.assertEqual(len(jobs), 2)
+        requested = [path for path in self.server.paths if path.startswith('/fixtures/')]
+        self.assertIn('/fixtures/missing_board.json?content=true', requested)
+        self.assertIn('/fixtures/greenhouse_jobs.json?content=true', requested)
+
+    def test_emit_false_stops_the_board(self):
+        source = LocalLever(self.scraper, self.server, ['lever_postings'])
+        jobs = []
+
+        def emit(job):
+            jobs.append(job)
+            return False
+
+        source.fetch(emit)
+        self.assertEqual(len(jobs), 1)
+
+    def test_disabled_without_boards(self):
+        self.assertFalse(GreenhouseSource(self.scraper).enabled)
+        self.assertFalse(LeverSource(self.scraper).enabled)
+
+
+class FakeIndeedPipeline:
+    """Stands in for ScrapePipeline: serves `site` (url -> jobs) page by page, in crawl order"""
+    site = {}
+    fetched = []
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def run(self, urls, sink, crawl=None):
+        queue = list(urls)
+        stats = {'pages_fetched': 0, 'jobs': 0}
+        while queue:
+            url = queue.pop(0)
+            FakeIndeedPipeline.fetched.append(url)
+            stats['pages_fetched'] += 1
+            jobs, next_urls = crawl(url, list(self.site.get(url, [])))
+            queue.extend(next_urls)
+            for job in jobs:
+                stats['jobs'] += 1
+                if sink(job) is False:
+                    return stats
+        return stats
+
+
+class IndeedCrawlTest(unittest.TestCase):
+    PER_PAGE = 3
+
+    def setUp(self):
+        self.workdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.workdir, True)
+        self.scraper = SimpleNamespace(crawl_state=CrawlState(os.path.join(self.workdir, 'crawl_state.json')),
+                                       journal=RunJournal(os.path.join(self.workdir, 'run_journal.jsonl')),
+                                       fetcher=SimpleNamespace(concurrency=1), parse_workers=0,
+                                       parser_backend='auto', parse_pool=None)
+        patcher = mock.patch('sources.ScrapePipeline', FakeIndeedPipeline)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def publish(self, keys):
+        """The search results, newest first"""
+        jobs = [JobPosting(company=f'Co {key}', role='SDET', description=f'Posting {key}',
+                           apply_link=f'https://in.indeed.com/viewjob?jk={key}') for key in keys]
+        FakeIndeedPipeline.site = {search_url('sdet', 'bangalore', page): jobs[i:i + self.PER_PAGE]
+                                   for page, i in enumerate(range(0, len(jobs), self.PER_PAGE))}
+
+    def crawl(self, budget=None):
+        """One run: keys emitted (all committed, like a successful store flush), pages fetched"""
+        FakeIndeedPipeline.fetched = []
+        source = IndeedSource(self.scraper, keywords=['sdet'], locations=['bangalore'], max_pages=5)
+        jobs = []
+
+        def emit(job):
+            jobs.append(job)
+            return budget is None or len(jobs) < budget
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            source.fetch(emit)
+        source.commit(jobs)
+        return [job.company[3:] for job in jobs], len(FakeIndeedPipeline.fetched)
+
+    def test_cut_short_crawl_resumes_past_what_it_emitted(self):
+        history = [f'k{i}' for i in range(1, 13)]   # 4 pages
+        self.publish(history)
+        self.assertEqual(self.crawl(budget=4), (history[:4], 2))
+
+        # Two new postings on top; the next run still gets everything the first one missed
+        self.publish(['n1', 'n2'] + history)
+        emitted, _ = self.crawl()
+        self.assertEqual(emitted, ['n1', 'n2'] + history[4:])
+
+        # Complete now - the following run stops at the first page
+        self.publish(['n3', 'n1', 'n2'] + history)
+        self.assertEqual(self.crawl(), (['n3'], 1))
+
+    def test_uncommitted_crawl_keeps_the_mark(self):
+        self.publish([f'k{i}' for i in range(1, 7)])
+        self.crawl()
+        self.publish(['n1'] + [f'k{i}' for i in range(1, 7)])
+        source = IndeedSource(self.scraper, keywords=['sdet'], locations=['bangalore'], max_pages=5)
+        with contextlib.redirect_stdout(io.StringIO()):
+            source.fetch(lambda job: True)
+        source.commit([])   # the store flush failed
+        self.assertEqual(self.crawl(), (['n1'], 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
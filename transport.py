@@ -0,0 +1,242 @@
+"""
+Transport
+The one factory for the HTTP session every source shares
+- Per-host connection pools sized to the fetch concurrency; connections are
+  kept alive between pages, so a host costs one TCP / TLS handshake per
+  pooled connection instead of one per request
+- A full pool makes callers wait for a free connection instead of opening
+  a throwaway one
+- Connect failures are retried by urllib3; 429 / 5xx stay with the RateLimiter
+- gzip / deflate (and br / zstd when brotli / zstandard are installed) are
+  requested and decoded transparently
+- The scraper's connections resolve host names through their own DNS cache
+  (DNS_TTL seconds; an answer none of whose addresses connect is dropped);
+  socket.getaddrinfo itself is left alone, so the sheet client and every
+  other library resolve as usual
+- Optional HTTP/2 (one multiplexed connection per host) through httpx,
+  when httpx and h2 are installed
+"""
+
+import importlib.util
+import socket
+import threading
+import time
+
+import requests
+from requests.adapters import DEFAULT_POOLBLOCK, BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+from urllib3.poolmanager import PoolManager
+from urllib3.util.connection import allowed_gai_family
+from urllib3.util.retry import Retry
+
+from http_cache import CachedSession, ResponseCache, DEFAULT_CACHE_PATH
+from metrics import METRICS
+
+DEFAULT_POOL_HOSTS = 16   # hosts whose connection pools are kept open
+DEFAULT_POOL_SIZE = 8     # keep-alive connections per host (the fetch concurrency)
+CONNECT_RETRIES = 2
+DNS_TTL = 60              # seconds (getaddrinfo doesn't report the record's own TTL)
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+    'Accept-Language': 'en-US,en;q=0.9',
+}
+
+
+class DNSCache:
+    """TTL cache in front of socket.getaddrinfo (failed lookups are not cached)"""
+
+    def __init__(self, ttl=DNS_TTL, resolve=socket.getaddrinfo):
+        self.ttl = ttl
+        self.resolve = resolve
+        self.entries = {}
+        self.lock = threading.Lock()
+
+    def getaddrinfo(self, host, port, family=0, type=0):
+        key = (host, port, family, type)
+        now = time.monotonic()
+        with self.lock:
+            entry = self.entries.get(key)
+        if entry and entry[0] > now:
+            METRICS.incr('dns', result='cached')
+            return entry[1]
+
+        result = self.resolve(host, port, family, type)
+        METRICS.incr('dns', result='resolved')
+        with self.lock:
+            self.entries[key] = (now + self.ttl, result)
+        return result
+
+    def forget(self, host):
+        """Drop every answer for `host` - it is looked up again on next use"""
+        with self.lock:
+            for key in [key for key in self.entries if key[0] == host]:
+                del self.entries[key]
+
+
+class CachedDNSConnection:
+    """Connection mixin: resolves through a DNSCache, then connects to each address in turn"""
+
+    def __init__(self, *args, dns_cache=None, **kwargs):
+        self.dns_cache = dns_cache
+        super().__init__(*args, **kwargs)
+
+    def _new_conn(self):
+        host = self._dns_host
+        try:
+            addresses = self.dns_cache.getaddrinfo(host, self.port, allowed_gai_family(), socket.SOCK_STREAM)
+        except socket.gaierror as e:
+            raise NewConnectionError(self, f"Failed to resolve '{host}' ({e})") from e
+        error = None
+        try:
+            for address in dict.fromkeys(info[4][0] for info in addresses):
+                # An address literal: urllib3 connects to it without another lookup
+                self._dns_host = address
+                try:
+                    return super()._new_conn()
+                except (NewConnectionError, ConnectTimeoutError) as e:
+                    error = e
+        finally:
+            self._dns_host = host
+        # Nothing answered - the host may have moved, so don't keep serving this answer
+        self.dns_cache.forget(host)
+        raise error
+
+
+class CachedDNSHTTPConnection(CachedDNSConnection, HTTPConnection):
+    pass
+
+
+class CachedDNSHTTPSConnection(CachedDNSConnection, HTTPSConnection):
+    pass
+
+
+class CachedDNSPoolManager(PoolManager):
+    """PoolManager whose connections share one DNSCache (TLS still checks the host name)"""
+
+    connection_classes = {'http': CachedDNSHTTPConnection, 'https': CachedDNSHTTPSConnection}
+
+    def __init__(self, *args, dns_cache=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.dns_cache = dns_cache
+
+    def _new_pool(self, scheme, host, port, request_context=None):
+        pool = super()._new_pool(scheme, host, port, request_context)
+        pool.ConnectionCls = self.connection_classes[scheme]
+        pool.conn_kw['dns_cache'] = self.dns_cache
+        return pool
+
+
+class KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter with TCP keep-alive probes, so idle pooled connections survive NAT timeouts,
+    and its own DNS cache (dns_cache=None: plain lookups)"""
+
+    def __init__(self, *args, dns_cache=None, **kwargs):
+        self.dns_cache = dns_cache   # before HTTPAdapter.__init__, which builds the pool manager
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=DEFAULT_POOLBLOCK, **pool_kwargs):
+        pool_kwargs['socket_options'] = HTTPConnection.default_socket_options + [
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+        ]
+        if self.dns_cache is None:
+            super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+            return
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = CachedDNSPoolManager(num_pools=connections, maxsize=maxsize, block=block,
+                                                dns_cache=self.dns_cache, **pool_kwargs)
+
+
+def http2_available():
+    return bool(importlib.util.find_spec('httpx') and importlib.util.find_spec('h2'))
+
+
+class HTTPXAdapter(BaseAdapter):
+    """requests adapter that sends through an httpx.Client (HTTP/2 when the server offers it)
+
+    TLS verification is the client's (on); per-request verify / cert / proxies are ignored.
+    """
+
+    def __init__(self, pool_size=DEFAULT_POOL_SIZE, http2=True, retries=CONNECT_RETRIES):
+        import httpx
+        super().__init__()
+        self.httpx = httpx
+        limits = httpx.Limits(max_connections=pool_size * DEFAULT_POOL_HOSTS,
+                              max_keepalive_connections=pool_size * DEFAULT_POOL_HOSTS)
+        # Redirects are left to requests, like with HTTPAdapter
+        self.client = httpx.Client(transport=httpx.HTTPTransport(http2=http2, limits=limits, retries=retries),
+                                   follow_redirects=False)
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        httpx = self.httpx
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            timeout = httpx.Timeout(read, connect=connect)
+        try:
+            r = self.client.request(request.method, request.url, headers=dict(request.headers),
+                                    content=request.body, timeout=timeout)
+        except httpx.TimeoutException as e:
+            raise requests.Timeout(e, request=request)
+        except httpx.TransportError as e:
+            raise requests.ConnectionError(e, request=request)
+        METRICS.incr('http_version', version=r.http_version)
+
+        resp = requests.Response()
+        resp.status_code = r.status_code
+        resp.reason = r.reason_phrase
+        resp.url = str(r.url)
+        resp.headers = CaseInsensitiveDict(r.headers.items())
+        # httpx has already decoded the body
+        resp.headers.pop('Content-Encoding', None)
+        resp.headers.pop('Content-Length', None)
+        resp._content = r.content
+        resp._content_consumed = True
+        resp.encoding = get_encoding_from_headers(resp.headers)
+        resp.request = request
+        resp.connection = self
+        return resp
+
+    def close(self):
+        self.client.close()
+
+
+def create_session(cache_path=DEFAULT_CACHE_PATH, limiter=None, replay=False, pool_size=DEFAULT_POOL_SIZE,
+                   http2=False, dns_ttl=DNS_TTL, headers=None):
+    """Cached, rate-limited, pooled session (cache_path=None: no response cache)"""
+    session = CachedSession(ResponseCache(cache_path) if cache_path else None, limiter=limiter, replay=replay)
+    session.headers.update(DEFAULT_HEADERS if headers is None else headers)
+
+    retries = Retry(total=None, connect=CONNECT_RETRIES, read=0, status=0, other=0, backoff_factor=0.2)
+    pooled = KeepAliveAdapter(pool_connections=DEFAULT_POOL_HOSTS, pool_maxsize=pool_size,
+                              max_retries=retries, pool_block=True,
+                              dns_cache=DNSCache(dns_ttl) if dns_ttl else None)
+    session.mount('http://', pooled)
+    session.mount('https://', pooled)
+
+    if http2:
+        if http2_available():
+            # HTTP/2 is only negotiated over TLS
+            session.mount('https://', HTTPXAdapter(pool_size))
+        else:
+            print("⚠ HTTP/2 needs httpx and h2 (pip install 'httpx[http2]') - using pooled HTTP/1.1")
+    return session
+
+
+def connection_stats(session):
+    """Connections opened / requests sent by the session's HTTP/1.1 pools"""
+    stats = {'connections': 0, 'requests': 0}
+    for adapter in set(session.adapters.values()):
+        manager = getattr(adapter, 'poolmanager', None)
+        if manager is None:
+            continue
+        for key in manager.pools.keys():
+            pool = manager.pools.get(key)
+            if pool is not None:
+                stats['connections'] += pool.num_connections
+                stats['requests'] += pool.num_requests
+    return stats
@@ -1,61 +1,142 @@
 """
-View Jobs in Google Sheet
-Simple script to check current jobs
+View Jobs
+Query the local job store - filter, sort, page, export
+- Runs against data/jobs.sqlite (indexed), never the full sheet
+- --refresh pulls the Google Sheet into the store first
+
+    python view_jobs.py --skill python --location bangalore --since 7d
+    python view_jobs.py --company 'amazon*' --sort company --asc --format csv
 """
 
-import gspread
-from google.oauth2.service_account import Credentials
+import argparse
+import csv
+import json
+import re
+import sys
+from datetime import date, datetime, timedelta
 
-CREDENTIALS_FILE = "credentials.json"
-SCOPES = [
-    'https://www.googleapis.com/auth/spreadsheets',
-    'https://www.googleapis.com/auth/drive'
-]
+from job_store import JobStore, DEFAULT_STORE_PATH, SORT_COLUMNS
+from job_posting import SHEET_HEADERS
+from sheet_export import SHEET_TITLE, pull_sheet_rows
+from sheet_reader import SheetReader
+from sheets_client import SheetsClient, SPREADSHEET_KEY
 
-def main():
+
+RELATIVE_DATE_RE = re.compile(r'^(\d+)([dw])$')
+
+
+def parse_date(value):
+    """'7d' / '2w' (ago), 'today', dd-mm-YYYY or YYYY-MM-DD -> date ordinal"""
+    value = value.strip().lower()
+    if value == 'today':
+        return date.today().toordinal()
+    m = RELATIVE_DATE_RE.match(value)
+    if m:
+        days = int(m.group(1)) * (7 if m.group(2) == 'w' else 1)
+        return (date.today() - timedelta(days=days)).toordinal()
+    for fmt in ('%d-%m-%Y', '%Y-%m-%d'):
+        try:
+            return datetime.strptime(value, fmt).toordinal()
+        except ValueError:
+            pass
+    raise argparse.ArgumentTypeError(f"bad date {value!r} (use 7d, 2w, today, dd-mm-YYYY or YYYY-MM-DD)")
+
+
+def refresh_store(store):
+    """Pull rows appended to the sheet since the last sync into the local store"""
+    sheets = SheetsClient()   # cached token / sheet metadata: no discovery calls
+    spreadsheet = sheets.open(SPREADSHEET_KEY)
+    worksheet = sheets.worksheet(spreadsheet, SHEET_TITLE)
+    if worksheet is None:
+        raise LookupError(f"no '{SHEET_TITLE}' tab in the spreadsheet")
+    reader = SheetReader(worksheet)
+    before = store.count()
+    try:
+        pull_sheet_rows(store, reader, spreadsheet.id)
+    except Exception:
+        sheets.invalidate()   # maybe stale metadata - the next refresh rediscovers
+        raise
+    print(f"✓ Refreshed from sheet: {store.count() - before} new jobs, {store.count()} in store "
+          f"({reader.cells_read} cells read)", file=sys.stderr)
+
+
+def print_text(results, total, offset):
     print("╔═══════════════════════════════════════════════════════════════╗")
     print("║              CURRENT JOB LISTINGS                               ║")
     print("╚═══════════════════════════════════════════════════════════════╝\n")
-    
+    print(f"📊 Matching Jobs: {total}\n")
+    print("="*90 + "\n")
+
+    for serial, job in results:
+        print(f"Job #{serial}")
+        print(f"  Company: {job.company}")
+        print(f"  Role: {job.role}")
+        print(f"  Skills: {job.skills}")
+        print(f"  Location: {job.location}")
+        print(f"  Posted: {job.date_posted}")
+        print(f"  Source: {job.platform}")
+        if job.hr_contact:
+            print(f"  HR Contact: {job.hr_contact}")
+        print(f"  Apply: {job.apply_link}")
+        print("-" * 90)
+
+    if results:
+        print(f"\n✅ Showing {offset + 1}-{offset + len(results)} of {total} jobs")
+    else:
+        print("❌ No matching jobs")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query scraped jobs from the local store")
+    parser.add_argument('--company', help="Company name ('name*' for a prefix)")
+    parser.add_argument('--role', help="Words in the job role ('word*' for a prefix)")
+    parser.add_argument('--skill', help="Words in the required skills ('word*' for a prefix)")
+    parser.add_argument('--location', help="Words in the location ('word*' for a prefix)")
+    parser.add_argument('--source', help="Words in the source platform ('word*' for a prefix)")
+    parser.add_argument('--since', type=parse_date, help="Posted on/after (7d, 2w, today, dd-mm-YYYY)")
+    parser.add_argument('--until', type=parse_date, help="Posted on/before")
+    parser.add_argument('--sort', choices=list(SORT_COLUMNS), default='posted')
+    order = parser.add_mutually_exclusive_group()
+    order.add_argument('--asc', dest='descending', action='store_false', help="Ascending order")
+    order.add_argument('--desc', dest='descending', action='store_true', help="Descending order (default)")
+    parser.set_defaults(descending=True)
+    parser.add_argument('--limit', type=int, default=20, help="Jobs per page (0 = all)")
+    parser.add_argument('--offset', type=int, default=0)
+    parser.add_argument('--format', choices=['text', 'json', 'csv'], default='text')
+    parser.add_argument('--store', default=DEFAULT_STORE_PATH, help="Path to the job store")
+    parser.add_argument('--refresh', action='store_true', help="Pull the Google Sheet into the store first")
+    args = parser.parse_args()
+
+    store = JobStore(args.store)
+    if args.refresh:
+        try:
+            refresh_store(store)
+        except Exception as e:
+            print(f"❌ Refresh failed: {str(e)}", file=sys.stderr)
+            return 1
+
     try:
-        creds = Credentials.from_service_account_file(CREDENTIALS_FILE, scopes=SCOPES)
-        client = gspread.authorize(creds)
-        spreadsheet = client.open_by_key('1YseZkMMiCjBShPHHg9awAlsXdRvEjT_TBZ9fNp_HCEE')
-        worksheet = spreadsheet.worksheet('Jobs List')
-        
-        all_values = worksheet.get_all_values()
-        
-        if len(all_values) < 4:
-            print("❌ No jobs found in sheet!")
-            return
-        
-        print(f"📅 {all_values[0][0]}")
-        print(f"📊 Total Jobs: {len(all_values) - 3}\n")
-        print("="*90 + "\n")
-        
-        # Show jobs
-        for idx, row in enumerate(all_values[3:], start=4):
-            if not row[0]:
-                break
-            
-            print(f"Job #{idx-3}")
-            print(f"  Company: {row[1]}")
-            print(f"  Role: {row[2]}")
-            print(f"  Skills: {row[4]}")
-            print(f"  Location: {row[6]}")
-            print(f"  Posted: {row[10]}")
-            if len(row) > 12 and row[12]:
-                print(f"  HR Contact: {row[12]}")
-            print(f"  Apply: {row[9]}")
-            print("-" * 90)
-        
-        print(f"\n✅ Found {len([r for r in all_values[3:] if r[0]])} jobs")
-        print(f"\n🔗 View full sheet:")
-        print(f"   https://docs.google.com/spreadsheets/d/1YseZkMMiCjBShPHHg9awAlsXdRvEjT_TBZ9fNp_HCEE")
-        
-    except Exception as e:
-        print(f"❌ Error: {str(e)}")
+        results, total = store.query(company=args.company, role=args.role, skill=args.skill,
+                                     location=args.location, source=args.source,
+                                     since=args.since, until=args.until,
+                                     sort=args.sort, descending=args.descending,
+                                     limit=args.limit or None, offset=args.offset)
+    except ValueError as e:
+        parser.error(str(e))
 
-if __name__ == "__main__":
-    main()
+    if args.format == 'json':
+        json.dump({'total': total, 'offset': args.offset,
+                   'jobs': [dict(zip(SHEET_HEADERS, job.to_row(serial))) for serial, job in results]},
+                  sys.stdout, indent=2, ensure_ascii=False)
+        print()
+    elif args.format == 'csv':
+        writer = csv.writer(sys.stdout)
+        writer.writerow(SHEET_HEADERS)
+        writer.writerows(job.to_row(serial) for serial, job in results)
+    else:
+        print_text(results, total, args.offset)
+    return 0
 
+
+if __name__ == "__main__":
+    sys.exit(main())